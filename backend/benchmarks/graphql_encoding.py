@@ -0,0 +1,98 @@
+"""Compare stdlib json and msgspec encoding of a 100-edge `users` response.
+
+Run with `task bench -- graphql_encoding.py`.
+"""
+
+import argparse
+import json
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import msgspec
+from rich.console import Console
+from rich.table import Table
+from strawberry.relay.utils import to_base64
+
+PAGE_SIZE = 100
+
+
+def _users_response() -> dict[str, object]:
+    """A response shaped like `users(first: 100)` selecting every user field."""
+    edges = [
+        {
+            "cursor": "eyJ2IjoxLCJjb250ZXh0X2hhc2giOiI" + "x" * 120 + f".{i}",
+            "node": {
+                "id": to_base64("UserType", i),
+                "firstName": f"First{i}",
+                "lastName": f"Last{i}",
+                "email": f"user{i}@example.com",
+            },
+        }
+        for i in range(PAGE_SIZE)
+    ]
+    return {
+        "data": {
+            "users": {
+                "edges": edges,
+                "pageInfo": {
+                    "hasNextPage": True,
+                    "hasPreviousPage": False,
+                    "startCursor": edges[0]["cursor"],
+                    "endCursor": edges[-1]["cursor"],
+                },
+            }
+        }
+    }
+
+
+def _stdlib(data: object) -> bytes:
+    # Strawberry's default encode_json returns a str that Litestar then encodes.
+    return json.dumps(data).encode("utf-8")
+
+
+def _measure(
+    encode: Callable[[object], bytes], data: object, iterations: int
+) -> tuple[list[float], int]:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        encode(data)
+        samples.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    encode(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return samples, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    data = _users_response()
+    table = Table(title=f"{PAGE_SIZE}-edge users response, {args.iterations} runs")
+    table.add_column("Encoder")
+    table.add_column("Median (µs)", justify="right")
+    table.add_column("Peak allocation (KiB)", justify="right")
+    table.add_column("Size (bytes)", justify="right")
+    encoders: dict[str, Callable[[object], bytes]] = {
+        "json.dumps + encode": _stdlib,
+        "msgspec.json.encode": msgspec.json.encode,
+    }
+    for name, encode in encoders.items():
+        samples, peak = _measure(encode, data, args.iterations)
+        table.add_row(
+            name,
+            f"{statistics.median(samples) * 1_000_000:.1f}",
+            f"{peak / 1024:.1f}",
+            str(len(encode(data))),
+        )
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
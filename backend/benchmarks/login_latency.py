@@ -0,0 +1,107 @@
+"""Login latency under concurrent load, argon2 inline vs on the hashing pool.
+
+Each simulated client verifies a password in a loop, as `authenticate_for_login`
+does, while a probe measures how long a trivial request waits for the event
+loop. Run with `task bench -- login_latency.py`.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+from argon2 import PasswordHasher
+from rich.console import Console
+from rich.table import Table
+
+from backend.auth.passwords import PasswordHashingPool
+
+type Verify = Callable[[str, str], Awaitable[bool]]
+
+
+def _percentile(samples: list[float], percentile: int) -> float:
+    return statistics.quantiles(samples, n=100)[percentile - 1]
+
+
+async def _run(
+    verify: Verify, password_hash: str, clients: int, logins: int
+) -> tuple[list[float], list[float]]:
+    login_samples: list[float] = []
+    probe_samples: list[float] = []
+    done = asyncio.Event()
+
+    async def client() -> None:
+        for _ in range(logins):
+            started = time.perf_counter()
+            await verify(password_hash, "correct horse battery staple")
+            login_samples.append(time.perf_counter() - started)
+
+    async def probe() -> None:
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(0)
+            probe_samples.append(time.perf_counter() - started)
+            await asyncio.sleep(0.005)
+
+    probe_task = asyncio.create_task(probe())
+    await asyncio.gather(*(client() for _ in range(clients)))
+    done.set()
+    await probe_task
+    return login_samples, probe_samples
+
+
+async def _benchmark(clients: int, logins: int, workers: int) -> Table:
+    hasher = PasswordHasher()
+    password_hash = hasher.hash("correct horse battery staple")
+
+    async def inline(password_hash: str, password: str) -> bool:
+        return hasher.verify(password_hash, password)
+
+    pool = PasswordHashingPool(hasher, workers=workers, max_pending=clients)
+    strategies: dict[str, Verify] = {
+        "inline (event loop)": inline,
+        f"pool ({workers} threads)": pool.verify,
+    }
+
+    table = Table(title=f"{clients} clients x {logins} logins")
+    table.add_column("Strategy")
+    table.add_column("Login p50 (ms)", justify="right")
+    table.add_column("Login p99 (ms)", justify="right")
+    table.add_column("Loop lag p99 (ms)", justify="right")
+    table.add_column("Logins/s", justify="right")
+    for name, verify in strategies.items():
+        started = time.perf_counter()
+        login_samples, probe_samples = await _run(
+            verify, password_hash, clients, logins
+        )
+        elapsed = time.perf_counter() - started
+        lag = (
+            f"{_percentile(probe_samples, 99) * 1000:.1f}"
+            if len(probe_samples) > 1
+            else "-"
+        )
+        table.add_row(
+            name,
+            f"{_percentile(login_samples, 50) * 1000:.1f}",
+            f"{_percentile(login_samples, 99) * 1000:.1f}",
+            lag,
+            f"{len(login_samples) / elapsed:.0f}",
+        )
+    pool.shutdown()
+    return table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--logins", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    table = asyncio.run(_benchmark(args.clients, args.logins, args.workers))
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
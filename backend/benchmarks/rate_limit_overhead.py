@@ -0,0 +1,150 @@
+"""Per-request overhead of rate limiting: stacked configs vs one middleware.
+
+"Stacked" is the previous setup of one Litestar `RateLimitConfig` per caller
+class, each checking exclusions and keeping its own history in the store.
+Requests go straight to the ASGI app, with limits high enough to never reject.
+Run with `task bench -- rate_limit_overhead.py`.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from litestar import Litestar, Request, get
+from litestar.middleware import DefineMiddleware
+from litestar.middleware.rate_limit import RateLimitConfig, get_remote_address
+from litestar.types import (
+    HTTPRequestEvent,
+    Message,
+    Middleware,
+    ReceiveMessage,
+    Scope,
+)
+from rich.console import Console
+from rich.table import Table
+
+from backend.auth.jwt import jwt_auth
+from backend.auth.tokens import bearer_token
+from backend.middleware.rate_limit import RateLimitMiddleware, RateLimitPolicy
+
+LIMIT = 10**9
+EXCLUDED_PATHS = {"/health", "/metrics", "/schema", "/admin"}
+
+
+@get("/ping", sync_to_thread=False)
+def ping() -> str:
+    return "pong"
+
+
+def _subject(request: Request) -> str | None:
+    token = bearer_token(request)
+    return token.sub if token is not None and token.sub else None
+
+
+def _is_excluded(request: Request) -> bool:
+    if "session" in request.scope and "admin_user_id" in request.session:
+        return True
+    return any(request.url.path.startswith(path) for path in EXCLUDED_PATHS)
+
+
+def _stacked() -> list[Middleware]:
+    anonymous = RateLimitConfig(
+        rate_limit=("minute", LIMIT),
+        check_throttle_handler=lambda r: not _is_excluded(r) and not _subject(r),
+        identifier_for_request=get_remote_address,
+    )
+    authenticated = RateLimitConfig(
+        rate_limit=("minute", LIMIT),
+        check_throttle_handler=lambda r: not _is_excluded(r) and bool(_subject(r)),
+        identifier_for_request=lambda r: f"user:{_subject(r)}",
+    )
+    return [anonymous.middleware, authenticated.middleware]
+
+
+def _combined() -> list[Middleware]:
+    policy = RateLimitPolicy(anonymous_limit=LIMIT, authenticated_limit=LIMIT)
+    return [DefineMiddleware(RateLimitMiddleware, policy=policy)]
+
+
+def _scope(headers: list[tuple[bytes, bytes]]) -> Scope:
+    return {  # type: ignore[return-value]
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench"), *headers],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+        "state": {},
+    }
+
+
+async def _measure(
+    app: Litestar, headers: list[tuple[bytes, bytes]], requests: int
+) -> list[float]:
+    async def receive() -> ReceiveMessage:
+        message: HTTPRequestEvent = {
+            "type": "http.request",
+            "body": b"",
+            "more_body": False,
+        }
+        return message
+
+    async def send(message: Message) -> None:
+        pass
+
+    samples = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        await app(_scope(headers), receive, send)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def _benchmark(requests: int) -> Table:
+    token = jwt_auth.create_token(identifier="1")
+    callers: dict[str, list[tuple[bytes, bytes]]] = {
+        "anonymous": [],
+        "authenticated": [(b"authorization", f"Bearer {token}".encode())],
+    }
+    stacks: dict[str, list[Middleware]] = {
+        "none": [],
+        "stacked configs": _stacked(),
+        "single middleware": _combined(),
+    }
+
+    table = Table(title=f"GET /ping, {requests} requests")
+    table.add_column("Caller")
+    table.add_column("Rate limiting")
+    table.add_column("Median (µs)", justify="right")
+    table.add_column("Overhead (µs)", justify="right")
+    for caller, headers in callers.items():
+        baseline = None
+        for name, middleware in stacks.items():
+            app = Litestar(route_handlers=[ping], middleware=middleware)
+            median = statistics.median(await _measure(app, headers, requests))
+            baseline = median if baseline is None else baseline
+            table.add_row(
+                caller,
+                name,
+                f"{median * 1_000_000:.1f}",
+                f"{(median - baseline) * 1_000_000:.1f}",
+            )
+    return table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+    Console().print(asyncio.run(_benchmark(args.requests)))
+
+
+if __name__ == "__main__":
+    main()
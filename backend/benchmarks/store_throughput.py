@@ -0,0 +1,150 @@
+"""Store and rate limiter speed: in-process, shared memory and Redis.
+
+Measures median `set`, `get` and rate limit decision latency in one process,
+then aggregate decisions per second with several worker processes sharing
+one store (each in-process store is private to its worker, so its limits are
+not shared). Redis rows need `--redis-url`; shared memory files go in
+`--directory`, or the system temporary directory.
+Run with `task bench -- store_throughput.py`.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import statistics
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from multiprocessing.queues import Queue
+from pathlib import Path
+
+from litestar.stores.base import Store
+from litestar.stores.memory import MemoryStore
+from litestar.stores.redis import RedisStore
+from rich.console import Console
+from rich.table import Table
+
+from backend.middleware.limiters import (
+    RateLimiter,
+    RedisRateLimiter,
+    StoreRateLimiter,
+)
+from backend.stores.bounded import BoundedMemoryStore
+from backend.stores.shared import SharedMemoryStore
+
+KEYS = 1000
+LIMIT = 10**9
+
+type Backend = Callable[[], tuple[Store, RateLimiter]]
+
+
+def _backends(directory: Path, redis_url: str | None) -> dict[str, Backend]:
+    def in_process(store: Callable[[], Store]) -> Backend:
+        def create() -> tuple[Store, RateLimiter]:
+            created = store()
+            return created, StoreRateLimiter(created)
+
+        return create
+
+    backends = {
+        "MemoryStore": in_process(MemoryStore),
+        "BoundedMemoryStore": in_process(lambda: BoundedMemoryStore(10 * KEYS)),
+        "SharedMemoryStore": in_process(
+            lambda: SharedMemoryStore(directory / "bench", max_value_size=32)
+        ),
+    }
+    if redis_url:
+        from redis.asyncio import Redis
+
+        def redis() -> tuple[Store, RateLimiter]:
+            store = RedisStore.with_client(url=redis_url, namespace="bench")
+            limiter = RedisRateLimiter(Redis.from_url(redis_url), prefix="bench:")
+            return store, limiter
+
+        backends["RedisStore"] = redis
+    return backends
+
+
+async def _median(
+    operation: Callable[[int], Awaitable[object]], operations: int
+) -> float:
+    samples = []
+    for i in range(operations):
+        started = time.perf_counter()
+        await operation(i % KEYS)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+async def _latencies(backend: Backend, operations: int) -> list[float]:
+    store, limiter = backend()
+    try:
+        return [
+            await _median(lambda i: store.set(f"key:{i}", b"1.0"), operations),
+            await _median(lambda i: store.get(f"key:{i}"), operations),
+            await _median(lambda i: limiter.acquire(f"ip:{i}", LIMIT), operations),
+        ]
+    finally:
+        await store.delete_all()
+        await limiter.close()
+
+
+def _worker(backend: Backend, seconds: float, results: Queue[int]) -> None:
+    async def run() -> int:
+        _, limiter = backend()
+        decisions = 0
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            await limiter.acquire(f"ip:{decisions % KEYS}", LIMIT)
+            decisions += 1
+        await limiter.close()
+        return decisions
+
+    results.put(asyncio.run(run()))
+
+
+def _throughput(backend: Backend, workers: int, seconds: float) -> float:
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    processes = [
+        context.Process(target=_worker, args=(backend, seconds, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    total = sum(results.get() for _ in processes)
+    for process in processes:
+        process.join()
+    return total / seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--operations", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--redis-url")
+    # Point at a RAM-backed filesystem, as `SHARED_STORE_DIR` should be.
+    parser.add_argument("--directory", type=Path)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.directory) as tmp:
+        backends = _backends(Path(tmp), args.redis_url)
+        table = Table(title=f"{args.operations} operations over {KEYS} keys")
+        table.add_column("Store")
+        for column in ("set", "get", "rate limit"):
+            table.add_column(f"{column} (µs)", justify="right")
+        table.add_column(f"{args.workers} workers (decisions/s)", justify="right")
+        for name, backend in backends.items():
+            latencies = asyncio.run(_latencies(backend, args.operations))
+            throughput = _throughput(backend, args.workers, args.seconds)
+            table.add_row(
+                name,
+                *(f"{latency * 1_000_000:.1f}" for latency in latencies),
+                f"{throughput:,.0f}",
+            )
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Compare full-row and projected loads of a 100-user GraphQL connection page.
+
+Run with `task bench -- user_projection.py` against the development database;
+the seeded rows are rolled back afterwards.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from advanced_alchemy.filters import LimitOffset
+from rich.console import Console
+from rich.table import Table
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+
+from backend.apps.users.graphql.types import UserType
+from backend.apps.users.models import UserModel
+from backend.apps.users.services import UserService
+from backend.config.alchemy import alchemy_config
+
+PAGE_SIZE = 100
+_EMAIL_PREFIX = "bench-projection-"
+
+
+async def _load_page(session: AsyncSession, columns: tuple[str, ...] | None) -> float:
+    session.expunge_all()
+    load = (
+        None
+        if columns is None
+        else [load_only(*(getattr(UserModel, column) for column in columns))]
+    )
+    started = time.perf_counter()
+    users = await UserService(session).list(
+        UserModel.email.startswith(_EMAIL_PREFIX),
+        LimitOffset(limit=PAGE_SIZE, offset=0),
+        order_by=[(UserModel.created_at, True), (UserModel.id, True)],
+        load=load,
+    )
+    for user in users:
+        UserType.from_model(user)
+    return time.perf_counter() - started
+
+
+async def _run(iterations: int) -> dict[str, list[float]]:
+    variants: dict[str, tuple[str, ...] | None] = {
+        "full rows": None,
+        "id, created_at, email": ("id", "created_at", "email"),
+    }
+    timings: dict[str, list[float]] = {name: [] for name in variants}
+    async with alchemy_config.get_session() as session:
+        session.add_all(
+            UserModel(
+                email=f"{_EMAIL_PREFIX}{i}@example.com",
+                password_hash="$argon2id$v=19$m=65536,t=3,p=4$" + "x" * 66,
+                first_name=f"First{i}",
+                last_name=f"Last{i}",
+            )
+            for i in range(PAGE_SIZE)
+        )
+        await session.flush()
+        try:
+            for _ in range(iterations):
+                for name, columns in variants.items():
+                    timings[name].append(await _load_page(session, columns))
+        finally:
+            await session.rollback()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    console = Console()
+    with console.status("Benchmarking..."):
+        timings = asyncio.run(_run(args.iterations))
+
+    table = Table(title=f"{PAGE_SIZE}-user page, {args.iterations} iterations")
+    table.add_column("Columns")
+    table.add_column("Median (ms)", justify="right")
+    table.add_column("p95 (ms)", justify="right")
+    for name, samples in timings.items():
+        table.add_row(
+            name,
+            f"{statistics.median(samples) * 1000:.2f}",
+            f"{statistics.quantiles(samples, n=20)[-1] * 1000:.2f}",
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Substring search latency on a large user table, against its targets.
+
+Seeds `--users` rows (2 million by default) in one transaction, analyzes the
+table and times REST `searchString` pages (first and second, through
+`UserCursorPaginator`) and admin searches (count plus first page, as the
+admin list view runs them). Run with `task bench -- user_search.py` against a
+migrated development database; the seeded rows are rolled back afterwards.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+from rich.console import Console
+from rich.table import Table
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.apps.users.models import UserModel
+from backend.apps.users.pagination import UserCursorPaginator
+from backend.apps.users.search import SEARCHABLE_COLUMNS, user_search_condition
+from backend.config.alchemy import alchemy_config
+
+PAGE_SIZE = 20
+ADMIN_PAGE_SIZE = 10
+_EMAIL_PREFIX = "bench-search-"
+
+# p95 targets in milliseconds, for terms of at least three characters. Admin
+# searches for common terms count every match, so they have no target.
+REST_TARGET_MS = 50
+ADMIN_TARGET_MS = 150
+
+REST_TERMS = {
+    "one match": f"{_EMAIL_PREFIX}1234567@",
+    "~100 matches": "-12345",
+    "every row": "example",
+    "two characters": "12",
+}
+ADMIN_TERMS = {
+    "one match": f"{_EMAIL_PREFIX}1234567@",
+    "~1,000 matches": "Last1234",
+}
+
+type Search = Callable[[AsyncSession], Awaitable[object]]
+
+
+async def _seed(session: AsyncSession, users: int) -> None:
+    await session.execute(
+        text(
+            """
+            INSERT INTO "user" (
+                email, password_hash, first_name, last_name, is_admin, is_active,
+                created_at, updated_at
+            )
+            SELECT
+                :prefix || i || '@example.com', 'hash', 'First' || i % 5000,
+                'Last' || i % 20011, false, true,
+                now() - i * interval '1 second', now()
+            FROM generate_series(1, :users) AS i
+            """
+        ),
+        {"prefix": _EMAIL_PREFIX, "users": users},
+    )
+    await session.execute(text('ANALYZE "user"'))
+
+
+def _rest_page(term: str, *, second: bool) -> Search:
+    async def search(session: AsyncSession) -> object:
+        paginator = UserCursorPaginator(
+            db_session=session, search_string=term, search_ignore_case=True
+        )
+        items, cursor = await paginator.get_items(None, PAGE_SIZE)
+        if second and cursor is not None:
+            items, _ = await paginator.get_items(cursor, PAGE_SIZE)
+        return items
+
+    return search
+
+
+def _admin_search(term: str) -> Search:
+    condition = user_search_condition(term, SEARCHABLE_COLUMNS)
+
+    async def search(session: AsyncSession) -> object:
+        count = await session.scalar(
+            select(func.count()).select_from(UserModel).where(condition)
+        )
+        page = await session.scalars(
+            select(UserModel).where(condition).limit(ADMIN_PAGE_SIZE)
+        )
+        return count, page.all()
+
+    return search
+
+
+async def _run(users: int, iterations: int) -> list[tuple[str, list[float], int]]:
+    searches: list[tuple[str, Search, int]] = []
+    for name, term in REST_TERMS.items():
+        target = REST_TARGET_MS if len(term) >= 3 else 0
+        searches.append((f"REST, {name}", _rest_page(term, second=False), target))
+        searches.append(
+            (f"REST, {name}, page 2", _rest_page(term, second=True), target)
+        )
+    for name, term in ADMIN_TERMS.items():
+        searches.append((f"admin, {name}", _admin_search(term), ADMIN_TARGET_MS))
+
+    results = []
+    async with alchemy_config.get_session() as session:
+        await _seed(session, users)
+        try:
+            for name, search, target in searches:
+                await search(session)  # warm the cache
+                samples = []
+                for _ in range(iterations):
+                    session.expunge_all()
+                    started = time.perf_counter()
+                    await search(session)
+                    samples.append(time.perf_counter() - started)
+                results.append((name, samples, target))
+        finally:
+            await session.rollback()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=2_000_000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    console = Console()
+    with console.status(f"Seeding {args.users:,} users and searching..."):
+        results = asyncio.run(_run(args.users, args.iterations))
+
+    table = Table(title=f"{args.users:,} users, {args.iterations} iterations")
+    table.add_column("Search")
+    table.add_column("Median (ms)", justify="right")
+    table.add_column("p95 (ms)", justify="right")
+    table.add_column("Target p95 (ms)", justify="right")
+    for name, samples, target in results:
+        p95 = statistics.quantiles(samples, n=20)[-1] * 1000
+        verdict = "—"
+        if target:
+            verdict = f"{target} {'✓' if p95 <= target else '✗'}"
+        table.add_row(
+            name,
+            f"{statistics.median(samples) * 1000:.2f}",
+            f"{p95:.2f}",
+            verdict,
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""user trigram search indexes
+
+Revision ID: c5e1f3a7d902
+Revises: b47d2e8a91c3
+Create Date: 2026-10-18 17:02:54.180463
+
+"""
+
+import warnings
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from advanced_alchemy.types import (
+    GUID,
+    ORA_JSONB,
+    DateTimeUTC,
+    EncryptedString,
+    EncryptedText,
+    FernetBackend,
+    PasswordHash,
+    StoredObject,
+)
+from advanced_alchemy.types.encrypted_string import PGCryptoBackend
+from advanced_alchemy.types.password_hash.argon2 import Argon2Hasher
+from advanced_alchemy.types.password_hash.passlib import PasslibHasher
+from advanced_alchemy.types.password_hash.pwdlib import PwdlibHasher
+from alembic import op
+
+if TYPE_CHECKING:
+    pass
+
+__all__ = [
+    "data_downgrades",
+    "data_upgrades",
+    "downgrade",
+    "schema_downgrades",
+    "schema_upgrades",
+    "upgrade",
+]
+
+sa.GUID = GUID
+sa.DateTimeUTC = DateTimeUTC
+sa.ORA_JSONB = ORA_JSONB
+sa.EncryptedString = EncryptedString
+sa.EncryptedText = EncryptedText
+sa.StoredObject = StoredObject
+sa.PasswordHash = PasswordHash
+sa.Argon2Hasher = Argon2Hasher
+sa.PasslibHasher = PasslibHasher
+sa.PwdlibHasher = PwdlibHasher
+sa.FernetBackend = FernetBackend
+sa.PGCryptoBackend = PGCryptoBackend
+
+# revision identifiers, used by Alembic.
+revision = "c5e1f3a7d902"
+down_revision = "b47d2e8a91c3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=UserWarning)
+        with op.get_context().autocommit_block():
+            schema_upgrades()
+            data_upgrades()
+
+
+def downgrade() -> None:
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=UserWarning)
+        with op.get_context().autocommit_block():
+            data_downgrades()
+            schema_downgrades()
+
+
+_SEARCHABLE_COLUMNS = ("email", "first_name", "last_name")
+
+
+def schema_upgrades() -> None:
+    """schema upgrade migrations go here."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Built concurrently (hence the autocommit block) so that `user` stays
+    # writable; if one fails, drop the invalid index before retrying.
+    for column in _SEARCHABLE_COLUMNS:
+        op.create_index(
+            f"ix_user_{column}_trgm",
+            "user",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def schema_downgrades() -> None:
+    """schema downgrade migrations go here."""
+    # The pg_trgm extension is left installed; other objects may use it.
+    for column in reversed(_SEARCHABLE_COLUMNS):
+        op.drop_index(
+            f"ix_user_{column}_trgm",
+            table_name="user",
+            postgresql_concurrently=True,
+        )
+
+
+def data_upgrades() -> None:
+    """Add any optional data upgrade migrations here!"""
+
+
+def data_downgrades() -> None:
+    """Add any optional data downgrade migrations here!"""
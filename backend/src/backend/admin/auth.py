@@ -1,14 +1,13 @@
 import datetime
 
-from argon2 import PasswordHasher
-from argon2.exceptions import InvalidHash, VerificationError, VerifyMismatchError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import PlainTextResponse, Response
 from starlette_admin.auth import AdminUser, AuthProvider, LoginFailed
 
 from backend.apps.users.models import UserModel
+from backend.auth.passwords import PasswordHashingOverloadedError, passwords
 
 
 class InvalidCredentialsError(LoginFailed):
@@ -35,13 +34,12 @@ class BackendAdminAuthProvider(AuthProvider):
         if user is None or not user.is_admin or not user.is_active:
             raise InvalidCredentialsError
 
-        ph = PasswordHasher()
         try:
-            ok = ph.verify(user.password_hash, password)
-        except VerifyMismatchError, InvalidHash, VerificationError:
-            ok = False
-        except Exception:  # noqa: BLE001 # security boundary: do not leak verification errors
-            ok = False
+            ok = await passwords.verify(user.password_hash, password)
+        except PasswordHashingOverloadedError as exc:
+            return PlainTextResponse(
+                exc.detail, status_code=exc.status_code, headers=exc.headers
+            )
 
         if not ok:
             raise InvalidCredentialsError
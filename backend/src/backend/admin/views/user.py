@@ -1,8 +1,10 @@
+from sqlalchemy import ColumnElement
 from starlette.requests import Request
 from starlette_admin import action
 from starlette_admin.contrib.sqla import ModelView
 
 from backend.apps.users.models import UserModel
+from backend.apps.users.search import SEARCHABLE_COLUMNS, user_search_condition
 from backend.apps.users.tasks import deactivate_inactive_users
 
 
@@ -19,6 +21,7 @@ class UserAdminView(ModelView):
         "updated_at",
         "deleted_at",
         "last_login_at",
+        "tokens_revoked_at",
     )
     exclude_fields_from_edit = (
         "password_hash",
@@ -26,9 +29,10 @@ class UserAdminView(ModelView):
         "updated_at",
         "deleted_at",
         "last_login_at",
+        "tokens_revoked_at",
     )
 
-    searchable_fields = ("email", "first_name", "last_name")
+    searchable_fields = tuple(column.key for column in SEARCHABLE_COLUMNS)
     sortable_fields = (
         "id",
         "email",
@@ -40,6 +44,10 @@ class UserAdminView(ModelView):
         "updated_at",
     )
 
+    def get_search_query(self, request: Request, term: str) -> ColumnElement[bool]:
+        # The default casts each column to VARCHAR, which hides its index.
+        return user_search_condition(term, SEARCHABLE_COLUMNS)
+
     @action(
         name="run_inactivity_sweep",
         text="Run Inactivity Sweep",
@@ -5,20 +5,36 @@ from litestar.config.cors import CORSConfig
 from litestar.datastructures.state import State
 from litestar.middleware import DefineMiddleware
 from litestar.plugins import PluginProtocol
-from litestar.stores.memory import MemoryStore
-from litestar.types import ControllerRouterHandler
+from litestar.types import ControllerRouterHandler, Middleware
 from sqlalchemy.ext.asyncio import AsyncEngine
 from starlette.middleware.sessions import SessionMiddleware
 
 from .apps.users.controllers import AuthController, UserController
+from .apps.users.notifications import user_change_notifications
 from .auth.jwt import jwt_auth
+from .auth.revocation import (
+    TOKEN_REVOCATIONS_STORE,
+    token_revocation,
+    token_revocation_store,
+)
 from .config.base import settings
+from .graphql.cache import RESPONSE_CACHE_STORE, response_cache_invalidation
 from .graphql.controller import (
     GraphQLContextGetter,
     create_graphql_controller,
 )
+from .graphql.persisted_queries import PERSISTED_QUERIES_STORE
 from .health import health_check
-from .middleware.rate_limit import get_rate_limit_middlewares
+from .metrics import metrics_endpoint
+from .middleware.limiters import create_rate_limiter
+from .middleware.rate_limit import (
+    RATE_LIMIT_STORE,
+    RATE_LIMITER,
+    RateLimitMiddleware,
+    rate_limiting,
+)
+from .stores.bounded import BoundedMemoryStore
+from .stores.shared import host_shared_store
 
 
 def create_app(
@@ -33,13 +49,22 @@ def create_app(
     compression_config = CompressionConfig(backend="brotli", brotli_gzip_fallback=True)
     route_handlers: list[ControllerRouterHandler] = [
         health_check,
+        metrics_endpoint,
         create_graphql_controller(context_getter=graphql_context_getter),
         AuthController,
         UserController,
     ]
 
     plugins: list[PluginProtocol] = []
-    app_state: dict[str, object] = {}
+    rate_limit_store = host_shared_store(
+        RATE_LIMIT_STORE,
+        lambda: BoundedMemoryStore(settings.rate_limit_store_max_entries),
+        buckets=max(1, settings.rate_limit_store_max_entries // 8),
+        max_value_size=32,
+    )
+    app_state: dict[str, object] = {
+        RATE_LIMITER: create_rate_limiter(rate_limit_store),
+    }
     if use_sqlalchemy_plugin:
         from advanced_alchemy.extensions.litestar import SQLAlchemyPlugin
 
@@ -54,7 +79,7 @@ def create_app(
 
         route_handlers.append(create_admin_handler(engine=admin_engine))
 
-    middleware = [*get_rate_limit_middlewares()]
+    middleware: list[Middleware] = [RateLimitMiddleware]
 
     # Add SessionMiddleware globally if admin is enabled
     if enable_admin:
@@ -74,6 +99,29 @@ def create_app(
         compression_config=compression_config,
         middleware=middleware,
         state=State(app_state),
-        stores={"rate_limit": MemoryStore()},
+        stores={
+            RATE_LIMIT_STORE: rate_limit_store,
+            PERSISTED_QUERIES_STORE: host_shared_store(
+                PERSISTED_QUERIES_STORE,
+                lambda: BoundedMemoryStore(
+                    settings.graphql_persisted_queries_max_entries
+                ),
+                buckets=max(1, settings.graphql_persisted_queries_max_entries // 8),
+                max_value_size=16 * 1024,
+            ),
+            RESPONSE_CACHE_STORE: host_shared_store(
+                RESPONSE_CACHE_STORE,
+                lambda: BoundedMemoryStore(settings.graphql_response_cache_max_entries),
+                buckets=max(1, settings.graphql_response_cache_max_entries // 8),
+                max_value_size=16 * 1024,
+            ),
+            TOKEN_REVOCATIONS_STORE: token_revocation_store(),
+        },
+        lifespan=[
+            response_cache_invalidation,
+            user_change_notifications,
+            token_revocation,
+            rate_limiting,
+        ],
         on_app_init=[jwt_auth.on_app_init],
     )
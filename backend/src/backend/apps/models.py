@@ -1,5 +1,6 @@
 from advanced_alchemy.base import metadata_registry
 
+from backend.apps.users.models import RefreshTokenModel as RefreshTokenModel
 from backend.apps.users.models import UserModel as UserModel
 
 metadata = metadata_registry[None]
@@ -1,12 +1,20 @@
+import time
+
 from backend.apps.users.models import UserModel
+from backend.apps.users.refresh_tokens import RefreshedUser
 from backend.auth.jwt import jwt_auth
+from backend.auth.revocation import ISSUED_AT_CLAIM
 
 
-def create_access_token(user: UserModel) -> str:
+def create_access_token(user: UserModel | RefreshedUser) -> str:
     """Create a JWT token for the given user."""
     return str(
         jwt_auth.create_token(
             identifier=str(user.id),
-            token_extras={"email": user.email, "is_admin": user.is_admin},
+            token_extras={
+                "email": user.email,
+                "is_admin": user.is_admin,
+                ISSUED_AT_CLAIM: time.time(),
+            },
         )
     )
@@ -1,3 +1,5 @@
+from typing import Any, ClassVar
+
 from advanced_alchemy.exceptions import (
     NotFoundError,
     RepositoryError,
@@ -11,10 +13,17 @@ from backend.api.pagination import CursorPage, CursorPageMeta
 from backend.apps.users.auth import create_access_token
 from backend.apps.users.models import UserModel
 from backend.apps.users.pagination import UserCursorPaginator
+from backend.apps.users.refresh_tokens import (
+    InvalidRefreshTokenError,
+    issue_refresh_token,
+    rotate_refresh_token,
+)
 from backend.apps.users.schemas import (
     DeleteResponse,
     LoginRequest,
     LoginResponse,
+    RefreshRequest,
+    TokenResponse,
     UserCreate,
     UserResponse,
     UserUpdate,
@@ -25,16 +34,17 @@ from backend.apps.users.services import (
     UserFieldEmptyError,
     UserService,
 )
+from backend.auth.jwt import CLAIMS_ONLY, Principal
 
 
-def _require_user(request: Request) -> UserModel:
+def _require_user(request: Request) -> UserModel | Principal:
     user = request.user
-    if not isinstance(user, UserModel):
+    if not isinstance(user, UserModel | Principal):
         raise HTTPException(status_code=401, detail="User is not authenticated")
     return user
 
 
-def _require_admin(user: UserModel) -> None:
+def _require_admin(user: UserModel | Principal) -> None:
     if not user.is_admin:
         raise HTTPException(status_code=403, detail="Not authorized to access users.")
 
@@ -82,6 +92,7 @@ class AuthController(Controller):
         token = create_access_token(user)
         return LoginResponse(
             token=token,
+            refresh_token=await issue_refresh_token(db_session, user.id),
             user=users_service.to_schema(user, schema_type=UserResponse),
             reactivated=False,
         )
@@ -105,13 +116,35 @@ class AuthController(Controller):
         token = create_access_token(user)
         return LoginResponse(
             token=token,
+            refresh_token=await issue_refresh_token(db_session, user.id),
             user=users_service.to_schema(user, schema_type=UserResponse),
             reactivated=reactivated,
         )
 
+    @post(path="/refresh")
+    async def refresh(
+        self,
+        db_session: AsyncSession,
+        data: RefreshRequest,
+    ) -> TokenResponse:
+        try:
+            user, refresh_token = await rotate_refresh_token(
+                db_session, data.refresh_token
+            )
+        except InvalidRefreshTokenError:
+            raise HTTPException(
+                status_code=401, detail="Invalid refresh token"
+            ) from None
+
+        return TokenResponse(
+            token=create_access_token(user), refresh_token=refresh_token
+        )
+
 
 class UserController(Controller):
     path = "/api/users"
+    # Handlers load the rows they need themselves; token claims identify the caller.
+    opt: ClassVar[dict[str, Any]] = {CLAIMS_ONLY: True}
 
     @get(path="")
     async def list_users(
@@ -133,8 +166,7 @@ class UserController(Controller):
             required=False,
         ),
     ) -> CursorPage[UserResponse]:
-        users_service = UserService(db_session)
-        await _require_authenticated_user(request, users_service)
+        _require_user(request)
 
         paginator = UserCursorPaginator(
             db_session=db_session,
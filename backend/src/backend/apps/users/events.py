@@ -0,0 +1,19 @@
+from collections.abc import Awaitable, Callable
+
+type UserChangedListener = Callable[[int], Awaitable[None]]
+
+_listeners: list[UserChangedListener] = []
+
+
+def add_user_changed_listener(listener: UserChangedListener) -> None:
+    _listeners.append(listener)
+
+
+def remove_user_changed_listener(listener: UserChangedListener) -> None:
+    _listeners.remove(listener)
+
+
+async def notify_user_changed(user_id: int) -> None:
+    """Tell listeners (e.g. caches) that a committed change touched `user_id`."""
+    for listener in list(_listeners):
+        await listener(user_id)
@@ -1,2 +1,3 @@
 from .mutations import UserMutation as UserMutation
 from .queries import UserQuery as UserQuery
+from .subscriptions import UserSubscription as UserSubscription
@@ -10,3 +10,32 @@ class UserNotFoundError(GraphQLError):
     def __init__(self, user_id: str | int | None = None) -> None:
         message = f"User with id {user_id} not found" if user_id else "User not found"
         super().__init__(message, extensions={"code": "NOT_FOUND"})
+
+
+class InvalidCursorError(GraphQLError):
+    def __init__(self, detail: str = "Invalid cursor.") -> None:
+        super().__init__(detail, extensions={"code": "BAD_USER_INPUT"})
+
+
+class NegativePageSizeError(GraphQLError):
+    def __init__(self, argument: str) -> None:
+        super().__init__(
+            f"Argument '{argument}' must be a non-negative integer.",
+            extensions={"code": "BAD_USER_INPUT"},
+        )
+
+
+class PageSizeTooLargeError(GraphQLError):
+    def __init__(self, argument: str, maximum: int) -> None:
+        super().__init__(
+            f"Argument '{argument}' cannot be higher than {maximum}.",
+            extensions={"code": "BAD_USER_INPUT"},
+        )
+
+
+class ConflictingPageSizeError(GraphQLError):
+    def __init__(self) -> None:
+        super().__init__(
+            "Passing both 'first' and 'last' is not supported.",
+            extensions={"code": "BAD_USER_INPUT"},
+        )
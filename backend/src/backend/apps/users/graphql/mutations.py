@@ -4,6 +4,13 @@ from graphql.error import GraphQLError
 from strawberry.types import Info
 
 from backend.apps.users.auth import create_access_token
+from backend.apps.users.refresh_tokens import (
+    InvalidRefreshTokenError as InvalidRefreshTokenServiceError,
+)
+from backend.apps.users.refresh_tokens import (
+    issue_refresh_token,
+    rotate_refresh_token,
+)
 from backend.apps.users.services import (
     InvalidCredentialsError as InvalidCredentialsServiceError,
 )
@@ -11,12 +18,13 @@ from backend.apps.users.services import (
     UserAlreadyExistsError as UserAlreadyExistsServiceError,
 )
 from backend.apps.users.services import UserFieldEmptyError
+from backend.auth.passwords import PasswordHashingOverloadedError
 from backend.graphql.context import GraphQLContext
 from backend.graphql.permissions import IsAuthenticated
 
 from .errors import UserNotAuthenticatedError
 from .inputs import UpdateUserInput, UserInput
-from .types import LoginResponse, UserType
+from .types import LoginResponse, RefreshResponse, UserType
 
 
 class UserAlreadyExistsError(GraphQLError):
@@ -32,6 +40,19 @@ class InvalidCredentialsError(GraphQLError):
         )
 
 
+class InvalidRefreshTokenError(GraphQLError):
+    def __init__(self) -> None:
+        super().__init__(
+            "Invalid refresh token",
+            extensions={"code": "INVALID_REFRESH_TOKEN"},
+        )
+
+
+class ServiceOverloadedError(GraphQLError):
+    def __init__(self, detail: str) -> None:
+        super().__init__(detail, extensions={"code": "SERVICE_UNAVAILABLE"})
+
+
 class EmptyUserFieldError(GraphQLError):
     def __init__(self, field_name: str) -> None:
         super().__init__(f"{field_name} cannot be empty.")
@@ -90,6 +111,8 @@ class UserMutation:
             )
         except UserAlreadyExistsServiceError as exc:
             raise UserAlreadyExistsError(exc.email) from None
+        except PasswordHashingOverloadedError as exc:
+            raise ServiceOverloadedError(exc.detail) from None
         except RepositoryError as exc:
             await db_session.rollback()
             detail = exc.detail or "Unable to create user."
@@ -98,6 +121,7 @@ class UserMutation:
         token = create_access_token(user)
         return LoginResponse(
             token=token,
+            refresh_token=await issue_refresh_token(db_session, user.id),
             user=UserType.from_model(user),
             reactivated=False,
         )
@@ -108,7 +132,7 @@ class UserMutation:
     ) -> UserType:
         db_session = info.context.db_session
         user_service = info.context.services.users
-        user = info.context.user
+        user = await info.context.get_user()
         if user is None:
             raise UserNotAuthenticatedError
         try:
@@ -124,6 +148,8 @@ class UserMutation:
             raise UserAlreadyExistsError(exc.email) from None
         except UserFieldEmptyError as exc:
             _raise_empty_field_error(exc.field_name)
+        except PasswordHashingOverloadedError as exc:
+            raise ServiceOverloadedError(exc.detail) from None
 
         return UserType.from_model(updated_user)
 
@@ -131,7 +157,7 @@ class UserMutation:
     async def soft_delete_current_user(self, info: Info[GraphQLContext, None]) -> bool:
         db_session = info.context.db_session
         user_service = info.context.services.users
-        user = info.context.user
+        user = await info.context.get_user()
         if user is None:
             raise UserNotAuthenticatedError
 
@@ -152,10 +178,28 @@ class UserMutation:
             )
         except InvalidCredentialsServiceError:
             raise InvalidCredentialsError from None
+        except PasswordHashingOverloadedError as exc:
+            raise ServiceOverloadedError(exc.detail) from None
 
         token = create_access_token(user)
         return LoginResponse(
             token=token,
+            refresh_token=await issue_refresh_token(db_session, user.id),
             user=UserType.from_model(user),
             reactivated=reactivated,
         )
+
+    @strawberry.mutation
+    async def refresh(
+        self, info: Info[GraphQLContext, None], refresh_token: str
+    ) -> RefreshResponse:
+        try:
+            user, new_refresh_token = await rotate_refresh_token(
+                info.context.db_session, refresh_token
+            )
+        except InvalidRefreshTokenServiceError:
+            raise InvalidRefreshTokenError from None
+
+        return RefreshResponse(
+            token=create_access_token(user), refresh_token=new_refresh_token
+        )
@@ -0,0 +1,156 @@
+import datetime
+from typing import Self
+
+import strawberry
+from advanced_alchemy.filters import LimitOffset
+from litestar.exceptions import HTTPException
+from sqlalchemy import ColumnElement, and_, or_
+from sqlalchemy.orm import load_only
+from strawberry.types import Info
+
+from backend.api.pagination import (
+    compute_pagination_context_hash,
+    decode_cursor,
+    encode_cursor,
+)
+from backend.apps.users.models import UserModel
+from backend.config.base import settings
+from backend.graphql.context import GraphQLContext
+
+from .errors import (
+    ConflictingPageSizeError,
+    InvalidCursorError,
+    NegativePageSizeError,
+    PageSizeTooLargeError,
+)
+from .projection import connection_user_columns
+from .types import UserType
+
+_CONTEXT_HASH = compute_pagination_context_hash(
+    sort="created_at_desc_id_desc",
+    filters={},
+)
+
+
+def _encode_user_cursor(user: UserModel) -> str:
+    return encode_cursor(
+        payload={
+            "v": 1,
+            "context_hash": _CONTEXT_HASH,
+            "id": user.id,
+            "created_at": user.created_at.isoformat(),
+        },
+        secret=settings.jwt_secret,
+    )
+
+
+def _decode_user_cursor(cursor: str) -> tuple[datetime.datetime, int]:
+    try:
+        decoded = decode_cursor(
+            cursor=cursor,
+            secret=settings.jwt_secret,
+            expected_context_hash=_CONTEXT_HASH,
+        )
+    except HTTPException as e:
+        raise InvalidCursorError(e.detail) from None
+
+    user_id = decoded.get("id")
+    created_at_raw = decoded.get("created_at")
+    if not isinstance(user_id, int) or not isinstance(created_at_raw, str):
+        raise InvalidCursorError
+    try:
+        created_at = datetime.datetime.fromisoformat(created_at_raw)
+    except ValueError:
+        raise InvalidCursorError from None
+    return created_at, user_id
+
+
+def _after(cursor: str) -> ColumnElement[bool]:
+    created_at, user_id = _decode_user_cursor(cursor)
+    return or_(
+        UserModel.created_at < created_at,
+        and_(UserModel.created_at == created_at, UserModel.id < user_id),
+    )
+
+
+def _before(cursor: str) -> ColumnElement[bool]:
+    created_at, user_id = _decode_user_cursor(cursor)
+    return or_(
+        UserModel.created_at > created_at,
+        and_(UserModel.created_at == created_at, UserModel.id > user_id),
+    )
+
+
+def _page_size(name: str, value: int | None) -> int | None:
+    if value is None:
+        return None
+    if value < 0:
+        raise NegativePageSizeError(name)
+    if value > settings.graphql_max_page_size:
+        raise PageSizeTooLargeError(name, settings.graphql_max_page_size)
+    return value
+
+
+@strawberry.type
+class UserTypeConnection(strawberry.relay.Connection[UserType]):
+    """Users ordered newest first, paginated by a signed `(created_at, id)` key."""
+
+    @classmethod
+    async def resolve_keyset(
+        cls,
+        info: Info[GraphQLContext, None],
+        *,
+        before: str | None = None,
+        after: str | None = None,
+        first: int | None = None,
+        last: int | None = None,
+    ) -> Self:
+        first = _page_size("first", first)
+        last = _page_size("last", last)
+        if first is not None and last is not None:
+            raise ConflictingPageSizeError
+
+        filters: list[ColumnElement[bool]] = [UserModel.deleted_at.is_(None)]
+        if after is not None:
+            filters.append(_after(after))
+        if before is not None:
+            filters.append(_before(before))
+
+        backwards = last is not None
+        limit = last if last is not None else first
+        if limit is None:
+            limit = settings.graphql_max_page_size
+
+        columns = connection_user_columns(info.selected_fields[0].selections)
+        users = list(
+            await info.context.services.users.list(
+                *filters,
+                LimitOffset(limit=limit + 1, offset=0),
+                order_by=[
+                    (UserModel.created_at, not backwards),
+                    (UserModel.id, not backwards),
+                ],
+                load=[load_only(*(getattr(UserModel, column) for column in columns))],
+            )
+        )
+        has_more = len(users) > limit
+        users = users[:limit]
+        if backwards:
+            users.reverse()
+
+        edges = [
+            strawberry.relay.Edge(
+                cursor=_encode_user_cursor(user),
+                node=UserType.from_model(user),
+            )
+            for user in users
+        ]
+        return cls(
+            edges=edges,
+            page_info=strawberry.relay.PageInfo(
+                has_next_page=before is not None if backwards else has_more,
+                has_previous_page=has_more if backwards else after is not None,
+                start_cursor=edges[0].cursor if edges else None,
+                end_cursor=edges[-1].cursor if edges else None,
+            ),
+        )
@@ -0,0 +1,42 @@
+from collections.abc import Iterable, Iterator
+
+from strawberry.types.nodes import SelectedField, Selection
+from strawberry.utils.str_converters import to_camel_case
+
+from backend.apps.users.models import UserModel
+
+_FIELD_COLUMNS = {
+    to_camel_case(column.key): column.key for column in UserModel.__table__.c
+}
+
+
+def _fields(selections: Iterable[Selection]) -> Iterator[SelectedField]:
+    for selection in selections:
+        if isinstance(selection, SelectedField):
+            yield selection
+        else:
+            yield from _fields(selection.selections)
+
+
+def _children(selections: Iterable[Selection], name: str) -> list[Selection]:
+    return [
+        child
+        for field in _fields(selections)
+        if field.name == name
+        for child in field.selections
+    ]
+
+
+def user_columns(selections: Iterable[Selection]) -> frozenset[str]:
+    """`UserModel` columns backing the fields selected on a user."""
+    return frozenset(
+        _FIELD_COLUMNS[field.name]
+        for field in _fields(selections)
+        if field.name in _FIELD_COLUMNS
+    )
+
+
+def connection_user_columns(selections: Iterable[Selection]) -> frozenset[str]:
+    """Columns for a users connection: the selected node fields and cursor key."""
+    nodes = _children(_children(selections, "edges"), "node")
+    return user_columns(nodes) | {"id", "created_at"}
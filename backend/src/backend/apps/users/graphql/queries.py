@@ -1,26 +1,33 @@
-from collections.abc import Iterable
+from typing import Annotated
 
 import strawberry
 from strawberry.types import Info
 
-from backend.apps.users.models import UserModel
+from backend.graphql.cache import CacheControl, CacheScope
 from backend.graphql.context import GraphQLContext
 from backend.graphql.permissions import IsAuthenticated
 
 from .errors import UserNotAuthenticatedError, UserNotFoundError
+from .pagination import UserTypeConnection
 from .types import UserType
 
 
 @strawberry.type
 class UserQuery:
-    @strawberry.field(permission_classes=[IsAuthenticated])
+    @strawberry.field(
+        permission_classes=[IsAuthenticated],
+        directives=[CacheControl(max_age=60, scope=CacheScope.PRIVATE)],
+    )
     async def me(self, info: Info[GraphQLContext, None]) -> UserType:
-        user = info.context.user
+        user = await info.context.get_user()
         if user is None:
             raise UserNotAuthenticatedError
         return UserType.from_model(user)
 
-    @strawberry.field(permission_classes=[IsAuthenticated])
+    @strawberry.field(
+        permission_classes=[IsAuthenticated],
+        directives=[CacheControl(max_age=60, scope=CacheScope.PRIVATE)],
+    )
     async def user_by_id(
         self,
         info: Info[GraphQLContext, None],
@@ -31,16 +38,44 @@ class UserQuery:
         except TypeError as e:
             raise UserNotFoundError(str(id)) from e
 
-    @strawberry.relay.connection(
-        strawberry.relay.ListConnection[UserType],
+    @strawberry.field(
         permission_classes=[IsAuthenticated],
+        directives=[CacheControl(max_age=10, scope=CacheScope.PRIVATE)],
     )
-    async def users(self, info: Info[GraphQLContext, None]) -> Iterable[UserType]:
-        users = await info.context.services.users.list(
-            UserModel.deleted_at.is_(None),
-            order_by=[
-                (UserModel.created_at, True),
-                (UserModel.id, True),
-            ],
+    async def users(
+        self,
+        info: Info[GraphQLContext, None],
+        before: Annotated[
+            str | None,
+            strawberry.argument(
+                description=(
+                    "Returns the items in the list that come before the "
+                    "specified cursor."
+                )
+            ),
+        ] = None,
+        after: Annotated[
+            str | None,
+            strawberry.argument(
+                description=(
+                    "Returns the items in the list that come after the "
+                    "specified cursor."
+                )
+            ),
+        ] = None,
+        first: Annotated[
+            int | None,
+            strawberry.argument(description="Returns the first n items from the list."),
+        ] = None,
+        last: Annotated[
+            int | None,
+            strawberry.argument(description="Returns the last n items from the list."),
+        ] = None,
+    ) -> UserTypeConnection:
+        return await UserTypeConnection.resolve_keyset(
+            info,
+            before=before,
+            after=after,
+            first=first,
+            last=last,
         )
-        return [UserType.from_model(u) for u in users]
@@ -0,0 +1,43 @@
+from collections.abc import AsyncGenerator
+
+import strawberry
+from strawberry.types import Info
+
+from backend.apps.users.models import UserModel
+from backend.apps.users.notifications import user_changes
+from backend.apps.users.services import UserService
+from backend.graphql.context import GraphQLContext
+
+from .errors import UserNotAuthenticatedError
+from .types import UserType
+
+
+@strawberry.type
+class UserSubscription:
+    @strawberry.subscription
+    async def user_updated(
+        self, info: Info[GraphQLContext, None]
+    ) -> AsyncGenerator[UserType]:
+        # Subscribers share the process's LISTEN connection and only borrow a
+        # pooled session for as long as it takes to reload the user, so an
+        # idle subscription holds no database connection.
+        request = info.context.request
+        user_id = info.context.viewer_id
+        if request is None or user_id is None:
+            raise UserNotAuthenticatedError
+        alchemy_config = request.app.state["alchemy_config"]
+
+        async def load_viewer() -> UserModel | None:
+            async with alchemy_config.get_session() as db_session:
+                return await UserService(db_session).get_one_or_none(id=user_id)
+
+        if await load_viewer() is None:
+            raise UserNotAuthenticatedError
+
+        async with user_changes.subscribe(user_id) as changes:
+            while True:
+                await changes.get()
+                user = await load_viewer()
+                if user is None:
+                    return
+                yield UserType.from_model(user)
@@ -3,10 +3,13 @@ from dataclasses import dataclass
 from typing import Self
 
 import strawberry
+from sqlalchemy import inspect
+from sqlalchemy.orm import InstanceState
 
 from backend.apps.users.models import UserModel
 
 from .errors import UserNotFoundError
+from .projection import user_columns
 
 
 @strawberry.type
@@ -25,7 +28,6 @@ class UserType(strawberry.relay.Node):
         node_ids: Iterable[str],
         required: bool = False,
     ) -> Iterable[Self | None]:  # type: ignore
-        services = info.context.services
         node_ids_list = list(node_ids)
         ids = []
         for nid in node_ids_list:
@@ -40,8 +42,10 @@ class UserType(strawberry.relay.Node):
         if not valid_ids:
             return [None] * len(node_ids_list)
 
-        users = await services.users.list(id__in=valid_ids)
-        user_map = {u.id: cls.from_model(u) for u in users}
+        users = await info.context.loaders.load_users(
+            valid_ids, user_columns(info.selected_fields[0].selections)
+        )
+        user_map = {u.id: cls.from_model(u) for u in users if u is not None}
 
         resolved = []
         for nid in node_ids_list:
@@ -60,11 +64,15 @@ class UserType(strawberry.relay.Node):
 
     @classmethod
     def from_model(cls, user: UserModel) -> Self:
+        # Projected loads leave unselected columns unloaded, and touching them
+        # would lazy-load; fill those with placeholders nobody selected.
+        state = inspect(user, raiseerr=False)
+        unloaded = state.unloaded if isinstance(state, InstanceState) else set()
         return cls(
             id=user.id,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            email=user.email,
+            first_name="" if "first_name" in unloaded else user.first_name,
+            last_name="" if "last_name" in unloaded else user.last_name,
+            email="" if "email" in unloaded else user.email,
         )
 
 
@@ -72,5 +80,13 @@ class UserType(strawberry.relay.Node):
 @dataclass
 class LoginResponse:
     token: str
+    refresh_token: str
     user: UserType
     reactivated: bool
+
+
+@strawberry.type
+@dataclass
+class RefreshResponse:
+    token: str
+    refresh_token: str
@@ -2,14 +2,37 @@ import datetime
 
 from advanced_alchemy.base import IdentityAuditBase
 from advanced_alchemy.types import DateTimeUTC
-from sqlalchemy import Boolean, String
+from sqlalchemy import DDL, BigInteger, Boolean, ForeignKey, Index, String, event, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.apps.mixins import SoftDeleteMixin
 
 
+def _trigram_index(column: str) -> Index:
+    """A GIN index that serves `LIKE`/`ILIKE '%term%'` on `column`."""
+    return Index(
+        f"ix_user_{column}_trgm",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    )
+
+
 class UserModel(SoftDeleteMixin, IdentityAuditBase):
     __tablename__ = "user"
+    __table_args__ = (
+        # Keyset pagination over live users, in `UserCursorPaginator` order.
+        Index(
+            "ix_user_live_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Substring search; see `backend.apps.users.search`.
+        _trigram_index("email"),
+        _trigram_index("first_name"),
+        _trigram_index("last_name"),
+    )
 
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True)
     password_hash: Mapped[str] = mapped_column(String(255))
@@ -23,3 +46,29 @@ class UserModel(SoftDeleteMixin, IdentityAuditBase):
     last_login_at: Mapped[datetime.datetime | None] = mapped_column(
         DateTimeUTC(timezone=True), default=None
     )
+    # Access tokens issued up to this moment are revoked.
+    tokens_revoked_at: Mapped[datetime.datetime | None] = mapped_column(
+        DateTimeUTC(timezone=True), default=None
+    )
+
+
+event.listen(
+    UserModel.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+class RefreshTokenModel(IdentityAuditBase):
+    """A rotating refresh token; only the SHA-256 of the token is stored."""
+
+    __tablename__ = "refresh_token"
+
+    user_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("user.id", ondelete="CASCADE"), index=True
+    )
+    token_hash: Mapped[str] = mapped_column(String(64), unique=True, index=True)
+    expires_at: Mapped[datetime.datetime] = mapped_column(DateTimeUTC(timezone=True))
+    revoked_at: Mapped[datetime.datetime | None] = mapped_column(
+        DateTimeUTC(timezone=True), default=None
+    )
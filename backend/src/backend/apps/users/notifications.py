@@ -0,0 +1,187 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
+import asyncpg
+from litestar import Litestar
+from sqlalchemy import func, select
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import AsyncSession
+
+USER_CHANGES_CHANNEL = "user_changes"
+
+# Called with each changed user's id, or None when changes may have been missed.
+type UserChangeWatcher = Callable[[int | None], None]
+
+logger = logging.getLogger(__name__)
+
+
+class UserChangesUnavailableError(Exception):
+    def __init__(self) -> None:
+        super().__init__("User change notifications are not configured")
+
+
+async def publish_user_changed(db_session: AsyncSession, user_id: int) -> None:
+    """Queue a NOTIFY for `user_id` in the current transaction.
+
+    Postgres delivers it on commit and drops it on rollback.
+    """
+    await db_session.execute(select(func.pg_notify(USER_CHANGES_CHANNEL, str(user_id))))
+
+
+def asyncpg_dsn(url: URL) -> str:
+    """The plain `postgresql://` DSN asyncpg expects for a SQLAlchemy URL."""
+    return url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+class UserChangeHub:
+    """Fan one `LISTEN` connection per process out to in-memory subscribers.
+
+    Subscribers get a wake-up queue per user instead of a connection of their
+    own. Queues hold at most one pending wake-up: a subscriber reloads the
+    user's current state when it wakes, so further changes made meanwhile
+    coalesce into that reload.
+    """
+
+    def __init__(self, channel: str = USER_CHANGES_CHANNEL) -> None:
+        self._channel = channel
+        self._dsn: str | None = None
+        self._connection: asyncpg.Connection | None = None
+        self._lock = asyncio.Lock()
+        self._reconnect: asyncio.Task[None] | None = None
+        self._subscribers: dict[int, set[asyncio.Queue[None]]] = {}
+        self._watchers: set[UserChangeWatcher] = set()
+        self._listening = asyncio.Event()
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    @property
+    def listening(self) -> bool:
+        return self._listening.is_set()
+
+    def configure(self, dsn: str) -> None:
+        self._dsn = dsn
+
+    async def wait_listening(self) -> None:
+        await self._listening.wait()
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: int) -> AsyncIterator[asyncio.Queue[None]]:
+        """Yield a queue that receives a wake-up whenever `user_id` changes."""
+        await self._listen()
+        queue: asyncio.Queue[None] = asyncio.Queue(maxsize=1)
+        self._subscribers.setdefault(user_id, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers[user_id]
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[user_id]
+
+    @asynccontextmanager
+    async def watch(self, watcher: UserChangeWatcher) -> AsyncIterator[None]:
+        """Call `watcher` with every changed user's id while inside the block.
+
+        Unlike `subscribe`, this does not wait for the `LISTEN` connection: it
+        is retried in the background, and `wait_listening` tells when it is up.
+        """
+        self._watchers.add(watcher)
+        if self._connection is None and self._reconnect is None:
+            self._reconnect = asyncio.create_task(self._listen_again())
+        try:
+            yield
+        finally:
+            self._watchers.discard(watcher)
+
+    async def close(self) -> None:
+        if (reconnect := self._reconnect) is not None:
+            reconnect.cancel()
+            # Let it let go of the lock before this takes it.
+            await asyncio.gather(reconnect, return_exceptions=True)
+        async with self._lock:
+            connection, self._connection = self._connection, None
+        # A fresh lock and event, since the next app may run on another loop.
+        self._lock = asyncio.Lock()
+        self._listening = asyncio.Event()
+        if connection is not None:
+            connection.remove_termination_listener(self._on_termination)
+            await connection.close()
+
+    async def _listen(self) -> None:
+        async with self._lock:
+            if self._connection is not None:
+                return
+            if self._dsn is None:
+                raise UserChangesUnavailableError
+            connection = await asyncpg.connect(self._dsn)
+            await connection.add_listener(self._channel, self._on_notification)
+            connection.add_termination_listener(self._on_termination)
+            self._connection = connection
+            self._listening.set()
+
+    def _on_notification(
+        self,
+        connection: asyncpg.Connection,
+        pid: int,
+        channel: str,
+        payload: str,
+    ) -> None:
+        try:
+            user_id = int(payload)
+        except ValueError:
+            return
+        for queue in self._subscribers.get(user_id, ()):
+            _wake(queue)
+        for watcher in list(self._watchers):
+            watcher(user_id)
+
+    def _on_termination(self, connection: asyncpg.Connection) -> None:
+        self._connection = None
+        self._listening.clear()
+        # Changes made while reconnecting are lost, so have everyone reload.
+        for queues in self._subscribers.values():
+            for queue in queues:
+                _wake(queue)
+        for watcher in list(self._watchers):
+            watcher(None)
+        if (self._subscribers or self._watchers) and self._reconnect is None:
+            self._reconnect = asyncio.create_task(self._listen_again())
+
+    async def _listen_again(self) -> None:
+        delay = 0.5
+        try:
+            while self._subscribers or self._watchers:
+                try:
+                    await self._listen()
+                except OSError, asyncpg.PostgresError:
+                    logger.warning("LISTEN %s failed, retrying", self._channel)
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 30.0)
+                else:
+                    return
+        finally:
+            self._reconnect = None
+
+
+def _wake(queue: asyncio.Queue[None]) -> None:
+    if queue.empty():
+        queue.put_nowait(None)
+
+
+user_changes = UserChangeHub()
+
+
+@asynccontextmanager
+async def user_change_notifications(app: Litestar) -> AsyncIterator[None]:
+    """Point `user_changes` at the app's database and close it on shutdown."""
+    alchemy_config = app.state.get("alchemy_config")
+    if alchemy_config is not None:
+        user_changes.configure(asyncpg_dsn(alchemy_config.get_engine().url))
+    try:
+        yield
+    finally:
+        await user_changes.close()
@@ -1,8 +1,9 @@
 import datetime
 
+from advanced_alchemy.types import DateTimeUTC
 from litestar.exceptions import HTTPException
 from litestar.pagination import AbstractAsyncCursorPaginator
-from sqlalchemy import Select, and_, or_, select
+from sqlalchemy import BigInteger, Select, literal, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.api.pagination import (
@@ -14,6 +15,7 @@ from backend.config.base import settings
 
 from .models import UserModel
 from .schemas import UserResponse
+from .search import user_search_condition
 from .services import UserService
 
 
@@ -45,23 +47,23 @@ class UserCursorPaginator(AbstractAsyncCursorPaginator[str, UserResponse]):
         last_id: int,
         limit: int,
     ) -> Select[tuple[UserModel]]:
+        # A row-value comparison, rather than the equivalent OR, is what lets
+        # Postgres seek into `ix_user_live_created_at_id` at any page depth.
         stmt = select(UserModel).where(
             UserModel.deleted_at.is_(None),
-            or_(
-                UserModel.created_at > last_created_at,
-                and_(
-                    UserModel.created_at == last_created_at,
-                    UserModel.id > last_id,
-                ),
+            tuple_(UserModel.created_at, UserModel.id)
+            > tuple_(
+                literal(last_created_at, DateTimeUTC(timezone=True)),
+                literal(last_id, BigInteger),
             ),
         )
 
         if self._search_string:
-            value = f"%{self._search_string}%"
-            if self._search_ignore_case:
-                stmt = stmt.where(UserModel.email.ilike(value))
-            else:
-                stmt = stmt.where(UserModel.email.like(value))
+            stmt = stmt.where(
+                user_search_condition(
+                    self._search_string, ignore_case=self._search_ignore_case
+                )
+            )
 
         return stmt.order_by(UserModel.created_at.asc(), UserModel.id.asc()).limit(
             limit
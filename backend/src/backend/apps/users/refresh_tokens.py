@@ -0,0 +1,100 @@
+import datetime
+import hashlib
+import secrets
+from dataclasses import dataclass
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config.base import settings
+
+from .models import RefreshTokenModel, UserModel
+
+
+class InvalidRefreshTokenError(Exception):
+    def __init__(self) -> None:
+        super().__init__("Invalid refresh token")
+
+
+@dataclass(frozen=True, slots=True)
+class RefreshedUser:
+    """The claims an access token needs, as returned by `rotate_refresh_token`."""
+
+    id: int
+    email: str
+    is_admin: bool
+
+
+def _digest(token: str) -> str:
+    # Refresh tokens are 256 random bits, so a fast hash is enough to store them.
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+async def issue_refresh_token(db_session: AsyncSession, user_id: int) -> str:
+    token = secrets.token_urlsafe(32)
+    db_session.add(
+        RefreshTokenModel(
+            user_id=user_id,
+            token_hash=_digest(token),
+            expires_at=datetime.datetime.now(datetime.UTC)
+            + datetime.timedelta(seconds=settings.refresh_token_ttl_seconds),
+        )
+    )
+    await db_session.commit()
+    return token
+
+
+async def rotate_refresh_token(
+    db_session: AsyncSession, token: str
+) -> tuple[RefreshedUser, str]:
+    """Spend `token` and issue its replacement, without any password hashing.
+
+    One indexed UPDATE both claims the token and reads the user's claims, so
+    two concurrent refreshes with the same token cannot both succeed. Replaying
+    an already spent token revokes all of the user's refresh tokens, since it
+    means the token leaked.
+    """
+    token_hash = _digest(token)
+    now = datetime.datetime.now(datetime.UTC)
+    claimed = await db_session.execute(
+        update(RefreshTokenModel)
+        .where(
+            RefreshTokenModel.token_hash == token_hash,
+            RefreshTokenModel.revoked_at.is_(None),
+            RefreshTokenModel.expires_at > now,
+            RefreshTokenModel.user_id == UserModel.id,
+            UserModel.is_active.is_(True),
+            UserModel.deleted_at.is_(None),
+        )
+        .values(revoked_at=now)
+        .returning(UserModel.id, UserModel.email, UserModel.is_admin)
+        .execution_options(synchronize_session=False)
+    )
+    row = claimed.one_or_none()
+    if row is None:
+        reused_by = await db_session.scalar(
+            select(RefreshTokenModel.user_id).where(
+                RefreshTokenModel.token_hash == token_hash,
+                RefreshTokenModel.revoked_at.is_not(None),
+            )
+        )
+        if reused_by is not None:
+            await revoke_refresh_tokens(db_session, reused_by)
+        await db_session.commit()
+        raise InvalidRefreshTokenError
+
+    user = RefreshedUser(id=row.id, email=row.email, is_admin=row.is_admin)
+    return user, await issue_refresh_token(db_session, user.id)
+
+
+async def revoke_refresh_tokens(db_session: AsyncSession, user_id: int) -> None:
+    """Revoke the user's outstanding refresh tokens when the caller commits."""
+    await db_session.execute(
+        update(RefreshTokenModel)
+        .where(
+            RefreshTokenModel.user_id == user_id,
+            RefreshTokenModel.revoked_at.is_(None),
+        )
+        .values(revoked_at=datetime.datetime.now(datetime.UTC))
+        .execution_options(synchronize_session=False)
+    )
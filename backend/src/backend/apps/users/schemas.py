@@ -29,9 +29,19 @@ class LoginRequest(Struct):
 
 class LoginResponse(Struct):
     token: str
+    refresh_token: str
     user: UserResponse
     reactivated: bool
 
 
+class RefreshRequest(Struct):
+    refresh_token: str
+
+
+class TokenResponse(Struct):
+    token: str
+    refresh_token: str
+
+
 class DeleteResponse(Struct):
     deleted: bool
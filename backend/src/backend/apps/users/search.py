@@ -0,0 +1,42 @@
+from collections.abc import Sequence
+
+from sqlalchemy import ColumnElement, or_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from .models import UserModel
+
+# Each of these has a `pg_trgm` GIN index, so substring matches are answered
+# from the index instead of a sequential scan. Terms shorter than a trigram
+# cannot narrow the index; Postgres then walks the paginator's keyset index.
+SEARCHABLE_COLUMNS: Sequence[InstrumentedAttribute[str]] = (
+    UserModel.email,
+    UserModel.first_name,
+    UserModel.last_name,
+)
+
+
+def _contains_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def user_search_condition(
+    term: str,
+    columns: Sequence[InstrumentedAttribute[str]] = (UserModel.email,),
+    *,
+    ignore_case: bool = True,
+) -> ColumnElement[bool]:
+    """Users with `term` as a literal substring of any of `columns`.
+
+    The columns are compared as they are, without casts or `lower()`, so
+    their trigram indexes apply.
+    """
+    pattern = _contains_pattern(term)
+    return or_(
+        *(
+            column.ilike(pattern, escape="\\")
+            if ignore_case
+            else column.like(pattern, escape="\\")
+            for column in columns
+        )
+    )
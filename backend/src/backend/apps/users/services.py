@@ -1,12 +1,24 @@
+import asyncio
 import datetime
+import logging
 
 from advanced_alchemy.exceptions import DuplicateKeyError
 from advanced_alchemy.extensions.litestar import repository, service
-from argon2 import PasswordHasher
-from argon2.exceptions import InvalidHash, VerificationError, VerifyMismatchError
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
+from backend.auth.passwords import PasswordHashingOverloadedError, passwords
+from backend.auth.revocation import token_revocations
+
+from .events import notify_user_changed
 from .models import UserModel
+from .notifications import publish_user_changed
+from .refresh_tokens import revoke_refresh_tokens
+
+logger = logging.getLogger(__name__)
+
+# Background rehashes in flight; holds references so they are not collected.
+_password_upgrades: set[asyncio.Task[None]] = set()
 
 _FIELD_DISPLAY_NAMES: dict[str, str] = {
     "email": "Email",
@@ -34,6 +46,29 @@ class UserFieldEmptyError(ValueError):
         super().__init__(f"{display_name} cannot be empty.")
 
 
+async def _upgrade_password_hash(
+    engine: AsyncEngine, user_id: int, old_hash: str, password: str
+) -> None:
+    try:
+        new_hash = await passwords.hash(password)
+    except PasswordHashingOverloadedError:
+        return  # The next login tries again.
+    async with AsyncSession(engine) as db_session:
+        # Skip it if the password changed while we were hashing.
+        await db_session.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id, UserModel.password_hash == old_hash)
+            .values(password_hash=new_hash)
+        )
+        await db_session.commit()
+
+
+def _log_failed_upgrade(task: asyncio.Task[None]) -> None:
+    _password_upgrades.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Password rehash failed", exc_info=task.exception())
+
+
 class UserService(service.SQLAlchemyAsyncRepositoryService[UserModel]):
     class Repo(repository.SQLAlchemyAsyncRepository[UserModel]):
         model_type = UserModel
@@ -45,18 +80,26 @@ class UserService(service.SQLAlchemyAsyncRepositoryService[UserModel]):
         return email.strip().lower()
 
     @staticmethod
-    def hash_password(password: str) -> str:
-        return PasswordHasher().hash(password)
+    async def hash_password(password: str) -> str:
+        return await passwords.hash(password)
 
     @staticmethod
-    def verify_password(password_hash: str, password: str) -> bool:
-        ph = PasswordHasher()
-        try:
-            return bool(ph.verify(password_hash, password))
-        except VerifyMismatchError, InvalidHash, VerificationError:
-            return False
-        except Exception:  # noqa: BLE001 # security boundary: do not leak verification errors
-            return False
+    async def verify_password(password_hash: str, password: str) -> bool:
+        return await passwords.verify(password_hash, password)
+
+    @staticmethod
+    def _upgrade_password_hash_later(
+        db_session: AsyncSession, user: UserModel, password: str
+    ) -> None:
+        """Rehash with the current parameters without delaying the login."""
+        engine = db_session.bind
+        if not isinstance(engine, AsyncEngine):
+            return
+        task = asyncio.create_task(
+            _upgrade_password_hash(engine, user.id, user.password_hash, password)
+        )
+        _password_upgrades.add(task)
+        task.add_done_callback(_log_failed_upgrade)
 
     @staticmethod
     def _require_non_empty(value: str, field_name: str) -> str:
@@ -98,7 +141,7 @@ class UserService(service.SQLAlchemyAsyncRepositoryService[UserModel]):
             return await self.create(
                 {
                     "email": email_clean,
-                    "password_hash": self.hash_password(password),
+                    "password_hash": await self.hash_password(password),
                     "first_name": first_name,
                     "last_name": last_name,
                     "is_admin": is_admin,
@@ -125,8 +168,10 @@ class UserService(service.SQLAlchemyAsyncRepositoryService[UserModel]):
         if user is None or not user.is_active:
             raise InvalidCredentialsError
 
-        if not self.verify_password(user.password_hash, password):
+        if not await self.verify_password(user.password_hash, password):
             raise InvalidCredentialsError
+        if passwords.needs_rehash(user.password_hash):
+            self._upgrade_password_hash_later(db_session, user, password)
 
         reactivated = False
         if user.deleted_at is not None:
@@ -134,7 +179,11 @@ class UserService(service.SQLAlchemyAsyncRepositoryService[UserModel]):
             reactivated = True
 
         user.last_login_at = datetime.datetime.now(datetime.UTC)
+        if reactivated:
+            await publish_user_changed(db_session, user.id)
         await db_session.commit()
+        if reactivated:
+            await notify_user_changed(user.id)
 
         return user, reactivated
 
@@ -149,6 +198,7 @@ class UserService(service.SQLAlchemyAsyncRepositoryService[UserModel]):
         password: str | None = None,
     ) -> UserModel:
         has_updates = False
+        password_changed = False
 
         if email is not None:
             cleaned_email = self._require_non_empty(email, "email")
@@ -171,11 +221,18 @@ class UserService(service.SQLAlchemyAsyncRepositoryService[UserModel]):
         if password is not None:
             if not password:
                 raise UserFieldEmptyError("password")
-            user.password_hash = self.hash_password(password)
+            user.password_hash = await self.hash_password(password)
+            await revoke_refresh_tokens(db_session, user.id)
             has_updates = True
+            password_changed = True
 
         if has_updates:
+            if password_changed:
+                # Before commit, so no process sees the change unrevoked.
+                await token_revocations.revoke(user)
+            await publish_user_changed(db_session, user.id)
             await db_session.commit()
+            await notify_user_changed(user.id)
 
         return user
 
@@ -186,4 +243,8 @@ class UserService(service.SQLAlchemyAsyncRepositoryService[UserModel]):
         user: UserModel,
     ) -> None:
         user.soft_delete()
+        await revoke_refresh_tokens(db_session, user.id)
+        await token_revocations.revoke(user)
+        await publish_user_changed(db_session, user.id)
         await db_session.commit()
+        await notify_user_changed(user.id)
@@ -3,11 +3,11 @@ import datetime
 
 from celery.app.task import Task
 from celery.utils.log import get_task_logger
-from sqlalchemy import and_, or_, update
+from sqlalchemy import and_, delete, or_, update
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.apps.users.models import UserModel
+from backend.apps.users.models import RefreshTokenModel, UserModel
 from backend.celery_app import app, get_task_session
 
 logger = get_task_logger(__name__)
@@ -76,3 +76,41 @@ async def _deactivate_inactive_users_async(
 
     async with get_task_session() as session:
         return await _run(session)
+
+
+@app.task(
+    bind=True,
+    autoretry_for=(DBAPIError,),
+    retry_backoff=True,
+    retry_jitter=True,
+    retry_kwargs={"max_retries": 5},
+)
+def purge_expired_refresh_tokens(self: Task) -> int:
+    task_id = getattr(self.request, "id", None)
+    logger.info("purge_expired_refresh_tokens start task_id=%s", task_id)
+    count = asyncio.run(_purge_expired_refresh_tokens_async())
+    logger.info(
+        "purge_expired_refresh_tokens done task_id=%s deleted=%s", task_id, count
+    )
+    return count
+
+
+async def _purge_expired_refresh_tokens_async(
+    *,
+    session: AsyncSession | None = None,
+) -> int:
+    # Spent tokens stay until they expire so that replaying one is still
+    # detected; once expired, a replay is refused without them.
+    now = datetime.datetime.now(datetime.UTC)
+
+    async def _run(session: AsyncSession) -> int:
+        result = await session.execute(
+            delete(RefreshTokenModel).where(RefreshTokenModel.expires_at <= now)
+        )
+        return result.rowcount  # type: ignore[attr-defined]
+
+    if session is not None:
+        return await _run(session)
+
+    async with get_task_session() as session:
+        return await _run(session)
@@ -1,15 +1,59 @@
+import datetime
+from dataclasses import dataclass
+from typing import Self
+
 from advanced_alchemy.extensions.litestar import SQLAlchemyAsyncConfig
 from litestar.connection import ASGIConnection
-from litestar.security.jwt import JWTAuth, Token
+from litestar.exceptions import NotAuthorizedException
+from litestar.middleware.authentication import AuthenticationResult
+from litestar.security.jwt import JWTAuth, JWTAuthenticationMiddleware, Token
 
 from backend.apps.users.models import UserModel
 from backend.apps.users.services import UserService
 from backend.config.base import settings
 
+from .revocation import token_revocations
+from .tokens import bearer_token
+
+# Route `opt` flag: the handler only needs who the caller is, not their row.
+CLAIMS_ONLY = "claims_only"
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """The caller as described by their token's claims, without a user lookup."""
+
+    id: int
+    email: str
+    is_admin: bool
+
+    @classmethod
+    def from_token(cls, token: Token) -> Self | None:
+        """The token's principal, or None if its claims are missing or too old."""
+        email = token.extras.get("email")
+        is_admin = token.extras.get("is_admin")
+        if not isinstance(email, str) or not isinstance(is_admin, bool):
+            return None
+        age = datetime.datetime.now(datetime.UTC) - token.iat
+        if age.total_seconds() > settings.jwt_claims_only_max_age_seconds:
+            return None
+        try:
+            return cls(id=int(token.sub), email=email, is_admin=is_admin)
+        except TypeError, ValueError:
+            return None
+
 
 async def retrieve_user_handler(
     token: Token, connection: ASGIConnection
-) -> UserModel | None:
+) -> UserModel | Principal | None:
+    if await token_revocations.is_revoked(token):
+        return None
+
+    if connection.route_handler.opt.get(CLAIMS_ONLY):
+        principal = Principal.from_token(token)
+        if principal is not None:
+            return principal
+
     config = connection.app.state.get("alchemy_config")
     if not isinstance(config, SQLAlchemyAsyncConfig):
         return None
@@ -23,15 +67,36 @@ async def retrieve_user_handler(
         return await UserService(session).get_one_or_none(id=user_id)
 
 
-jwt_auth = JWTAuth[UserModel](
+class VerifiedTokenAuthenticationMiddleware(JWTAuthenticationMiddleware):
+    """`JWTAuth` middleware that reuses the request's `bearer_token`."""
+
+    async def authenticate_token(
+        self, encoded_token: str, connection: ASGIConnection
+    ) -> AuthenticationResult:
+        token = bearer_token(connection)
+        if token is None:
+            raise NotAuthorizedException(detail="Invalid token")
+        user = await self.retrieve_user_handler(token, connection)
+        if not user:
+            raise NotAuthorizedException
+        return AuthenticationResult(user=user, auth=token)
+
+
+jwt_auth = JWTAuth[UserModel | Principal](
     retrieve_user_handler=retrieve_user_handler,
+    authentication_middleware_class=VerifiedTokenAuthenticationMiddleware,
     token_secret=settings.jwt_secret,
+    default_token_expiration=datetime.timedelta(
+        seconds=settings.jwt_access_token_ttl_seconds
+    ),
     exclude=[
         "/graphql",
         "/schema",
         "/health",
+        "/metrics",
         "/admin",
         "/api/auth/login",
+        "/api/auth/refresh",
         "/api/auth/register",
     ],
 )
@@ -0,0 +1,90 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHash, VerificationError, VerifyMismatchError
+from litestar.exceptions import ServiceUnavailableException
+
+from backend.config.base import settings
+
+
+class PasswordHashingOverloadedError(ServiceUnavailableException):
+    def __init__(self) -> None:
+        super().__init__(
+            detail="Too many password checks in progress, try again shortly.",
+            headers={"Retry-After": "1"},
+        )
+
+
+class PasswordHashingPool:
+    """Run argon2 on a bounded thread pool instead of the event loop.
+
+    argon2-cffi releases the GIL while hashing, so threads hash in parallel
+    without a process pool's pickling. At most `workers + max_pending` calls
+    are admitted at once; beyond that callers fail fast with
+    `PasswordHashingOverloadedError` rather than queueing behind the backlog.
+    """
+
+    def __init__(
+        self,
+        hasher: PasswordHasher,
+        *,
+        workers: int,
+        max_pending: int,
+    ) -> None:
+        self._hasher = hasher
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="argon2"
+        )
+        self._capacity = workers + max_pending
+        self._admitted = 0
+
+    @property
+    def hasher(self) -> PasswordHasher:
+        return self._hasher
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self._hasher.hash, password)
+
+    async def verify(self, password_hash: str, password: str) -> bool:
+        return await self._run(self._verify, password_hash, password)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Whether `password_hash` was made with other parameters than ours."""
+        try:
+            return self._hasher.check_needs_rehash(password_hash)
+        except InvalidHash:
+            return True
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _verify(self, password_hash: str, password: str) -> bool:
+        try:
+            return bool(self._hasher.verify(password_hash, password))
+        except VerifyMismatchError, InvalidHash, VerificationError:
+            return False
+        except Exception:  # noqa: BLE001 # security boundary: do not leak verification errors
+            return False
+
+    async def _run[T](self, fn: Callable[..., T], *args: str) -> T:
+        if self._admitted >= self._capacity:
+            raise PasswordHashingOverloadedError
+        self._admitted += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._admitted -= 1
+
+
+passwords = PasswordHashingPool(
+    PasswordHasher(
+        time_cost=settings.password_hash_time_cost,
+        memory_cost=settings.password_hash_memory_cost,
+        parallelism=settings.password_hash_parallelism,
+    ),
+    workers=settings.password_hashing_workers,
+    max_pending=settings.password_hashing_max_pending,
+)
@@ -0,0 +1,279 @@
+import asyncio
+import datetime
+import hashlib
+import math
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator
+from contextlib import asynccontextmanager
+
+from advanced_alchemy.extensions.litestar import SQLAlchemyAsyncConfig
+from litestar import Litestar
+from litestar.security.jwt import Token
+from litestar.stores.base import Store
+from litestar.stores.memory import MemoryStore
+from sqlalchemy import select
+
+from backend.apps.users.models import UserModel
+from backend.apps.users.notifications import user_changes
+from backend.config.base import settings
+from backend.metrics import metrics
+from backend.stores.shared import host_shared_store
+
+# A store name, not a credential.
+TOKEN_REVOCATIONS_STORE = "token_revocations"  # noqa: S105
+# Token claim with the sub-second time it was issued; `iat` has whole seconds.
+ISSUED_AT_CLAIM = "issued_at"
+
+
+class BloomFilter:
+    """A fixed-size set of ints with false positives but no false negatives."""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self._bits = bytearray((bits + 7) // 8)
+        self._size = len(self._bits) * 8
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+
+    def add(self, item: int) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: int) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def _positions(self, item: int) -> Iterator[int]:
+        # Double hashing: k positions from the two halves of one digest.
+        digest = hashlib.blake2b(item.to_bytes(8, signed=True), digest_size=16).digest()
+        first = int.from_bytes(digest[:8])
+        second = int.from_bytes(digest[8:]) | 1
+        for i in range(self._hashes):
+            yield (first + i * second) % self._size
+
+
+class TokenRevocationList:
+    """Per-user revocation watermarks behind an in-process bloom filter.
+
+    Revoking a user records the current time on the user and in `store`, and
+    their tokens issued up to then are revoked. The filter holds every user
+    revoked, or changed by another process, within the last `ttl`, so
+    checking anyone else's token costs a few bit tests and no store round
+    trip. Two filter generations rotate every `ttl`, the longest a token
+    outlives its revocation, so the filter never fills up. With a `fallback`
+    database, a marked user missing from the store, say revoked by another
+    process or evicted, is looked up there instead of let through; a user
+    found unrevoked is not looked up again until they are next marked.
+    """
+
+    def __init__(
+        self, store: Store, *, ttl: int, capacity: int, error_rate: float
+    ) -> None:
+        self._store = store
+        self._ttl = ttl
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._current = BloomFilter(capacity, error_rate)
+        self._previous = BloomFilter(capacity, error_rate)
+        self._rotate_at = time.monotonic() + ttl
+        self._suspended = False
+        self._fallback: SQLAlchemyAsyncConfig | None = None
+        # Users the fallback found unrevoked since they were last marked.
+        self._unrevoked: set[int] = set()
+        self._marks = 0
+
+    def configure(
+        self, store: Store, *, fallback: SQLAlchemyAsyncConfig | None = None
+    ) -> None:
+        self._store = store
+        self._fallback = fallback
+
+    def mark(self, user_id: int) -> None:
+        """Check `user_id`'s tokens against the store from now on."""
+        self._rotate()
+        self._current.add(user_id)
+        self._unrevoked.discard(user_id)
+        self._marks += 1
+
+    def suspend(self) -> None:
+        """Check every token against the store until `resume` is called."""
+        self._suspended = True
+
+    def resume(self, user_ids: Iterable[int]) -> None:
+        """Mark `user_ids`, then go back to filtering tokens."""
+        for user_id in user_ids:
+            self.mark(user_id)
+        self._suspended = False
+
+    def may_be_revoked(self, user_id: int) -> bool:
+        self._rotate()
+        return self._suspended or user_id in self._current or user_id in self._previous
+
+    async def revoke(self, user: UserModel) -> None:
+        """Revoke every token issued to `user` so far.
+
+        The watermark is also set on `user`, for the caller to commit.
+        """
+        watermark = time.time()
+        user.tokens_revoked_at = datetime.datetime.fromtimestamp(
+            watermark, datetime.UTC
+        )
+        self.mark(user.id)
+        await self._store.set(_key(user.id), repr(watermark), expires_in=self._ttl)
+
+    async def is_revoked(self, token: Token) -> bool:
+        try:
+            user_id = int(token.sub)
+        except TypeError, ValueError:
+            return False
+        if not self.may_be_revoked(user_id):
+            metrics.observe("token_revocation_lookups", 1, result="filtered")
+            return False
+        watermark = await self._store.get(_key(user_id))
+        if (
+            watermark is None
+            and self._fallback is not None
+            # Changes can be missed while suspended.
+            and (self._suspended or user_id not in self._unrevoked)
+        ):
+            watermark = await self._load_watermark(self._fallback, user_id)
+        revoked = watermark is not None and issued_at(token) <= float(watermark)
+        metrics.observe(
+            "token_revocation_lookups", 1, result="revoked" if revoked else "valid"
+        )
+        return revoked
+
+    async def _load_watermark(
+        self, config: SQLAlchemyAsyncConfig, user_id: int
+    ) -> bytes | None:
+        marks = self._marks
+        async with config.get_session() as db_session:
+            revoked_at = await db_session.scalar(
+                select(UserModel.tokens_revoked_at).where(UserModel.id == user_id)
+            )
+        watermark = 0.0 if revoked_at is None else revoked_at.timestamp()
+        # Tokens issued before `ttl` ago have expired anyway.
+        expires_in = math.ceil(watermark + self._ttl - time.time())
+        if expires_in <= 0:
+            # Unless a change, perhaps this user's revocation, came in meanwhile.
+            if self._marks == marks and not self._suspended:
+                self._unrevoked.add(user_id)
+            return None
+        # Later lookups of this user skip the database.
+        await self._store.set(_key(user_id), repr(watermark), expires_in=expires_in)
+        return repr(watermark).encode()
+
+    async def clear(self) -> None:
+        await self._store.delete_all()
+        self._current = BloomFilter(self._capacity, self._error_rate)
+        self._previous = BloomFilter(self._capacity, self._error_rate)
+        self._suspended = False
+        self._unrevoked.clear()
+
+    def _rotate(self) -> None:
+        now = time.monotonic()
+        if now < self._rotate_at:
+            return
+        # A generation left idle for two periods holds nothing still relevant.
+        skipped = now - self._rotate_at >= self._ttl
+        self._previous = (
+            BloomFilter(self._capacity, self._error_rate) if skipped else self._current
+        )
+        self._current = BloomFilter(self._capacity, self._error_rate)
+        self._rotate_at = now + self._ttl
+        self._unrevoked.clear()
+
+
+def _key(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def issued_at(token: Token) -> float:
+    """When `token` was issued, to the second for tokens without the claim."""
+    claim = token.extras.get(ISSUED_AT_CLAIM)
+    if isinstance(claim, int | float) and not isinstance(claim, bool):
+        return claim
+    return token.iat.timestamp()
+
+
+def token_revocation_store() -> Store:
+    """Redis when `TOKEN_REVOCATION_REDIS_URL` is set, so all hosts share it."""
+    if settings.token_revocation_redis_url:
+        from litestar.stores.redis import RedisStore
+
+        return RedisStore.with_client(
+            url=settings.token_revocation_redis_url,
+            namespace=TOKEN_REVOCATIONS_STORE,
+        )
+    return host_shared_store(TOKEN_REVOCATIONS_STORE, MemoryStore, max_value_size=16)
+
+
+token_revocations = TokenRevocationList(
+    MemoryStore(),
+    ttl=settings.jwt_access_token_ttl_seconds,
+    capacity=settings.token_revocation_filter_capacity,
+    error_rate=settings.token_revocation_filter_error_rate,
+)
+
+
+async def _recently_changed_users(config: SQLAlchemyAsyncConfig) -> list[int]:
+    since = datetime.datetime.now(datetime.UTC) - datetime.timedelta(
+        seconds=settings.jwt_access_token_ttl_seconds
+    )
+    async with config.get_session() as db_session:
+        user_ids = await db_session.scalars(
+            select(UserModel.id).where(UserModel.updated_at >= since)
+        )
+        return list(user_ids)
+
+
+@asynccontextmanager
+async def token_revocation(app: Litestar) -> AsyncIterator[None]:
+    """Use the app's revocation store and follow other processes' revocations.
+
+    Every user change seen on `user_changes` is marked in the filter. Until
+    the listener is up, and again after it drops, every token is checked
+    against the store, then the filter is rebuilt from recently changed users.
+    Stores other than Redis fall back to the database: a process-memory store
+    never sees other processes' revocations, and a bounded or shared one can
+    evict them.
+    """
+    store = app.stores.get(TOKEN_REVOCATIONS_STORE)
+    config = app.state.get("alchemy_config")
+    if not isinstance(config, SQLAlchemyAsyncConfig):
+        token_revocations.configure(store)
+        yield
+        return
+
+    token_revocations.configure(
+        store, fallback=None if settings.token_revocation_redis_url else config
+    )
+
+    resyncs: set[asyncio.Task[None]] = set()
+
+    async def resync() -> None:
+        while True:
+            await user_changes.wait_listening()
+            user_ids = await _recently_changed_users(config)
+            if user_changes.listening:
+                token_revocations.resume(user_ids)
+                return
+
+    def on_change(user_id: int | None) -> None:
+        if user_id is not None:
+            token_revocations.mark(user_id)
+            return
+        token_revocations.suspend()
+        if not resyncs:
+            task = asyncio.create_task(resync())
+            resyncs.add(task)
+            task.add_done_callback(resyncs.discard)
+
+    on_change(None)
+    try:
+        async with user_changes.watch(on_change):
+            yield
+    finally:
+        for task in resyncs:
+            task.cancel()
@@ -0,0 +1,89 @@
+import hashlib
+import time
+from collections import OrderedDict
+
+from litestar.connection import ASGIConnection
+from litestar.exceptions import NotAuthorizedException
+from litestar.security.jwt import Token
+
+from backend.config.base import settings
+from backend.metrics import metrics
+
+_STATE_KEY = "bearer_token"
+
+
+class VerifiedTokenCache:
+    """LRU of recently verified tokens, keyed by a digest of the encoded token.
+
+    A hit skips the HMAC check and claim parsing. Entries are dropped once
+    their token expires, so a hit is never more permissive than a decode.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._tokens: OrderedDict[bytes, tuple[Token, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def verify(self, encoded_token: str) -> Token | None:
+        """The decoded token, or None if it is invalid or expired."""
+        key = hashlib.sha256(encoded_token.encode()).digest()
+        cached = self._tokens.get(key)
+        if cached is not None:
+            token, expires_at = cached
+            if expires_at > time.time():
+                self._tokens.move_to_end(key)
+                metrics.observe("jwt_token_cache_lookups", 1, result="hit")
+                return token
+            del self._tokens[key]
+
+        metrics.observe("jwt_token_cache_lookups", 1, result="miss")
+        started = time.perf_counter()
+        try:
+            token = Token.decode(
+                encoded_token=encoded_token,
+                secret=settings.jwt_secret,
+                algorithm="HS256",
+            )
+        except NotAuthorizedException, ValueError:
+            return None
+        finally:
+            metrics.observe("jwt_token_decode_seconds", time.perf_counter() - started)
+
+        if self._maxsize > 0:
+            self._tokens[key] = (token, token.exp.timestamp())
+            if len(self._tokens) > self._maxsize:
+                self._tokens.popitem(last=False)
+        return token
+
+    def clear(self) -> None:
+        self._tokens.clear()
+
+
+verified_tokens = VerifiedTokenCache(maxsize=settings.jwt_token_cache_size)
+
+
+def bearer_credentials(auth_header: object) -> str | None:
+    """The token of a `Bearer <token>` authorization header."""
+    if not isinstance(auth_header, str):
+        return None
+    scheme, _, credentials = auth_header.partition(" ")
+    if scheme.lower() != "bearer" or not credentials.strip():
+        return None
+    return credentials.strip()
+
+
+def bearer_token(connection: ASGIConnection) -> Token | None:
+    """The connection's verified bearer token, verified at most once per request.
+
+    The result is kept in the ASGI scope state, so every later consumer
+    (rate limiting, GraphQL context, `JWTAuth`) reuses it.
+    """
+    state = connection.state
+    if _STATE_KEY in state:
+        return state[_STATE_KEY]
+    encoded_token = bearer_credentials(connection.headers.get("Authorization"))
+    token = verified_tokens.verify(encoded_token) if encoded_token else None
+    state[_STATE_KEY] = token
+    return token
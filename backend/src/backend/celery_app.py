@@ -28,6 +28,10 @@ app.conf.beat_schedule = {
         "task": "backend.apps.users.tasks.deactivate_inactive_users",
         "schedule": crontab(hour=3, minute=15),
     },
+    "purge-expired-refresh-tokens-daily": {
+        "task": "backend.apps.users.tasks.purge_expired_refresh_tokens",
+        "schedule": crontab(hour=3, minute=45),
+    },
 }
 
 app.autodiscover_tasks(["backend.apps.users"])
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from pydantic_settings import BaseSettings
 
 
@@ -11,9 +13,51 @@ class Settings(BaseSettings):
 
     cors_allow_origins: list[str]
     jwt_secret: str
+    jwt_access_token_ttl_seconds: int = 60 * 60 * 24  # 1 day
+    jwt_token_cache_size: int = 4096
+    jwt_claims_only_max_age_seconds: int = 15 * 60  # 15 minutes
+    refresh_token_ttl_seconds: int = 60 * 60 * 24 * 7  # 7 days
+    # Shared store for revocations across processes; in-process when unset.
+    token_revocation_redis_url: str | None = None
+    token_revocation_filter_capacity: int = 100_000
+    token_revocation_filter_error_rate: float = 0.001
     rate_limit_per_minute_anonymous: int = 10
     rate_limit_per_minute_authenticated: int = 100
+    # Path prefix -> requests each hit counts as / a per-minute limit of its own.
+    rate_limit_route_weights: dict[str, int] = {}
+    rate_limit_route_limits: dict[str, int] = {}
+    # Shared by every process; the in-process `rate_limit` store when unset.
+    rate_limit_redis_url: str | None = None
+    # Above 0, hot keys are admitted locally and synced to Redis this often.
+    rate_limit_sync_interval_ms: int = 0
+    rate_limit_local_share: float = 0.1
+    rate_limit_store_max_entries: int = 100_000
+    # Directory (e.g. /dev/shm/nova) for stores shared by this host's workers:
+    # rate limits, token revocations and persisted queries.
+    shared_store_dir: Path | None = None
     graphql_max_depth: int = 10
+    graphql_batch_max_operations: int = 10
+    graphql_concurrent_root_fields: bool = False
+    graphql_max_page_size: int = 100
+    graphql_max_cost: int = 1000
+    graphql_field_costs: dict[str, int] = {}
+    graphql_rate_limit_cost_per_request: int = 50
+    graphql_document_cache_size: int = 256
+    graphql_response_cache_max_age: int = 300
+    graphql_response_cache_max_entries: int = 4096
+    graphql_trace_header: str = "x-graphql-trace"
+    # Bearer token scrapers send to `/metrics`; the endpoint is closed when unset.
+    metrics_token: str | None = None
+    graphql_persisted_queries_manifest: Path | None = None
+    graphql_persisted_queries_only: bool = False
+    graphql_persisted_queries_ttl_seconds: int = 60 * 60 * 24  # 1 day
+    graphql_persisted_queries_max_entries: int = 2048
+    # argon2id parameters; `task calibrate-password-hashing` suggests values.
+    password_hash_time_cost: int = 3
+    password_hash_memory_cost: int = 64 * 1024  # KiB
+    password_hash_parallelism: int = 4
+    password_hashing_workers: int = 4
+    password_hashing_max_pending: int = 32
 
     celery_broker_url: str
     celery_result_backend: str
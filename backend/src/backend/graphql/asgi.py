@@ -0,0 +1,46 @@
+from litestar.types import HTTPRequestEvent, Receive, ReceiveMessage, Scope
+from litestar.utils.empty import Empty
+from litestar.utils.scope.state import ScopeState
+
+
+async def read_body(receive: Receive) -> bytes:
+    chunks: list[bytes] = []
+    more_body = True
+    while more_body:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        more_body = message.get("more_body", False)
+    return b"".join(chunks)
+
+
+def replay_body(body: bytes, receive: Receive) -> Receive:
+    """A `receive` that hands downstream apps an already consumed request body."""
+    sent = False
+
+    async def _receive() -> ReceiveMessage:
+        nonlocal sent
+        if sent:
+            return await receive()
+        sent = True
+        message: HTTPRequestEvent = {
+            "type": "http.request",
+            "body": body,
+            "more_body": False,
+        }
+        return message
+
+    return _receive
+
+
+def set_content_length(scope: Scope, length: int) -> None:
+    """Point `content-length` at a rewritten request body of `length` bytes."""
+    scope["headers"] = [
+        *(
+            (name, value)
+            for name, value in scope["headers"]
+            if name != b"content-length"
+        ),
+        (b"content-length", str(length).encode("ascii")),
+    ]
+    # Connections built before the rewrite cache the original headers.
+    ScopeState.from_scope(scope).headers = Empty
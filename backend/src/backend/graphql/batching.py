@@ -0,0 +1,118 @@
+import asyncio
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
+
+import msgspec
+from graphql import GraphQLSyntaxError, OperationType, get_operation_ast
+from litestar import Request
+from litestar.enums import ScopeType
+from litestar.exceptions import TooManyRequestsException
+from litestar.middleware import AbstractMiddleware
+from litestar.types import Receive, Scope, Scopes, Send
+from strawberry.extensions import ParserCache, SchemaExtension
+
+from backend.config.base import settings
+from backend.middleware.rate_limit import charge_rate_limit
+
+from .asgi import read_body, replay_body
+from .operation import current_execution_context
+
+
+@dataclass(slots=True)
+class GraphQLBatch:
+    """State shared by the operations of one batched HTTP request."""
+
+    read_only: bool
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+# The schema's parse cache, so Strawberry reuses the documents parsed here.
+parser_cache = ParserCache(maxsize=settings.graphql_document_cache_size)
+
+
+def _is_query(query: str, operation_name: str | None) -> bool:
+    try:
+        document = parser_cache.cached_parse_document(query)
+    except GraphQLSyntaxError:
+        return False
+    operation = get_operation_ast(document, operation_name)
+    return operation is not None and operation.operation is OperationType.QUERY
+
+
+def _is_read_only(operations: list[Any]) -> bool:
+    for operation in operations:
+        if not isinstance(operation, dict):
+            return False
+        query = operation.get("query")
+        operation_name = operation.get("operationName")
+        if not isinstance(query, str) or not isinstance(operation_name, str | None):
+            return False
+        if not _is_query(query, operation_name):
+            return False
+    return True
+
+
+class BatchedOperationsMiddleware(AbstractMiddleware):
+    """Meter and classify a JSON array of operations before Strawberry runs it.
+
+    A batch costs one rate limit request per operation, like sending them one
+    by one. Batches over `graphql_batch_max_operations` are left for Strawberry
+    to reject.
+    """
+
+    scopes: ClassVar[Scopes] = {ScopeType.HTTP}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope.get("method") != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        body = await read_body(receive)
+        try:
+            payload = msgspec.json.decode(body)
+        except msgspec.DecodeError:
+            payload = None
+
+        if (
+            isinstance(payload, list)
+            and 0 < len(payload) <= settings.graphql_batch_max_operations
+        ):
+            request: Request = Request(scope)
+            if not await charge_rate_limit(request, len(payload) - 1):
+                raise TooManyRequestsException
+            request.state.graphql_batch = GraphQLBatch(read_only=_is_read_only(payload))
+
+        await self.app(scope, replay_body(body, receive), send)
+
+
+class BatchIsolation(SchemaExtension):
+    """Keep the concurrently executed operations of a batch from colliding.
+
+    Strawberry runs batched operations concurrently with one shared context.
+    In a read-only batch each operation gets its own database session, while
+    the viewer is still loaded once through the shared context; a batch with
+    a mutation runs its operations one at a time on the shared session.
+    """
+
+    async def on_execute(self) -> AsyncIterator[None]:
+        execution_context = current_execution_context(self)
+        context = execution_context.context
+        request = getattr(context, "request", None)
+        batch = getattr(request.state, "graphql_batch", None) if request else None
+        if request is None or batch is None:
+            yield
+            return
+
+        alchemy_config = request.app.state.get("alchemy_config")
+        if not batch.read_only or alchemy_config is None:
+            async with batch.lock:
+                yield
+            return
+
+        async with alchemy_config.get_session() as db_session:
+            execution_context.context = context.with_session(db_session)
+            try:
+                yield
+            finally:
+                execution_context.context = context
@@ -0,0 +1,385 @@
+import asyncio
+import hashlib
+import time
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import Enum
+
+import msgspec
+import strawberry
+from graphql import (
+    DocumentNode,
+    ExecutionResult,
+    FieldNode,
+    GraphQLNamedType,
+    GraphQLResolveInfo,
+    GraphQLSchema,
+    OperationType,
+    SelectionSetNode,
+    get_introspection_query,
+    get_named_type,
+    get_operation_ast,
+    graphql_sync,
+)
+from litestar import Litestar
+from litestar.stores.base import Store
+from strawberry.extensions import SchemaExtension
+from strawberry.relay import Node
+from strawberry.schema_directive import Location
+from strawberry.types import ExecutionContext
+
+from backend.apps.users.events import (
+    add_user_changed_listener,
+    remove_user_changed_listener,
+)
+from backend.apps.users.notifications import user_changes
+from backend.config.base import settings
+
+from .operation import current_execution_context
+from .selections import fragment_definitions, root_type, selected_fields
+
+RESPONSE_CACHE_STORE = "graphql_response_cache"
+
+_introspection_results: dict[str, dict[str, object]] = {}
+# Tags of the nodes resolved by the operation being cached.
+_response_tags: ContextVar[set[str] | None] = ContextVar(
+    "graphql_response_tags", default=None
+)
+
+
+@strawberry.enum
+class CacheScope(Enum):
+    PUBLIC = "PUBLIC"
+    PRIVATE = "PRIVATE"
+
+
+@strawberry.schema_directive(
+    locations=[Location.FIELD_DEFINITION, Location.OBJECT],
+    description="How long, and for whom, a field's value may be cached.",
+)
+class CacheControl:
+    max_age: int
+    scope: CacheScope = CacheScope.PUBLIC
+
+
+@dataclass(frozen=True, slots=True)
+class CachePolicy:
+    max_age: int
+    scope: CacheScope
+
+
+class _CacheEntry(msgspec.Struct):
+    data: dict[str, object]
+    tags: list[str]
+    created_at: float
+
+
+def _hint(definition: object) -> CacheControl | None:
+    extensions = getattr(definition, "extensions", None) or {}
+    strawberry_definition = extensions.get("strawberry-definition")
+    for directive in getattr(strawberry_definition, "directives", None) or ():
+        if isinstance(directive, CacheControl):
+            return directive
+    return None
+
+
+def cache_policy(
+    schema: GraphQLSchema, document: DocumentNode, operation_name: str | None = None
+) -> CachePolicy | None:
+    """Combine the `@cacheControl` hints of a query into one policy.
+
+    The query is cached for the smallest max age among its hints, per viewer if
+    any hint is PRIVATE; a root field without a hint makes it uncacheable.
+    Returns None for uncacheable operations, including all mutations.
+    """
+    operation = get_operation_ast(document, operation_name)
+    if operation is None or operation.operation is not OperationType.QUERY:
+        return None
+    fragments = fragment_definitions(document)
+    hints: list[CacheControl] = []
+
+    def visit(
+        parent_type: GraphQLNamedType | None,
+        selection_set: SelectionSetNode,
+        *,
+        root: bool,
+    ) -> bool:
+        for _, node, field in selected_fields(
+            schema, fragments, parent_type, selection_set
+        ):
+            field_type = get_named_type(field.type)
+            hint = _hint(field) or _hint(field_type)
+            if hint is not None:
+                hints.append(hint)
+            elif root:
+                return False
+            if node.selection_set is not None and not visit(
+                field_type, node.selection_set, root=False
+            ):
+                return False
+        return True
+
+    if not visit(root_type(schema, operation), operation.selection_set, root=True):
+        return None
+    max_age = min((hint.max_age for hint in hints), default=0)
+    if max_age <= 0:
+        return None
+    private = any(hint.scope is CacheScope.PRIVATE for hint in hints)
+    return CachePolicy(
+        max_age=max_age,
+        scope=CacheScope.PRIVATE if private else CacheScope.PUBLIC,
+    )
+
+
+def _is_introspection(document: DocumentNode, operation_name: str | None) -> bool:
+    operation = get_operation_ast(document, operation_name)
+    return (
+        operation is not None
+        and operation.operation is OperationType.QUERY
+        and all(
+            isinstance(selection, FieldNode) and selection.name.value.startswith("__")
+            for selection in operation.selection_set.selections
+        )
+    )
+
+
+def _operation_key(
+    query: str | None,
+    operation_name: str | None,
+    variables: Mapping[str, object] | None,
+) -> str:
+    payload = msgspec.json.encode(
+        [query, operation_name or None, variables or None], order="deterministic"
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+def precompute_introspection(schema: strawberry.Schema) -> None:
+    """Answer the standard introspection query once, at schema build time."""
+    query = get_introspection_query(descriptions=True)
+    result = graphql_sync(schema._schema, query)
+    if result.data is not None:
+        for operation_name in (None, "IntrospectionQuery"):
+            key = _operation_key(query, operation_name, None)
+            _introspection_results[key] = result.data
+
+
+def node_cache_tag(type_name: str, node_id: object) -> str:
+    return f"{type_name}:{node_id}"
+
+
+class CacheInvalidations:
+    """When each cache tag was last invalidated, within the last `max_age`.
+
+    Kept in process memory, apart from the entries, so evicting entries never
+    loses an invalidation; every process hears every change. Past `capacity`
+    live tags, everything cached so far is invalidated instead.
+    """
+
+    def __init__(self, *, max_age: int, capacity: int) -> None:
+        self._max_age = max_age
+        self._capacity = capacity
+        # In invalidation order, so the oldest come first.
+        self._invalidated_at: dict[str, float] = {}
+        self._everything_at = 0.0
+        self._suspended = False
+
+    def invalidate(self, tag: str) -> None:
+        """Make every cached response that resolved the tagged node a miss."""
+        now = time.time()
+        if len(self._invalidated_at) >= self._capacity:
+            self._forget_expired(now)
+        if len(self._invalidated_at) >= self._capacity:
+            self.invalidate_all()
+            return
+        self._invalidated_at.pop(tag, None)
+        self._invalidated_at[tag] = now
+
+    def invalidate_all(self) -> None:
+        self._everything_at = time.time()
+        self._invalidated_at.clear()
+
+    def suspend(self) -> None:
+        """Treat every entry as stale until `resume` is called."""
+        self._suspended = True
+
+    def resume(self) -> None:
+        """Invalidate everything cached so far, then serve entries again."""
+        self.invalidate_all()
+        self._suspended = False
+
+    def is_stale(self, created_at: float, tags: Iterable[str]) -> bool:
+        if self._suspended or created_at <= self._everything_at:
+            return True
+        return any(self._invalidated_at.get(tag, 0.0) >= created_at for tag in tags)
+
+    def _forget_expired(self, now: float) -> None:
+        # Entries cached before `max_age` ago have expired from the store.
+        for tag, invalidated_at in list(self._invalidated_at.items()):
+            if invalidated_at > now - self._max_age:
+                return
+            del self._invalidated_at[tag]
+
+
+response_cache_invalidations = CacheInvalidations(
+    max_age=settings.graphql_response_cache_max_age,
+    capacity=settings.graphql_response_cache_max_entries,
+)
+
+
+async def _read_entry(store: Store, key: str) -> dict[str, object] | None:
+    raw = await store.get(key)
+    if raw is None:
+        return None
+    entry = msgspec.json.decode(raw, type=_CacheEntry)
+    if response_cache_invalidations.is_stale(entry.created_at, entry.tags):
+        return None
+    return entry.data
+
+
+@asynccontextmanager
+async def response_cache_invalidation(app: Litestar) -> AsyncIterator[None]:
+    """Invalidate cached responses containing a user whenever that user changes.
+
+    This process's own changes invalidate as they commit; other processes'
+    arrive through `user_changes`. Until its listener is up, and again after
+    it drops, every entry is a miss, and everything cached before it came
+    back is invalidated.
+    """
+    invalidations = response_cache_invalidations
+    resumes: set[asyncio.Task[None]] = set()
+
+    async def invalidate_user(user_id: int) -> None:
+        invalidations.invalidate(node_cache_tag("UserType", user_id))
+
+    async def resume() -> None:
+        await user_changes.wait_listening()
+        invalidations.resume()
+
+    def on_change(user_id: int | None) -> None:
+        if user_id is not None:
+            invalidations.invalidate(node_cache_tag("UserType", user_id))
+            return
+        invalidations.suspend()
+        if not resumes:
+            task = asyncio.create_task(resume())
+            resumes.add(task)
+            task.add_done_callback(resumes.discard)
+
+    add_user_changed_listener(invalidate_user)
+    try:
+        if app.state.get("alchemy_config") is None:
+            yield
+        else:
+            on_change(None)
+            async with user_changes.watch(on_change):
+                yield
+    finally:
+        remove_user_changed_listener(invalidate_user)
+        for task in resumes:
+            task.cancel()
+        invalidations.resume()
+
+
+def _cache_target(
+    execution_context: ExecutionContext,
+    document: DocumentNode,
+    operation_name: str | None,
+    key: str,
+) -> tuple[Store, str, int] | None:
+    request = getattr(execution_context.context, "request", None)
+    policy = cache_policy(execution_context.schema._schema, document, operation_name)
+    if request is None or policy is None:
+        return None
+
+    if policy.scope is CacheScope.PRIVATE:
+        viewer_id = execution_context.context.viewer_id
+        if viewer_id is None:
+            return None
+        scope = f"user:{viewer_id}"
+    else:
+        scope = "public"
+    max_age = min(policy.max_age, settings.graphql_response_cache_max_age)
+    if max_age <= 0:
+        return None
+    store = request.app.stores.get(RESPONSE_CACHE_STORE)
+    return store, f"response:{scope}:{key}", max_age
+
+
+class ResponseCache(SchemaExtension):
+    """Serve query results from the response cache store per `@cacheControl`.
+
+    Introspection-only queries are answered from an in-process cache, since the
+    schema never changes at runtime. Every relay node resolved while executing
+    is recorded as a tag on the entry so `response_cache_invalidations` can
+    expire it.
+    """
+
+    async def on_execute(self) -> AsyncIterator[None]:
+        execution_context = current_execution_context(self)
+        document = execution_context.graphql_document
+        if execution_context.result is not None or document is None:
+            yield
+            return
+
+        operation_name = execution_context.operation_name
+        key = _operation_key(
+            execution_context.query, operation_name, execution_context.variables
+        )
+        if _is_introspection(document, operation_name):
+            data = _introspection_results.get(key)
+            if data is not None:
+                execution_context.result = ExecutionResult(data=data)
+            yield
+            result = execution_context.result
+            if (
+                data is None
+                and result is not None
+                and not result.errors
+                and result.data is not None
+                and len(_introspection_results) < settings.graphql_document_cache_size
+            ):
+                _introspection_results[key] = result.data
+            return
+
+        target = _cache_target(execution_context, document, operation_name, key)
+        if target is None:
+            yield
+            return
+        store, cache_key, max_age = target
+
+        created_at = time.time()
+        data = await _read_entry(store, cache_key)
+        if data is not None:
+            execution_context.result = ExecutionResult(data=data)
+            yield
+            return
+
+        tags: set[str] = set()
+        token = _response_tags.set(tags)
+        try:
+            yield
+        finally:
+            _response_tags.reset(token)
+        result = execution_context.result
+        if result is not None and not result.errors and result.data is not None:
+            entry = _CacheEntry(
+                data=result.data, tags=sorted(tags), created_at=created_at
+            )
+            await store.set(cache_key, msgspec.json.encode(entry), expires_in=max_age)
+
+    def resolve(
+        self,
+        _next: Callable[..., object],
+        root: object,
+        info: GraphQLResolveInfo,
+        *args: object,
+        **kwargs: object,
+    ) -> object:
+        tags = _response_tags.get()
+        if tags is not None and isinstance(root, Node):
+            node_id = getattr(root, root.resolve_id_attr())
+            tags.add(node_cache_tag(info.parent_type.name, node_id))
+        return _next(root, info, *args, **kwargs)
@@ -1,12 +1,83 @@
+from collections.abc import Collection, Sequence
 from functools import cached_property
 
+import msgspec
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+from strawberry.dataloader import DataLoader
 from strawberry.litestar.controller import BaseContext
 
 from backend.apps.users.models import UserModel
 from backend.apps.users.services import UserService
 
 
+class Loaders:
+    """Request-scoped DataLoaders; batch and dedupe loads within one operation."""
+
+    def __init__(self, services: Services) -> None:
+        self._services = services
+        # Columns each cached user was loaded with; None means the full row.
+        self._user_columns: dict[int, frozenset[str] | None] = {}
+        self._batch_user_columns: set[str] = set()
+        self._batch_full_user_rows = False
+
+    @cached_property
+    def _users(self) -> DataLoader[int, UserModel | None]:
+        return DataLoader(load_fn=self._load_users)
+
+    def prime_user(self, user: UserModel) -> None:
+        self._users.prime(user.id, user)
+        self._user_columns[user.id] = None
+
+    async def load_user(
+        self, user_id: int, columns: Collection[str] | None = None
+    ) -> UserModel | None:
+        (user,) = await self.load_users([user_id], columns)
+        return user
+
+    async def load_users(
+        self, ids: Sequence[int], columns: Collection[str] | None = None
+    ) -> list[UserModel | None]:
+        """Load users by id, selecting only `columns` when given.
+
+        Loads in the same batch share one SELECT over the union of their
+        columns, or over full rows if any of them asked for full rows.
+        """
+        wanted = None if columns is None else frozenset({"id", *columns})
+        for user_id in ids:
+            if user_id not in self._user_columns:
+                continue
+            loaded = self._user_columns[user_id]
+            if loaded is not None and (wanted is None or not wanted <= loaded):
+                self._users.clear(user_id)
+                del self._user_columns[user_id]
+
+        if wanted is None:
+            self._batch_full_user_rows = True
+        else:
+            self._batch_user_columns |= wanted
+        return await self._users.load_many(ids)
+
+    async def _load_users(self, ids: list[int]) -> list[UserModel | None]:
+        columns = (
+            None
+            if self._batch_full_user_rows or not self._batch_user_columns
+            else frozenset(self._batch_user_columns)
+        )
+        self._batch_user_columns = set()
+        self._batch_full_user_rows = False
+
+        load = (
+            None
+            if columns is None
+            else [load_only(*(getattr(UserModel, column) for column in columns))]
+        )
+        users = await self._services.users.list(UserModel.id.in_(ids), load=load)
+        users_by_id = {user.id: user for user in users}
+        self._user_columns.update(dict.fromkeys(ids, columns))
+        return [users_by_id.get(user_id) for user_id in ids]
+
+
 class Services:
     def __init__(self, db_session: AsyncSession) -> None:
         self._db_session = db_session
@@ -15,8 +86,49 @@ class Services:
     def users(self) -> UserService:
         return UserService(self._db_session)
 
+    @cached_property
+    def loaders(self) -> Loaders:
+        return Loaders(self)
+
 
 class GraphQLContext(BaseContext, kw_only=True):
     db_session: AsyncSession
     services: Services
     user: UserModel | None = None
+    user_id: int | None = None
+    # graphql-ws `connection_init` payload, set by Strawberry on websockets.
+    connection_params: dict[str, object] | None = None
+    # Context the viewer is loaded through, for copies made by `with_session`.
+    shared: "GraphQLContext | None" = None  # noqa: UP037 # msgspec resolves it lazily
+
+    @property
+    def viewer_id(self) -> int | None:
+        """The authenticated user's id, without loading the user."""
+        if self.user is not None:
+            return self.user.id
+        return self.user_id
+
+    async def get_user(self) -> UserModel | None:
+        """The authenticated user; `user_id` is only loaded on first use."""
+        if self.user is None and self.shared is not None:
+            self.user = await self.shared.get_user()
+        elif self.user is None and self.user_id is not None:
+            self.user = await self.loaders.load_user(self.user_id)
+        return self.user
+
+    @property
+    def loaders(self) -> Loaders:
+        return self.services.loaders
+
+    def with_session(self, db_session: AsyncSession) -> GraphQLContext:
+        """A copy of this context that works on `db_session`.
+
+        The copy still loads the viewer through this context, so work split
+        across sessions looks the viewer up only once.
+        """
+        return msgspec.structs.replace(
+            self,
+            db_session=db_session,
+            services=Services(db_session),
+            shared=self,
+        )
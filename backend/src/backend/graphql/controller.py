@@ -1,46 +1,48 @@
 from collections.abc import Awaitable, Callable
+from typing import ClassVar
 
+import msgspec
 from litestar import Request
-from litestar.exceptions import NotAuthorizedException
 from litestar.security.jwt import Token
-from litestar.types import ControllerRouterHandler
+from litestar.types import ControllerRouterHandler, Middleware
 from sqlalchemy.ext.asyncio import AsyncSession
 from strawberry.litestar import make_graphql_controller
 
-from backend.config.base import settings
+from backend.auth.revocation import token_revocations
+from backend.auth.tokens import bearer_credentials, bearer_token, verified_tokens
 
+from .batching import BatchedOperationsMiddleware
 from .context import GraphQLContext, Services
+from .persisted_queries import PersistedQueriesMiddleware
 from .schema import schema
 
 type GraphQLContextGetter = Callable[..., Awaitable[GraphQLContext]]
 
 
+def _user_id(token: Token | None) -> int | None:
+    if token is None or not token.sub:
+        return None
+    try:
+        return int(token.sub)
+    except ValueError:
+        return None
+
+
+async def _viewer_id(token: Token | None) -> int | None:
+    if token is None or await token_revocations.is_revoked(token):
+        return None
+    return _user_id(token)
+
+
 async def default_graphql_context_getter(
     db_session: AsyncSession,
     request: Request,
 ) -> GraphQLContext:
-    services = Services(db_session)
-    user = None
-
-    auth_header = request.headers.get("Authorization")
-    if auth_header and auth_header.startswith("Bearer "):
-        token_str = auth_header.split(" ")[1]
-        try:
-            token = Token.decode(
-                encoded_token=token_str,
-                secret=settings.jwt_secret,
-                algorithm="HS256",
-            )
-            user_id = token.sub
-            if user_id:
-                user = await services.users.get_one_or_none(id=int(user_id))
-        except NotAuthorizedException, ValueError:
-            pass
-
+    # On the subscriptions websocket Litestar passes the socket as `request`.
     return GraphQLContext(
         db_session=db_session,
-        services=services,
-        user=user,
+        services=Services(db_session),
+        user_id=await _viewer_id(bearer_token(request)),
         request=request,
     )
 
@@ -50,8 +52,37 @@ def create_graphql_controller(
     context_getter: GraphQLContextGetter | None = None,
 ) -> ControllerRouterHandler:
     context_getter = context_getter or default_graphql_context_getter
-    return make_graphql_controller(
+    base_controller = make_graphql_controller(
         schema=schema,
         path="/graphql",
         context_getter=context_getter,
     )
+
+    class GraphQLController(base_controller):  # type: ignore[unsupported-base]
+        middleware: ClassVar[list[Middleware]] = [
+            PersistedQueriesMiddleware,
+            BatchedOperationsMiddleware,
+        ]
+
+        def encode_json(self, data: object) -> bytes:
+            # Straight to bytes: no intermediate str for large connection pages.
+            return msgspec.json.encode(data)
+
+        async def on_ws_connect(self, context: object) -> None:
+            # Browsers cannot set headers on a websocket, so graphql-ws clients
+            # send the token in their `connection_init` payload instead.
+            if (
+                isinstance(context, GraphQLContext)
+                and context.user is None
+                and context.user_id is None
+                and context.connection_params
+            ):
+                encoded_token = bearer_credentials(
+                    context.connection_params.get("Authorization")
+                )
+                if encoded_token:
+                    context.user_id = await _viewer_id(
+                        verified_tokens.verify(encoded_token)
+                    )
+
+    return GraphQLController
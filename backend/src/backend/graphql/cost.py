@@ -0,0 +1,184 @@
+import math
+from collections.abc import AsyncIterator, Mapping
+
+from graphql import (
+    DocumentNode,
+    ExecutionResult,
+    FieldNode,
+    GraphQLField,
+    GraphQLNamedType,
+    GraphQLSchema,
+    IntValueNode,
+    SelectionSetNode,
+    VariableNode,
+    get_named_type,
+    get_operation_ast,
+    is_leaf_type,
+)
+from graphql.error import GraphQLError
+from strawberry.extensions import SchemaExtension
+
+from backend.config.base import settings
+from backend.middleware.rate_limit import charge_rate_limit
+
+from .operation import current_execution_context
+from .selections import fragment_definitions, root_type, selected_fields
+
+_PAGE_SIZE_ARGUMENTS = ("first", "last")
+
+
+class QueryCostExceededError(GraphQLError):
+    def __init__(self, cost: int, maximum: int) -> None:
+        super().__init__(
+            f"Query cost {cost} exceeds maximum operation cost {maximum}.",
+            extensions={"code": "QUERY_TOO_COMPLEX", "cost": cost, "max": maximum},
+        )
+
+
+class QueryCostRateLimitedError(GraphQLError):
+    def __init__(self, cost: int) -> None:
+        super().__init__(
+            "Rate limit exceeded for an operation of this cost.",
+            extensions={"code": "RATE_LIMITED", "cost": cost},
+        )
+
+
+class _CostCalculator:
+    def __init__(
+        self,
+        *,
+        schema: GraphQLSchema,
+        document: DocumentNode,
+        variables: Mapping[str, object],
+        field_weights: Mapping[str, int],
+        default_page_size: int,
+        max_page_size: int | None,
+    ) -> None:
+        self._schema = schema
+        self._variables = variables
+        self._field_weights = field_weights
+        self._default_page_size = default_page_size
+        self._max_page_size = max_page_size
+        self._fragments = fragment_definitions(document)
+
+    def selection_set_cost(
+        self, parent_type: GraphQLNamedType | None, selection_set: SelectionSetNode
+    ) -> int:
+        return sum(
+            self._field_cost(field_parent, node, field)
+            for field_parent, node, field in selected_fields(
+                self._schema, self._fragments, parent_type, selection_set
+            )
+        )
+
+    def _field_cost(
+        self, parent_type: GraphQLNamedType, node: FieldNode, field: GraphQLField
+    ) -> int:
+        field_type = get_named_type(field.type)
+        weight = self._field_weights.get(
+            f"{parent_type.name}.{node.name.value}",
+            0 if is_leaf_type(field_type) else 1,
+        )
+        if node.selection_set is None:
+            return weight
+        multiplier = self._page_size(node, field_type)
+        return weight + multiplier * self.selection_set_cost(
+            field_type, node.selection_set
+        )
+
+    def _page_size(self, node: FieldNode, field_type: GraphQLNamedType) -> int:
+        sizes = [
+            self._argument_value(argument.value)
+            for argument in node.arguments
+            if argument.name.value in _PAGE_SIZE_ARGUMENTS
+        ]
+        requested = [size for size in sizes if size is not None]
+        if requested:
+            # Negative sizes would subtract cost; oversized ones are rejected.
+            size = max(0, *requested)
+            if self._max_page_size is not None:
+                size = min(size, self._max_page_size)
+            return size
+        if field_type.name.endswith("Connection"):
+            return self._default_page_size
+        return 1
+
+    def _argument_value(self, value: object) -> int | None:
+        if isinstance(value, IntValueNode):
+            return int(value.value)
+        if isinstance(value, VariableNode):
+            variable = self._variables.get(value.name.value)
+            return variable if isinstance(variable, int) else None
+        return None
+
+
+def operation_cost(
+    *,
+    schema: GraphQLSchema,
+    document: DocumentNode,
+    operation_name: str | None = None,
+    variables: Mapping[str, object] | None = None,
+    field_weights: Mapping[str, int] | None = None,
+    default_page_size: int = 1,
+    max_page_size: int | None = None,
+) -> int:
+    """Statically estimate how much data an operation can make the server load.
+
+    Every field costs its configured weight (`Type.field`), defaulting to 1 for
+    object fields and 0 for scalars; the cost of a field's selection set is
+    multiplied by its `first`/`last` argument, so aliased connection fields add
+    up their full page sizes. Sizes count as at least 0 and at most
+    `max_page_size`.
+    """
+    operation = get_operation_ast(document, operation_name)
+    if operation is None:
+        return 0
+    calculator = _CostCalculator(
+        schema=schema,
+        document=document,
+        variables=variables or {},
+        field_weights=field_weights or {},
+        default_page_size=default_page_size,
+        max_page_size=max_page_size,
+    )
+    return calculator.selection_set_cost(
+        root_type(schema, operation), operation.selection_set
+    )
+
+
+class QueryCostLimiter(SchemaExtension):
+    """Reject operations over `graphql_max_cost` and charge their cost as quota.
+
+    Each `graphql_rate_limit_cost_per_request` points of cost consume one
+    request from the caller's rate limit; the HTTP request itself already
+    paid for the first one.
+    """
+
+    async def on_execute(self) -> AsyncIterator[None]:
+        execution_context = current_execution_context(self)
+        document = execution_context.graphql_document
+        if document is not None:
+            cost = operation_cost(
+                schema=execution_context.schema._schema,
+                document=document,
+                operation_name=execution_context.operation_name,
+                variables=execution_context.variables,
+                field_weights=settings.graphql_field_costs,
+                default_page_size=settings.graphql_max_page_size,
+                max_page_size=settings.graphql_max_page_size,
+            )
+            if cost > settings.graphql_max_cost:
+                execution_context.result = ExecutionResult(
+                    data=None,
+                    errors=[QueryCostExceededError(cost, settings.graphql_max_cost)],
+                )
+            else:
+                request = getattr(execution_context.context, "request", None)
+                units = math.ceil(cost / settings.graphql_rate_limit_cost_per_request)
+                if request is not None and not await charge_rate_limit(
+                    request, units - 1
+                ):
+                    execution_context.result = ExecutionResult(
+                        data=None, errors=[QueryCostRateLimitedError(cost)]
+                    )
+        yield
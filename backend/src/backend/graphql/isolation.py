@@ -0,0 +1,69 @@
+from collections.abc import Callable
+from inspect import isawaitable
+
+from advanced_alchemy.extensions.litestar import SQLAlchemyAsyncConfig
+from graphql import GraphQLResolveInfo, OperationType
+from strawberry.extensions import SchemaExtension
+
+from backend.config.base import settings
+
+from .context import GraphQLContext
+
+
+class RootFieldIsolation(SchemaExtension):
+    """Give each root field of a query its own short-lived database session.
+
+    graphql-core resolves the root fields of a query concurrently, which one
+    shared `AsyncSession` cannot serve; with a session per root field they
+    really do run side by side, and an operation takes about as long as its
+    slowest field. Mutation root fields run serially and keep the request's
+    session. Enabled by `graphql_concurrent_root_fields`.
+
+    Each copy of the context has loaders of its own, so lookups are no longer
+    batched across root fields: isolating trades those shared round trips for
+    concurrency. A loader shared between sessions would run each batch on
+    whichever session started it, which is what isolation avoids.
+    """
+
+    def resolve(
+        self,
+        _next: Callable[..., object],
+        root: object,
+        info: GraphQLResolveInfo,
+        *args: object,
+        **kwargs: object,
+    ) -> object:
+        context = info.context
+        request = getattr(context, "request", None)
+        if (
+            not settings.graphql_concurrent_root_fields
+            or info.operation.operation is not OperationType.QUERY
+            or info.parent_type is not info.schema.query_type
+            or info.field_name.startswith("__")
+            or not isinstance(context, GraphQLContext)
+            or request is None
+        ):
+            return _next(root, info, *args, **kwargs)
+
+        alchemy_config = request.app.state.get("alchemy_config")
+        if alchemy_config is None:
+            return _next(root, info, *args, **kwargs)
+        return self._resolve_isolated(
+            alchemy_config, _next, root, info, *args, **kwargs
+        )
+
+    async def _resolve_isolated(
+        self,
+        alchemy_config: SQLAlchemyAsyncConfig,
+        _next: Callable[..., object],
+        root: object,
+        info: GraphQLResolveInfo,
+        *args: object,
+        **kwargs: object,
+    ) -> object:
+        async with alchemy_config.get_session() as db_session:
+            field_info = info._replace(context=info.context.with_session(db_session))
+            result = _next(root, field_info, *args, **kwargs)
+            if isawaitable(result):
+                result = await result
+            return result
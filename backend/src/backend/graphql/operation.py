@@ -0,0 +1,44 @@
+from collections.abc import Iterator
+from contextvars import ContextVar
+
+from strawberry.extensions import SchemaExtension
+from strawberry.types import ExecutionContext
+from strawberry.types.graphql import OperationType
+
+_execution_context: ContextVar[ExecutionContext | None] = ContextVar(
+    "graphql_execution_context", default=None
+)
+
+
+class OperationScope(SchemaExtension):
+    """Record each operation's execution context for the other extensions.
+
+    Strawberry shares one instance of every extension between concurrent
+    operations and reassigns its `execution_context` as each one starts, so
+    a hook that reads it after anything has suspended may see another
+    operation's. This must be the schema's first extension: its hook runs
+    right after the assignment, before anything can suspend.
+    """
+
+    def on_operation(self) -> Iterator[None]:
+        token = _execution_context.set(self.execution_context)
+        # Subscriptions end in another context than the one they start in,
+        # each in a task of its own, so theirs is left set.
+        if set(self.execution_context.allowed_operations) == {
+            OperationType.SUBSCRIPTION
+        }:
+            yield
+            return
+        try:
+            yield
+        finally:
+            _execution_context.reset(token)
+
+
+def current_execution_context(extension: SchemaExtension) -> ExecutionContext:
+    """The running operation's execution context, as seen by `extension`.
+
+    Falls back to the extension's own attribute in schemas without
+    `OperationScope`.
+    """
+    return _execution_context.get() or extension.execution_context
@@ -10,4 +10,4 @@ class IsAuthenticated(BasePermission):
     async def has_permission(
         self, source: object, info: Info[GraphQLContext, None], **kwargs: object
     ) -> bool:
-        return info.context.user is not None
+        return await info.context.get_user() is not None
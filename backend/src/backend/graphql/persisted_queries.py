@@ -0,0 +1,155 @@
+import hashlib
+from functools import cache
+from pathlib import Path
+from typing import Any, ClassVar
+
+import msgspec
+from litestar import Litestar
+from litestar.enums import ScopeType
+from litestar.middleware import AbstractMiddleware
+from litestar.types import Receive, Scope, Scopes, Send
+
+from backend.config.base import settings
+
+from .asgi import read_body, replay_body, set_content_length
+
+PERSISTED_QUERIES_STORE = "graphql_persisted_queries"
+
+
+class PersistedQueryError(Exception):
+    code: str
+    message: str
+
+    def __init__(self) -> None:
+        super().__init__(self.message)
+
+
+class PersistedQueryNotFoundError(PersistedQueryError):
+    code = "PERSISTED_QUERY_NOT_FOUND"
+    message = "PersistedQueryNotFound"
+
+
+class PersistedQueryHashMismatchError(PersistedQueryError):
+    code = "PERSISTED_QUERY_HASH_MISMATCH"
+    message = "provided sha does not match query"
+
+
+class PersistedQueryNotAllowedError(PersistedQueryError):
+    code = "PERSISTED_QUERY_NOT_ALLOWED"
+    message = "Only persisted queries are allowed"
+
+
+def query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+@cache
+def load_manifest(path: Path | None) -> dict[str, str]:
+    """Load a `{sha256: document}` manifest as emitted by the codegen client preset."""
+    if path is None:
+        return {}
+    return msgspec.json.decode(path.read_bytes(), type=dict[str, str])
+
+
+def _requested_hash(operation: dict[str, Any]) -> str | None:
+    extensions = operation.get("extensions")
+    if not isinstance(extensions, dict):
+        return None
+    persisted_query = extensions.get("persistedQuery")
+    if not isinstance(persisted_query, dict):
+        return None
+    sha256_hash = persisted_query.get("sha256Hash")
+    return sha256_hash if isinstance(sha256_hash, str) else None
+
+
+async def _send_error(send: Send, error: PersistedQueryError) -> None:
+    body = msgspec.json.encode(
+        {"errors": [{"message": error.message, "extensions": {"code": error.code}}]}
+    )
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body, "more_body": False})
+
+
+class PersistedQueriesMiddleware(AbstractMiddleware):
+    """Resolve APQ hash-only requests to their documents before Strawberry runs.
+
+    Known documents come from the codegen manifest first and then from the
+    `graphql_persisted_queries` store, where clients register new ones by
+    sending the document together with its hash once.
+    """
+
+    scopes: ClassVar[Scopes] = {ScopeType.HTTP}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope.get("method") != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        body = await read_body(receive)
+        try:
+            payload = msgspec.json.decode(body)
+        except msgspec.DecodeError:
+            payload = None
+
+        operations = payload if isinstance(payload, list) else [payload]
+        try:
+            changed = False
+            for operation in operations:
+                if isinstance(operation, dict):
+                    changed |= await self._resolve(scope, operation)
+        except PersistedQueryError as error:
+            await _send_error(send, error)
+            return
+
+        if changed:
+            body = msgspec.json.encode(payload)
+            set_content_length(scope, len(body))
+        await self.app(scope, replay_body(body, receive), send)
+
+    async def _resolve(self, scope: Scope, operation: dict[str, Any]) -> bool:
+        manifest = load_manifest(settings.graphql_persisted_queries_manifest)
+        sha256_hash = _requested_hash(operation)
+        query = operation.get("query")
+
+        if sha256_hash is None:
+            if (
+                settings.graphql_persisted_queries_only
+                and isinstance(query, str)
+                and query_hash(query) not in manifest
+            ):
+                raise PersistedQueryNotAllowedError
+            return False
+
+        if isinstance(query, str) and query:
+            if query_hash(query) != sha256_hash:
+                raise PersistedQueryHashMismatchError
+            if sha256_hash in manifest:
+                return False
+            if settings.graphql_persisted_queries_only:
+                raise PersistedQueryNotAllowedError
+            store = Litestar.from_scope(scope).stores.get(PERSISTED_QUERIES_STORE)
+            await store.set(
+                sha256_hash,
+                query,
+                expires_in=settings.graphql_persisted_queries_ttl_seconds,
+            )
+            return False
+
+        persisted = manifest.get(sha256_hash)
+        if persisted is None and not settings.graphql_persisted_queries_only:
+            store = Litestar.from_scope(scope).stores.get(PERSISTED_QUERIES_STORE)
+            stored = await store.get(sha256_hash)
+            persisted = stored.decode("utf-8") if stored is not None else None
+        if persisted is None:
+            raise PersistedQueryNotFoundError
+        operation["query"] = persisted
+        return True
@@ -1,9 +1,17 @@
 import strawberry
-from strawberry.extensions import QueryDepthLimiter
+from strawberry.extensions import QueryDepthLimiter, ValidationCache
+from strawberry.schema.config import StrawberryConfig
 
-from backend.apps.users.graphql import UserMutation, UserQuery
+from backend.apps.users.graphql import UserMutation, UserQuery, UserSubscription
 from backend.config.base import settings
 
+from .batching import BatchIsolation, parser_cache
+from .cache import ResponseCache, precompute_introspection
+from .cost import QueryCostLimiter
+from .isolation import RootFieldIsolation
+from .operation import OperationScope
+from .tracing import ResolverTracing
+
 
 @strawberry.type
 class Query(UserQuery):
@@ -15,8 +23,29 @@ class Mutation(UserMutation):
     pass
 
 
+@strawberry.type
+class Subscription(UserSubscription):
+    pass
+
+
 schema = strawberry.Schema(
     query=Query,
     mutation=Mutation,
-    extensions=[QueryDepthLimiter(max_depth=settings.graphql_max_depth)],
+    subscription=Subscription,
+    config=StrawberryConfig(
+        batching_config={"max_operations": settings.graphql_batch_max_operations}
+    ),
+    extensions=[
+        OperationScope,
+        BatchIsolation,
+        QueryDepthLimiter(max_depth=settings.graphql_max_depth),
+        ResolverTracing,
+        QueryCostLimiter,
+        ResponseCache,
+        parser_cache,
+        ValidationCache(maxsize=settings.graphql_document_cache_size),
+        RootFieldIsolation,
+    ],
 )
+
+precompute_introspection(schema)
@@ -0,0 +1,73 @@
+from collections.abc import Iterator, Mapping
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLField,
+    GraphQLInterfaceType,
+    GraphQLNamedType,
+    GraphQLObjectType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    OperationType,
+    SelectionSetNode,
+)
+
+
+def root_type(
+    schema: GraphQLSchema, operation: OperationDefinitionNode
+) -> GraphQLObjectType | None:
+    return {
+        OperationType.QUERY: schema.query_type,
+        OperationType.MUTATION: schema.mutation_type,
+        OperationType.SUBSCRIPTION: schema.subscription_type,
+    }[operation.operation]
+
+
+def fragment_definitions(document: DocumentNode) -> dict[str, FragmentDefinitionNode]:
+    return {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+
+
+def selected_fields(
+    schema: GraphQLSchema,
+    fragments: Mapping[str, FragmentDefinitionNode],
+    parent_type: GraphQLNamedType | None,
+    selection_set: SelectionSetNode,
+) -> Iterator[tuple[GraphQLNamedType, FieldNode, GraphQLField]]:
+    """Yield `(parent type, node, definition)` for each field in a selection set.
+
+    Fragments are followed into their type conditions; introspection meta
+    fields, which have no definition on the parent type, are skipped.
+    """
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            if not isinstance(parent_type, GraphQLObjectType | GraphQLInterfaceType):
+                continue
+            field = parent_type.fields.get(selection.name.value)
+            if field is not None:
+                yield parent_type, selection, field
+        elif isinstance(selection, InlineFragmentNode):
+            fragment_type = (
+                schema.get_type(selection.type_condition.name.value)
+                if selection.type_condition
+                else parent_type
+            )
+            yield from selected_fields(
+                schema, fragments, fragment_type, selection.selection_set
+            )
+        elif isinstance(selection, FragmentSpreadNode):
+            fragment = fragments.get(selection.name.value)
+            if fragment is not None:
+                yield from selected_fields(
+                    schema,
+                    fragments,
+                    schema.get_type(fragment.type_condition.name.value),
+                    fragment.selection_set,
+                )
@@ -0,0 +1,175 @@
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from inspect import isawaitable
+
+from graphql import GraphQLResolveInfo
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from strawberry.extensions import SchemaExtension
+from strawberry.types.graphql import OperationType
+
+from backend.config.base import settings
+from backend.metrics import metrics
+
+from .operation import current_execution_context
+
+_QUERY_STARTED_AT = "graphql_tracing_query_started_at"
+
+
+@dataclass(slots=True)
+class _FieldTiming:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+
+@dataclass(slots=True)
+class _Trace:
+    phases: dict[str, float] = field(default_factory=dict)
+    fields: dict[str, _FieldTiming] = field(default_factory=dict)
+    sql_statements: int = 0
+    sql_seconds: float = 0.0
+
+
+_current_trace: ContextVar[_Trace | None] = ContextVar("graphql_trace", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn: Connection, *_args: object) -> None:
+    if _current_trace.get() is not None:
+        conn.info.setdefault(_QUERY_STARTED_AT, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn: Connection, *_args: object) -> None:
+    trace = _current_trace.get()
+    started_at = conn.info.get(_QUERY_STARTED_AT)
+    if trace is None or not started_at:
+        return
+    trace.sql_statements += 1
+    trace.sql_seconds += time.perf_counter() - started_at.pop()
+
+
+def _is_traced(info: GraphQLResolveInfo) -> bool:
+    # Only fields with their own resolver; attribute lookups are not worth timing.
+    field_definition = info.parent_type.fields.get(info.field_name)
+    if field_definition is None:
+        return False
+    strawberry_field = field_definition.extensions.get("strawberry-definition")
+    return getattr(strawberry_field, "base_resolver", None) is not None
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+def _report(trace: _Trace) -> dict[str, object]:
+    return {
+        "phasesMs": {phase: _ms(s) for phase, s in trace.phases.items()},
+        "resolvers": {
+            key: {
+                "count": timing.count,
+                "totalMs": _ms(timing.total),
+                "maxMs": _ms(timing.max),
+            }
+            for key, timing in sorted(
+                trace.fields.items(), key=lambda item: -item[1].total
+            )
+        },
+        "sql": {
+            "statements": trace.sql_statements,
+            "totalMs": _ms(trace.sql_seconds),
+        },
+    }
+
+
+class ResolverTracing(SchemaExtension):
+    """Time GraphQL phases, custom resolvers and the SQL they issue.
+
+    Totals always go to the `/metrics` registry; the full trace is added to the
+    response `extensions` when the request carries `graphql_trace_header`.
+    Subscriptions are not traced.
+    """
+
+    def on_operation(self) -> Iterator[None]:
+        execution_context = current_execution_context(self)
+        # Subscriptions end in another context than the one they start in.
+        if set(execution_context.allowed_operations) == {OperationType.SUBSCRIPTION}:
+            yield
+            return
+        trace = _Trace()
+        token = _current_trace.set(trace)
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            _current_trace.reset(token)
+            trace.phases["operation"] = time.perf_counter() - started_at
+            self._publish(trace)
+            request = getattr(execution_context.context, "request", None)
+            if request is not None and settings.graphql_trace_header in request.headers:
+                # Merged into this operation's response `extensions`.
+                execution_context.extensions_results["tracing"] = _report(trace)
+
+    def on_parse(self) -> Iterator[None]:
+        yield from self._phase("parse")
+
+    def on_validate(self) -> Iterator[None]:
+        yield from self._phase("validate")
+
+    def on_execute(self) -> Iterator[None]:
+        yield from self._phase("execute")
+
+    def _phase(self, name: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+        yield
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.phases[name] = time.perf_counter() - started_at
+
+    def resolve(
+        self,
+        _next: Callable[..., object],
+        root: object,
+        info: GraphQLResolveInfo,
+        *args: object,
+        **kwargs: object,
+    ) -> object:
+        trace = _current_trace.get()
+        if trace is None or not _is_traced(info):
+            return _next(root, info, *args, **kwargs)
+
+        key = f"{info.parent_type.name}.{info.field_name}"
+        started_at = time.perf_counter()
+        result = _next(root, info, *args, **kwargs)
+        if isawaitable(result):
+            return self._timed(trace, result, key, started_at)
+        self._record(trace, key, started_at)
+        return result
+
+    async def _timed(
+        self, trace: _Trace, result: Awaitable[object], key: str, started_at: float
+    ) -> object:
+        try:
+            return await result
+        finally:
+            self._record(trace, key, started_at)
+
+    def _record(self, trace: _Trace, key: str, started_at: float) -> None:
+        elapsed = time.perf_counter() - started_at
+        timing = trace.fields.get(key)
+        if timing is None:
+            timing = trace.fields[key] = _FieldTiming()
+        timing.count += 1
+        timing.total += elapsed
+        timing.max = max(timing.max, elapsed)
+
+    def _publish(self, trace: _Trace) -> None:
+        for phase, seconds in trace.phases.items():
+            metrics.observe("graphql_phase_seconds", seconds, phase=phase)
+        for key, timing in trace.fields.items():
+            metrics.observe("graphql_resolver_seconds", timing.total, field=key)
+        metrics.observe("graphql_sql_statements", trace.sql_statements)
+        metrics.observe("graphql_sql_seconds", trace.sql_seconds)
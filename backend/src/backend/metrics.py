@@ -0,0 +1,83 @@
+import hmac
+from collections import defaultdict
+from dataclasses import dataclass
+
+from litestar import MediaType, get
+from litestar.connection import ASGIConnection
+from litestar.exceptions import NotAuthorizedException
+from litestar.handlers.base import BaseRouteHandler
+
+from backend.config.base import settings
+
+type _Labels = tuple[tuple[str, str], ...]
+
+
+@dataclass(slots=True)
+class _Summary:
+    count: int = 0
+    total: float = 0.0
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: _Labels) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in labels)
+    return f"{{{pairs}}}"
+
+
+class MetricsRegistry:
+    """In-process summaries (count and sum), exposed in Prometheus text format.
+
+    Each worker process keeps its own registry; scrape every worker.
+    """
+
+    def __init__(self) -> None:
+        self._summaries: defaultdict[str, dict[_Labels, _Summary]] = defaultdict(dict)
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        summary = self._summaries[name].get(key)
+        if summary is None:
+            summary = self._summaries[name][key] = _Summary()
+        summary.count += 1
+        summary.total += value
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for name, series in sorted(self._summaries.items()):
+            lines.append(f"# TYPE {name} summary")
+            for labels, summary in sorted(series.items()):
+                formatted = _format_labels(labels)
+                lines.append(f"{name}_count{formatted} {summary.count}")
+                lines.append(f"{name}_sum{formatted} {summary.total}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        self._summaries.clear()
+
+
+metrics = MetricsRegistry()
+
+
+def metrics_token_guard(connection: ASGIConnection, _: BaseRouteHandler) -> None:
+    """Admit only scrapers sending `Authorization: Bearer <METRICS_TOKEN>`."""
+    token = settings.metrics_token
+    authorization = connection.headers.get("authorization", "").encode()
+    if token is None or not hmac.compare_digest(
+        authorization, f"Bearer {token}".encode()
+    ):
+        raise NotAuthorizedException
+
+
+@get(
+    "/metrics",
+    media_type=MediaType.TEXT,
+    include_in_schema=False,
+    guards=[metrics_token_guard],
+)
+async def metrics_endpoint() -> str:
+    return metrics.render()
@@ -0,0 +1,277 @@
+import asyncio
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from litestar.stores.base import Store
+from redis.asyncio import Redis
+
+from backend.config.base import settings
+from backend.stores.shared import SharedMemoryStore
+
+PERIOD_SECONDS = 60
+
+logger = logging.getLogger(__name__)
+
+# GCRA: a key's state is its theoretical arrival time (TAT), when it would
+# have its whole limit available again. Each unit pushes the TAT back by
+# period / limit; a request is allowed while that leaves the TAT at most one
+# period ahead. Times are in milliseconds, read from the Redis server's clock
+# so that every host agrees.
+_GCRA_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local units = tonumber(ARGV[3])
+local force = ARGV[4] == "1"
+local clock = redis.call("TIME")
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local tat = tonumber(redis.call("GET", KEYS[1])) or now
+if tat < now then
+  tat = now
+end
+local new_tat = tat + units * period / limit
+local allowed = force or new_tat - period <= now
+if allowed then
+  local ttl = math.max(1, math.ceil(new_tat - now))
+  redis.call("SET", KEYS[1], string.format("%.3f", new_tat), "PX", ttl)
+  tat = new_tat
+end
+return {allowed and 1 or 0, math.ceil(tat - now)}
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitDecision:
+    allowed: bool
+    limit: int
+    remaining: int
+    # Seconds until the whole limit is available again.
+    reset_after: float
+    # Seconds until the rejected request would be allowed; 0 if allowed.
+    retry_after: float
+
+
+def _decide(
+    *, allowed: bool, tat_offset: float, limit: int, units: int, period: float
+) -> RateLimitDecision:
+    interval = period / limit
+    return RateLimitDecision(
+        allowed=allowed,
+        limit=limit,
+        remaining=max(0, math.floor((period - tat_offset) / interval)),
+        reset_after=tat_offset,
+        retry_after=0.0 if allowed else tat_offset + units * interval - period,
+    )
+
+
+class RateLimiter(ABC):
+    """Decides whether `units` more requests fit within `limit` per period."""
+
+    period: float = PERIOD_SECONDS
+
+    @abstractmethod
+    async def acquire(
+        self, key: str, limit: int, units: int = 1, *, force: bool = False
+    ) -> RateLimitDecision:
+        """Take `units` from `key` if they fit, or unconditionally if `force`."""
+
+    async def close(self) -> None:  # noqa: B027 - optional hook
+        pass
+
+
+class StoreRateLimiter(RateLimiter):
+    """GCRA over a Litestar store.
+
+    Each decision reads and writes the key's TAT. That is atomic across
+    processes only with a `SharedMemoryStore`, which runs it under the key's
+    lock; otherwise use `RedisRateLimiter` to share limits between processes.
+    """
+
+    def __init__(self, store: Store, *, period: float = PERIOD_SECONDS) -> None:
+        self._store = store
+        self.period = period
+
+    async def acquire(
+        self, key: str, limit: int, units: int = 1, *, force: bool = False
+    ) -> RateLimitDecision:
+        now = time.time()
+
+        def take(raw: bytes | None) -> tuple[RateLimitDecision, bytes | None, int]:
+            tat = max(float(raw), now) if raw is not None else now
+            new_tat = tat + units * self.period / limit
+            allowed = force or new_tat - self.period <= now
+            decision = _decide(
+                allowed=allowed,
+                tat_offset=(new_tat if allowed else tat) - now,
+                limit=limit,
+                units=units,
+                period=self.period,
+            )
+            if not allowed:
+                return decision, None, 0
+            return decision, str(new_tat).encode(), max(1, math.ceil(new_tat - now))
+
+        if isinstance(self._store, SharedMemoryStore):
+            return await self._store.update(key, take)
+        decision, value, expires_in = take(await self._store.get(key))
+        if value is not None:
+            await self._store.set(key, value, expires_in=expires_in)
+        return decision
+
+
+class RedisRateLimiter(RateLimiter):
+    """GCRA in a Redis script: one atomic round trip per decision.
+
+    Every process and host using the same Redis shares each key's limit.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        *,
+        period: float = PERIOD_SECONDS,
+        prefix: str = "rate_limit:",
+    ) -> None:
+        self._redis = redis
+        self._script = redis.register_script(_GCRA_SCRIPT)
+        self._prefix = prefix
+        self.period = period
+
+    async def acquire(
+        self, key: str, limit: int, units: int = 1, *, force: bool = False
+    ) -> RateLimitDecision:
+        allowed, tat_offset_ms = await self._script(
+            keys=[self._prefix + key],
+            args=[limit, int(self.period * 1000), units, int(force)],
+        )
+        return _decide(
+            allowed=bool(allowed),
+            tat_offset=int(tat_offset_ms) / 1000,
+            limit=limit,
+            units=units,
+            period=self.period,
+        )
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+@dataclass(slots=True)
+class _LocalBudget:
+    limit: int
+    # Units this process may still admit without asking upstream.
+    budget: int
+    remaining: int
+    reset_after: float
+    # Units admitted locally and not yet charged upstream.
+    pending: int = 0
+
+
+class BatchingRateLimiter(RateLimiter):
+    """Admit requests for hot keys locally and charge them upstream in batches.
+
+    After `upstream` allows a request, this process may admit up to `share`
+    of the key's remaining units on its own. Every `interval` seconds the
+    units admitted meanwhile are charged upstream in one call per key, and
+    the local budget is refreshed from the result. Keys without local
+    admissions in an interval go back to asking upstream every time. With P
+    processes a key can be over-admitted by up to P x `share` of its
+    remaining units per interval; the excess is still charged, so later
+    requests wait for it.
+    """
+
+    def __init__(self, upstream: RateLimiter, *, interval: float, share: float) -> None:
+        self._upstream = upstream
+        self._interval = interval
+        self._share = share
+        self._budgets: dict[str, _LocalBudget] = {}
+        self._flusher: asyncio.Task[None] | None = None
+        self.period = upstream.period
+
+    async def acquire(
+        self, key: str, limit: int, units: int = 1, *, force: bool = False
+    ) -> RateLimitDecision:
+        local = self._budgets.get(key)
+        if local is not None and not force and local.budget >= units:
+            local.budget -= units
+            local.remaining -= units
+            local.pending += units
+            return RateLimitDecision(
+                allowed=True,
+                limit=limit,
+                remaining=max(local.remaining, 0),
+                reset_after=local.reset_after,
+                retry_after=0.0,
+            )
+
+        decision = await self._upstream.acquire(key, limit, units, force=force)
+        if decision.allowed:
+            self._refresh(key, decision)
+            if self._flusher is None or self._flusher.done():
+                self._flusher = asyncio.create_task(self._flush_periodically())
+        return decision
+
+    async def flush(self) -> None:
+        """Charge locally admitted units upstream and refresh local budgets."""
+        charges = {}
+        for key, local in list(self._budgets.items()):
+            if local.pending:
+                charges[key] = (local.limit, local.pending)
+                local.pending = local.budget = 0
+            else:
+                del self._budgets[key]
+        if not charges:
+            return
+
+        decisions = await asyncio.gather(
+            *(
+                self._upstream.acquire(key, limit, units, force=True)
+                for key, (limit, units) in charges.items()
+            )
+        )
+        for key, decision in zip(charges, decisions, strict=True):
+            if key in self._budgets:
+                self._refresh(key, decision)
+
+    async def close(self) -> None:
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        await self.flush()
+        await self._upstream.close()
+
+    def _refresh(self, key: str, decision: RateLimitDecision) -> None:
+        local = self._budgets.get(key)
+        if local is None:
+            local = self._budgets[key] = _LocalBudget(
+                limit=decision.limit, budget=0, remaining=0, reset_after=0
+            )
+        local.budget = math.floor(decision.remaining * self._share)
+        local.remaining = decision.remaining
+        local.reset_after = decision.reset_after
+
+    async def _flush_periodically(self) -> None:
+        while self._budgets:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Syncing rate limits upstream failed")
+
+
+def create_rate_limiter(store: Store) -> RateLimiter:
+    """The limiter `settings` ask for; `store` backs it without Redis."""
+    limiter: RateLimiter
+    if settings.rate_limit_redis_url:
+        limiter = RedisRateLimiter(Redis.from_url(settings.rate_limit_redis_url))
+    else:
+        limiter = StoreRateLimiter(store)
+    if settings.rate_limit_sync_interval_ms > 0:
+        limiter = BatchingRateLimiter(
+            limiter,
+            interval=settings.rate_limit_sync_interval_ms / 1000,
+            share=settings.rate_limit_local_share,
+        )
+    return limiter
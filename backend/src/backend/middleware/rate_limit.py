@@ -1,38 +1,106 @@
-from __future__ import annotations
-
-from litestar import Request
-from litestar.exceptions import NotAuthorizedException
-from litestar.middleware import DefineMiddleware
-from litestar.middleware.rate_limit import RateLimitConfig, get_remote_address
-from litestar.security.jwt import Token
-
+import math
+import re
+from collections.abc import AsyncIterator, Iterable, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import cache
+from typing import ClassVar, Self
+
+from litestar import Litestar, Request
+from litestar.datastructures import MutableScopeHeaders
+from litestar.enums import ScopeType
+from litestar.exceptions import TooManyRequestsException
+from litestar.middleware import AbstractMiddleware
+from litestar.middleware.rate_limit import get_remote_address
+from litestar.types import ASGIApp, Message, Receive, Scope, Scopes, Send
+
+from backend.auth.tokens import bearer_token
 from backend.config.base import settings
 
-_EXCLUDED_PATHS = {"/health", "/schema", "/admin"}
+from .limiters import RateLimitDecision, RateLimiter, StoreRateLimiter
+
+RATE_LIMIT_STORE = "rate_limit"
+# App state key of the app's `RateLimiter`.
+RATE_LIMITER = "rate_limiter"
+
+_EXCLUDED_PATHS = ("/health", "/metrics", "/schema", "/admin")
+_STATE_KEY = "rate_limit"
+
+
+@dataclass(frozen=True, slots=True)
+class RouteLimit:
+    """How requests under a path prefix count against the rate limit.
+
+    Each request consumes `weight` units. With a `limit`, the prefix gets a
+    counter of its own instead of sharing the caller's general one.
+    """
+
+    weight: int = 1
+    limit: int | None = None
+
+
+class PrefixMatcher:
+    """Longest-prefix lookup over a fixed set of path prefixes, as one regex."""
+
+    def __init__(self, prefixes: Iterable[str]) -> None:
+        # Alternatives are tried in order, so longer prefixes go first.
+        ordered = sorted(set(prefixes), key=len, reverse=True)
+        self._pattern = (
+            re.compile("|".join(map(re.escape, ordered))) if ordered else None
+        )
+
+    def match(self, path: str) -> str | None:
+        if self._pattern is None:
+            return None
+        match = self._pattern.match(path)
+        return match.group() if match else None
+
+
+class RateLimitPolicy:
+    def __init__(
+        self,
+        *,
+        anonymous_limit: int,
+        authenticated_limit: int,
+        routes: Mapping[str, RouteLimit] | None = None,
+        excluded: Iterable[str] = _EXCLUDED_PATHS,
+    ) -> None:
+        self.anonymous_limit = anonymous_limit
+        self.authenticated_limit = authenticated_limit
+        self.routes = dict(routes or {})
+        self.excluded = PrefixMatcher(excluded)
+        self.route_prefixes = PrefixMatcher(self.routes)
+
+    @classmethod
+    def from_settings(cls) -> Self:
+        prefixes = settings.rate_limit_route_weights.keys() | (
+            settings.rate_limit_route_limits.keys()
+        )
+        return cls(
+            anonymous_limit=settings.rate_limit_per_minute_anonymous,
+            authenticated_limit=settings.rate_limit_per_minute_authenticated,
+            routes={
+                prefix: RouteLimit(
+                    weight=settings.rate_limit_route_weights.get(prefix, 1),
+                    limit=settings.rate_limit_route_limits.get(prefix),
+                )
+                for prefix in prefixes
+            },
+        )
 
 
-def _get_cached_subject(request: Request) -> str | None:
-    cached = getattr(request.state, "rate_limit_subject", None)
-    if cached is not None:
-        return cached or None
+@cache
+def default_rate_limit_policy() -> RateLimitPolicy:
+    return RateLimitPolicy.from_settings()
 
-    subject: str | None = None
-    auth_header = request.headers.get("Authorization")
-    if auth_header:
-        parts = auth_header.split()
-        if len(parts) == 2 and parts[0].lower() == "bearer":
-            try:
-                token = Token.decode(
-                    encoded_token=parts[1],
-                    secret=settings.jwt_secret,
-                    algorithm="HS256",
-                )
-                subject = token.sub
-            except NotAuthorizedException, ValueError:
-                subject = None
 
-    request.state.rate_limit_subject = subject or ""
-    return subject
+@dataclass(frozen=True, slots=True)
+class _Counter:
+    """The single counter a request is checked against, and its cost."""
+
+    key: str
+    limit: int
+    weight: int
 
 
 def _is_admin_user(request: Request) -> bool:
@@ -41,41 +109,115 @@ def _is_admin_user(request: Request) -> bool:
     return "admin_user_id" in request.session
 
 
-def _is_path_excluded(request: Request) -> bool:
-    if _is_admin_user(request):
-        return True
-    path = request.url.path
-    return any(path.startswith(excluded_path) for excluded_path in _EXCLUDED_PATHS)
-
-
-def _is_authenticated(request: Request) -> bool:
-    if _is_path_excluded(request):
-        return False
-    return _get_cached_subject(request) is not None
+def _classify(request: Request, policy: RateLimitPolicy) -> _Counter | None:
+    """The request's counter, or None if it is not rate limited.
 
+    Computed once per request and kept in the scope state, where the
+    middleware and `charge_rate_limit` both read it.
+    """
+    state = request.state
+    if _STATE_KEY in state:
+        return state[_STATE_KEY]
 
-def _is_anonymous(request: Request) -> bool:
-    if _is_path_excluded(request):
-        return False
-    return _get_cached_subject(request) is None
-
-
-def _identifier_for_authenticated(request: Request) -> str:
-    subject = _get_cached_subject(request)
-    if subject:
-        return f"user:{subject}"
-    return get_remote_address(request)
-
-
-def get_rate_limit_middlewares() -> list[DefineMiddleware]:
-    anonymous_config = RateLimitConfig(
-        rate_limit=("minute", settings.rate_limit_per_minute_anonymous),
-        check_throttle_handler=_is_anonymous,
-        identifier_for_request=get_remote_address,
-    )
-    authenticated_config = RateLimitConfig(
-        rate_limit=("minute", settings.rate_limit_per_minute_authenticated),
-        check_throttle_handler=_is_authenticated,
-        identifier_for_request=_identifier_for_authenticated,
+    path = request.url.path
+    counter = None
+    if policy.excluded.match(path) is None and not _is_admin_user(request):
+        token = bearer_token(request)
+        if token is not None and token.sub:
+            identifier = f"user:{token.sub}"
+            limit = policy.authenticated_limit
+        else:
+            identifier = get_remote_address(request)
+            limit = policy.anonymous_limit
+
+        prefix = policy.route_prefixes.match(path)
+        route = policy.routes[prefix] if prefix is not None else RouteLimit()
+        if prefix is not None and route.limit is not None:
+            counter = _Counter(f"{identifier}:{prefix}", route.limit, route.weight)
+        else:
+            counter = _Counter(identifier, limit, route.weight)
+
+    state[_STATE_KEY] = counter
+    return counter
+
+
+def rate_limiter(app: Litestar) -> RateLimiter:
+    """The app's limiter; by default GCRA over its `rate_limit` store."""
+    limiter = app.state.get(RATE_LIMITER)
+    if limiter is None:
+        limiter = StoreRateLimiter(app.stores.get(RATE_LIMIT_STORE))
+        app.state[RATE_LIMITER] = limiter
+    return limiter
+
+
+@asynccontextmanager
+async def rate_limiting(app: Litestar) -> AsyncIterator[None]:
+    """Flush and close the app's rate limiter on shutdown."""
+    try:
+        yield
+    finally:
+        await rate_limiter(app).close()
+
+
+def _headers(limiter: RateLimiter, decision: RateLimitDecision) -> dict[str, str]:
+    headers = {
+        "RateLimit-Policy": f"{decision.limit}; w={limiter.period:g}",
+        "RateLimit-Limit": str(decision.limit),
+        "RateLimit-Remaining": str(decision.remaining),
+        "RateLimit-Reset": str(math.ceil(decision.reset_after)),
+    }
+    if not decision.allowed:
+        headers["Retry-After"] = str(math.ceil(decision.retry_after))
+    return headers
+
+
+class RateLimitMiddleware(AbstractMiddleware):
+    """Check each request against a single counter of the app's `rate_limiter`.
+
+    Requests are classified once: excluded paths and admin sessions are not
+    limited, authenticated callers are counted per user and anonymous ones
+    per address, and `RouteLimit`s set the weight or a separate counter for
+    a path prefix.
+    """
+
+    scopes: ClassVar[Scopes] = {ScopeType.HTTP}
+
+    def __init__(self, app: ASGIApp, policy: RateLimitPolicy | None = None) -> None:
+        super().__init__(app)
+        self.policy = policy or default_rate_limit_policy()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        request: Request = Request(scope)
+        counter = _classify(request, self.policy)
+        if counter is None:
+            await self.app(scope, receive, send)
+            return
+
+        limiter = rate_limiter(Litestar.from_scope(scope))
+        decision = await limiter.acquire(counter.key, counter.limit, counter.weight)
+        headers = _headers(limiter, decision)
+        if not decision.allowed:
+            raise TooManyRequestsException(headers=headers)
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableScopeHeaders.from_message(message).update(headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+async def charge_rate_limit(request: Request, units: int) -> bool:
+    """Consume `units` extra requests from the caller's rate limit window.
+
+    Returns False, without charging anything, when the window cannot afford it.
+    """
+    if units <= 0:
+        return True
+    counter = _classify(request, default_rate_limit_policy())
+    if counter is None:
+        return True
+    decision = await rate_limiter(request.app).acquire(
+        counter.key, counter.limit, units
     )
-    return [anonymous_config.middleware, authenticated_config.middleware]
+    return decision.allowed
@@ -0,0 +1,186 @@
+import argparse
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from argon2 import PasswordHasher
+from rich.console import Console
+from rich.table import Table
+
+from backend.config.base import settings
+
+MEMORY_COSTS_MIB = (19, 32, 46, 64, 128, 256)
+MAX_TIME_COST = 8
+SAMPLE_INPUT = "correct horse battery staple"  # hashed for timing only
+
+
+@dataclass(frozen=True)
+class Measurement:
+    time_cost: int
+    memory_cost: int  # KiB
+    parallelism: int
+    verify_ms: float
+    logins_per_second: float
+
+    @property
+    def strength(self) -> int:
+        return self.time_cost * self.memory_cost
+
+
+def _measure(
+    *,
+    time_cost: int,
+    memory_cost: int,
+    parallelism: int,
+    workers: int,
+    samples: int,
+) -> Measurement:
+    hasher = PasswordHasher(
+        time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism
+    )
+    password_hash = hasher.hash(SAMPLE_INPUT)
+
+    durations = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        hasher.verify(password_hash, SAMPLE_INPUT)
+        durations.append(time.perf_counter() - started)
+
+    # Throughput with every worker thread busy, as under a login burst.
+    verifications = workers * samples
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        started = time.perf_counter()
+        list(
+            executor.map(
+                lambda _: hasher.verify(password_hash, SAMPLE_INPUT),
+                range(verifications),
+            )
+        )
+        elapsed = time.perf_counter() - started
+
+    return Measurement(
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=parallelism,
+        verify_ms=statistics.median(durations) * 1000,
+        logins_per_second=verifications / elapsed,
+    )
+
+
+def _calibrate(
+    *, target_ms: float, parallelism: int, workers: int, samples: int
+) -> list[Measurement]:
+    measurements = []
+    for memory_mib in MEMORY_COSTS_MIB:
+        for time_cost in range(1, MAX_TIME_COST + 1):
+            measurement = _measure(
+                time_cost=time_cost,
+                memory_cost=memory_mib * 1024,
+                parallelism=parallelism,
+                workers=workers,
+                samples=samples,
+            )
+            measurements.append(measurement)
+            # More passes only get slower; move on to the next memory size.
+            if measurement.verify_ms > target_ms:
+                break
+    return measurements
+
+
+def main() -> None:
+    console = Console()
+    parser = argparse.ArgumentParser(
+        description=(
+            "Benchmark argon2id parameters on this host and recommend the "
+            "strongest profile meeting a verify latency and throughput target."
+        )
+    )
+    parser.add_argument(
+        "--target-ms",
+        type=float,
+        default=250.0,
+        help="Highest acceptable median verify time, in milliseconds",
+    )
+    parser.add_argument(
+        "--min-logins-per-second",
+        type=float,
+        default=20.0,
+        help="Lowest acceptable verify throughput of one worker process",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.password_hashing_workers,
+        help="Hashing threads per process (PASSWORD_HASHING_WORKERS)",
+    )
+    parser.add_argument(
+        "--parallelism",
+        type=int,
+        default=settings.password_hash_parallelism,
+        help="argon2 lanes (PASSWORD_HASH_PARALLELISM)",
+    )
+    parser.add_argument(
+        "--samples", type=int, default=5, help="Verifications per measurement"
+    )
+    args = parser.parse_args()
+
+    console.print(
+        f"Calibrating on {os.cpu_count()} CPUs with {args.workers} hashing threads."
+    )
+    with console.status("Measuring argon2id parameters..."):
+        measurements = _calibrate(
+            target_ms=args.target_ms,
+            parallelism=args.parallelism,
+            workers=args.workers,
+            samples=args.samples,
+        )
+
+    eligible = [
+        m
+        for m in measurements
+        if m.verify_ms <= args.target_ms
+        and m.logins_per_second >= args.min_logins_per_second
+    ]
+    recommended = max(eligible, key=lambda m: m.strength, default=None)
+
+    table = Table(title="argon2id candidates")
+    table.add_column("time_cost", justify="right")
+    table.add_column("memory (MiB)", justify="right")
+    table.add_column("verify p50 (ms)", justify="right")
+    table.add_column("logins/s", justify="right")
+    for m in measurements:
+        style = None
+        if m is recommended:
+            style = "bold green"
+        elif m not in eligible:
+            style = "dim"
+        table.add_row(
+            str(m.time_cost),
+            str(m.memory_cost // 1024),
+            f"{m.verify_ms:.1f}",
+            f"{m.logins_per_second:.0f}",
+            style=style,
+        )
+    console.print(table)
+
+    if recommended is None:
+        console.print(
+            "[red]No candidate meets the targets;[/red] "
+            "relax --target-ms or --min-logins-per-second, or add hashing threads."
+        )
+        raise SystemExit(1)
+
+    console.print("[green]Recommended profile:[/green]")
+    console.print(f"PASSWORD_HASH_TIME_COST={recommended.time_cost}")
+    console.print(f"PASSWORD_HASH_MEMORY_COST={recommended.memory_cost}")
+    console.print(f"PASSWORD_HASH_PARALLELISM={recommended.parallelism}")
+    console.print(
+        "Existing hashes are upgraded to the new profile as users log in.",
+        style="dim",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,12 @@
 import argparse
 import asyncio
 
-from argon2 import PasswordHasher
 from rich.console import Console
 from rich.prompt import Prompt
 from sqlalchemy import select
 
 from backend.apps.users.models import UserModel
+from backend.auth.passwords import passwords
 from backend.config.alchemy import alchemy_config
 
 
@@ -29,11 +29,10 @@ async def _create_admin(*, email: str, password: str) -> bool:
         if existing:
             return False
 
-        ph = PasswordHasher()
         session.add(
             UserModel(
                 email=email,
-                password_hash=ph.hash(password),
+                password_hash=await passwords.hash(password),
                 first_name="",
                 last_name="",
                 is_admin=True,
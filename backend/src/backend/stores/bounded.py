@@ -0,0 +1,156 @@
+import sys
+import time
+from array import array
+from datetime import timedelta
+
+from litestar.stores.base import Store
+
+
+def _seconds(duration: int | timedelta) -> float:
+    return duration.total_seconds() if isinstance(duration, timedelta) else duration
+
+
+class BoundedMemoryStore(Store):
+    """An in-process store that never holds more than `max_entries` keys.
+
+    Entries live in a preallocated slot table of parallel arrays (keys,
+    values, expiry times and reference bits) with a dict from key to slot,
+    rather than one storage object per key. When the table is full, a CLOCK
+    hand picks the slot to reuse: it skips each slot read or written since
+    its last pass once, and takes the first expired or unreferenced one.
+    Every write also sweeps a few slots ahead of a separate cursor and frees
+    the expired ones, so dead entries are reclaimed without full scans.
+
+    Every operation completes without awaiting, so it is atomic for the
+    event loop without a lock.
+    """
+
+    def __init__(self, max_entries: int, *, sweep_step: int = 8) -> None:
+        self._capacity = max_entries
+        self._sweep_step = sweep_step
+        self.evictions = 0
+        self._reset()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __bool__(self) -> bool:
+        # `StoreRegistry.get` replaces falsy stores with a default one.
+        return True
+
+    @property
+    def memory_usage(self) -> int:
+        """Approximate bytes held by the table and its keys and values."""
+        return (
+            sys.getsizeof(self._slots)
+            + sys.getsizeof(self._keys)
+            + sys.getsizeof(self._values)
+            + sys.getsizeof(self._expires_at)
+            + sys.getsizeof(self._referenced)
+            + sys.getsizeof(self._free)
+            + self._payload_bytes
+        )
+
+    async def set(
+        self, key: str, value: str | bytes, expires_in: int | timedelta | None = None
+    ) -> None:
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        now = time.monotonic()
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._allocate(now)
+            self._slots[key] = slot
+            self._keys[slot] = key
+            self._payload_bytes += sys.getsizeof(key)
+        else:
+            self._payload_bytes -= sys.getsizeof(self._values[slot])
+        self._values[slot] = value
+        self._payload_bytes += sys.getsizeof(value)
+        self._expires_at[slot] = now + _seconds(expires_in) if expires_in else 0.0
+        self._referenced[slot] = 1
+        self._sweep(now)
+
+    async def get(
+        self, key: str, renew_for: int | timedelta | None = None
+    ) -> bytes | None:
+        slot = self._live_slot(key)
+        if slot is None:
+            return None
+        self._referenced[slot] = 1
+        if renew_for and self._expires_at[slot]:
+            self._expires_at[slot] = time.monotonic() + _seconds(renew_for)
+        return self._values[slot]
+
+    async def delete(self, key: str) -> None:
+        slot = self._slots.get(key)
+        if slot is not None:
+            self._release(slot)
+
+    async def delete_all(self) -> None:
+        self._reset()
+
+    async def exists(self, key: str) -> bool:
+        return self._live_slot(key) is not None
+
+    async def expires_in(self, key: str) -> int | None:
+        slot = self._live_slot(key)
+        if slot is None or not self._expires_at[slot]:
+            return None
+        return int(self._expires_at[slot] - time.monotonic())
+
+    def _reset(self) -> None:
+        capacity = self._capacity
+        self._slots: dict[str, int] = {}
+        self._keys: list[str | None] = [None] * capacity
+        self._values: list[bytes | None] = [None] * capacity
+        # Monotonic expiry time per slot; 0 means no expiry.
+        self._expires_at = array("d", bytes(8 * capacity))
+        self._referenced = bytearray(capacity)
+        self._free = array("q", range(capacity - 1, -1, -1))
+        self._hand = 0
+        self._sweeper = 0
+        self._payload_bytes = 0
+
+    def _expired(self, slot: int, now: float) -> bool:
+        expires_at = self._expires_at[slot]
+        return 0 < expires_at <= now
+
+    def _live_slot(self, key: str) -> int | None:
+        slot = self._slots.get(key)
+        if slot is not None and self._expired(slot, time.monotonic()):
+            self._release(slot)
+            return None
+        return slot
+
+    def _release(self, slot: int) -> None:
+        key = self._keys[slot]
+        del self._slots[key]  # type: ignore[arg-type]
+        self._payload_bytes -= sys.getsizeof(key) + sys.getsizeof(self._values[slot])
+        self._keys[slot] = None
+        self._values[slot] = None
+        self._expires_at[slot] = 0.0
+        self._referenced[slot] = 0
+        self._free.append(slot)
+
+    def _allocate(self, now: float) -> int:
+        if not self._free:
+            # CLOCK: at most two turns, since the first clears every bit.
+            while True:
+                slot = self._hand
+                self._hand = (slot + 1) % self._capacity
+                if self._referenced[slot] and not self._expired(slot, now):
+                    self._referenced[slot] = 0
+                    continue
+                if not self._expired(slot, now):
+                    self.evictions += 1
+                self._release(slot)
+                break
+        return self._free.pop()
+
+    def _sweep(self, now: float) -> None:
+        for _ in range(min(self._sweep_step, self._capacity)):
+            slot = self._sweeper
+            self._sweeper = (slot + 1) % self._capacity
+            if self._keys[slot] is not None and self._expired(slot, now):
+                self._release(slot)
@@ -0,0 +1,247 @@
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+
+from litestar.stores.base import Store
+
+from backend.config.base import settings
+
+_MAGIC = b"novashm1"
+_HEADER = struct.Struct("<8sIIII")
+_HEADER_SIZE = 64
+# State, key length, value length, key hash, expiry time (0 for none) and last
+# access time, followed by the key and value areas.
+_SLOT = struct.Struct("<BxHIQdd")
+_EMPTY = 0
+_USED = 1
+
+type Update[T] = Callable[
+    [bytes | None], tuple[T, bytes | None, int | timedelta | None]
+]
+
+
+def _hash(key: bytes) -> int:
+    # Stable across processes, unlike `hash()`.
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest())
+
+
+def _seconds(duration: int | timedelta) -> float:
+    return duration.total_seconds() if isinstance(duration, timedelta) else duration
+
+
+class SharedMemoryStore(Store):
+    """A store in a memory-mapped file, shared by every process that opens it.
+
+    The file holds a fixed hash table of `buckets` x `bucket_slots` slots,
+    each with room for a `max_key_size` key and a `max_value_size` value. A
+    key only ever lives in the bucket its hash picks, so an operation locks
+    just that bucket, with an `fcntl` byte-range lock that a crashed process
+    cannot leave held. A full bucket reuses an expired slot, or else its
+    least recently used one. Values too large for a slot are not stored, as
+    if evicted at once.
+
+    Put the file on a RAM-backed filesystem such as `/dev/shm`. Opening a
+    file laid out with other dimensions resets it.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        buckets: int = 4096,
+        bucket_slots: int = 8,
+        max_key_size: int = 128,
+        max_value_size: int = 128,
+    ) -> None:
+        self._buckets = buckets
+        self._key_size = max_key_size
+        self._value_size = max_value_size
+        self._slot_size = -(-(_SLOT.size + max_key_size + max_value_size) // 8) * 8
+        self._bucket_size = self._slot_size * bucket_slots
+        size = _HEADER_SIZE + self._bucket_size * buckets
+        self.rejected = 0
+
+        header = _HEADER.pack(
+            _MAGIC, buckets, bucket_slots, max_key_size, max_value_size
+        )
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        with self._locked(0):
+            if (
+                os.fstat(self._fd).st_size != size
+                or os.pread(self._fd, _HEADER.size, 0) != header
+            ):
+                os.ftruncate(self._fd, 0)
+                os.ftruncate(self._fd, size)
+                os.pwrite(self._fd, header, 0)
+        self._map = mmap.mmap(self._fd, size)
+
+    def close(self) -> None:
+        self._map.close()
+        os.close(self._fd)
+
+    async def set(
+        self, key: str, value: str | bytes, expires_in: int | timedelta | None = None
+    ) -> None:
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        await self.update(key, lambda _: (None, value, expires_in))
+
+    async def get(
+        self, key: str, renew_for: int | timedelta | None = None
+    ) -> bytes | None:
+        encoded = key.encode()
+        key_hash = _hash(encoded)
+        bucket = self._bucket(key_hash)
+        now = time.time()
+        with self._locked(bucket):
+            slot = self._find(bucket, encoded, key_hash, now)
+            if slot is None:
+                return None
+            _, key_len, value_len, _, expires_at, _ = _SLOT.unpack_from(self._map, slot)
+            if renew_for and expires_at:
+                expires_at = now + _seconds(renew_for)
+            _SLOT.pack_into(
+                self._map, slot, _USED, key_len, value_len, key_hash, expires_at, now
+            )
+            return self._value(slot, value_len)
+
+    async def update[T](self, key: str, update: Update[T]) -> T:
+        """Atomically replace `key`'s value with what `update` makes of it.
+
+        `update` gets the current value (or None) and returns its result, the
+        new value (or None to leave the key unchanged) and its expiry. It runs
+        with the key's bucket locked, so it must be quick.
+        """
+        encoded = key.encode()
+        key_hash = _hash(encoded)
+        bucket = self._bucket(key_hash)
+        now = time.time()
+        with self._locked(bucket):
+            slot = self._find(bucket, encoded, key_hash, now)
+            current = None
+            if slot is not None:
+                value_len = _SLOT.unpack_from(self._map, slot)[2]
+                current = self._value(slot, value_len)
+            result, value, expires_in = update(current)
+            if value is None:
+                return result
+            if len(encoded) > self._key_size or len(value) > self._value_size:
+                self.rejected += 1
+                if slot is not None:
+                    self._clear(slot)
+                return result
+            if slot is None:
+                slot = self._victim(bucket, now)
+            expires_at = now + _seconds(expires_in) if expires_in else 0.0
+            base = slot + _SLOT.size
+            self._map[base : base + len(encoded)] = encoded
+            base += self._key_size
+            self._map[base : base + len(value)] = value
+            _SLOT.pack_into(
+                self._map,
+                slot,
+                _USED,
+                len(encoded),
+                len(value),
+                key_hash,
+                expires_at,
+                now,
+            )
+            return result
+
+    async def delete(self, key: str) -> None:
+        encoded = key.encode()
+        key_hash = _hash(encoded)
+        bucket = self._bucket(key_hash)
+        with self._locked(bucket):
+            slot = self._find(bucket, encoded, key_hash, time.time())
+            if slot is not None:
+                self._clear(slot)
+
+    async def delete_all(self) -> None:
+        empty = bytes(self._bucket_size)
+        for index in range(self._buckets):
+            bucket = _HEADER_SIZE + index * self._bucket_size
+            with self._locked(bucket):
+                self._map[bucket : bucket + self._bucket_size] = empty
+
+    async def exists(self, key: str) -> bool:
+        encoded = key.encode()
+        key_hash = _hash(encoded)
+        bucket = self._bucket(key_hash)
+        with self._locked(bucket):
+            return self._find(bucket, encoded, key_hash, time.time()) is not None
+
+    async def expires_in(self, key: str) -> int | None:
+        encoded = key.encode()
+        key_hash = _hash(encoded)
+        bucket = self._bucket(key_hash)
+        now = time.time()
+        with self._locked(bucket):
+            slot = self._find(bucket, encoded, key_hash, now)
+            if slot is None:
+                return None
+            expires_at = _SLOT.unpack_from(self._map, slot)[4]
+            return int(expires_at - now) if expires_at else None
+
+    @contextmanager
+    def _locked(self, offset: int) -> Iterator[None]:
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, offset)
+        try:
+            yield
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, offset)
+
+    def _bucket(self, key_hash: int) -> int:
+        return _HEADER_SIZE + (key_hash % self._buckets) * self._bucket_size
+
+    def _slots(self, bucket: int) -> range:
+        return range(bucket, bucket + self._bucket_size, self._slot_size)
+
+    def _value(self, slot: int, value_len: int) -> bytes:
+        start = slot + _SLOT.size + self._key_size
+        return self._map[start : start + value_len]
+
+    def _clear(self, slot: int) -> None:
+        self._map[slot] = _EMPTY
+
+    def _find(self, bucket: int, key: bytes, key_hash: int, now: float) -> int | None:
+        for slot in self._slots(bucket):
+            state, key_len, _, slot_hash, expires_at, _ = _SLOT.unpack_from(
+                self._map, slot
+            )
+            if state != _USED or slot_hash != key_hash or key_len != len(key):
+                continue
+            start = slot + _SLOT.size
+            if self._map[start : start + key_len] != key:
+                continue
+            if 0 < expires_at <= now:
+                self._clear(slot)
+                return None
+            return slot
+        return None
+
+    def _victim(self, bucket: int, now: float) -> int:
+        victim, oldest_access = bucket, None
+        for slot in self._slots(bucket):
+            state, _, _, _, expires_at, accessed_at = _SLOT.unpack_from(self._map, slot)
+            if state != _USED or 0 < expires_at <= now:
+                return slot
+            if oldest_access is None or accessed_at < oldest_access:
+                victim, oldest_access = slot, accessed_at
+        return victim
+
+
+def host_shared_store(name: str, default: Callable[[], Store], **layout: int) -> Store:
+    """`name`'s store, shared by this host's workers if `SHARED_STORE_DIR` is set."""
+    if settings.shared_store_dir is None:
+        return default()
+    settings.shared_store_dir.mkdir(parents=True, exist_ok=True)
+    return SharedMemoryStore(settings.shared_store_dir / name, **layout)
@@ -3,6 +3,10 @@ from unittest.mock import ANY
 from strawberry.relay.utils import to_base64
 
 from backend.apps.users.models import UserModel
+from backend.apps.users.refresh_tokens import (
+    InvalidRefreshTokenError as InvalidRefreshTokenServiceError,
+)
+from backend.apps.users.refresh_tokens import RefreshedUser
 from backend.apps.users.services import (
     InvalidCredentialsError as InvalidCredentialsServiceError,
 )
@@ -304,6 +308,49 @@ class TestUserMutations:
             password="WrongPassword",
         )
 
+    async def test_refresh(self, graphql_client, db_session_mock, mocker):
+        rotate = mocker.patch(
+            "backend.apps.users.graphql.mutations.rotate_refresh_token",
+            return_value=(RefreshedUser(1, "test@example.com", False), "next"),
+        )
+
+        mutation = """
+        mutation Refresh($refreshToken: String!) {
+            refresh(refreshToken: $refreshToken) {
+                token
+                refreshToken
+            }
+        }
+        """
+        result = await graphql_client.mutation(
+            mutation, variables={"refreshToken": "spent"}
+        )
+
+        assert "errors" not in result
+        assert result["data"]["refresh"]["token"]
+        assert result["data"]["refresh"]["refreshToken"] == "next"
+        rotate.assert_awaited_once_with(db_session_mock, "spent")
+
+    async def test_refresh_invalid_token(self, graphql_client, mocker):
+        mocker.patch(
+            "backend.apps.users.graphql.mutations.rotate_refresh_token",
+            side_effect=InvalidRefreshTokenServiceError(),
+        )
+
+        mutation = """
+        mutation Refresh($refreshToken: String!) {
+            refresh(refreshToken: $refreshToken) {
+                token
+            }
+        }
+        """
+        result = await graphql_client.mutation(
+            mutation, variables={"refreshToken": "spent"}
+        )
+
+        assert result["errors"][0]["message"] == "Invalid refresh token"
+        assert result["errors"][0]["extensions"]["code"] == "INVALID_REFRESH_TOKEN"
+
     async def test_soft_delete_current_user(
         self,
         graphql_client,
@@ -1,8 +1,33 @@
+import datetime
+
+from advanced_alchemy.filters import LimitOffset
 from strawberry.relay.utils import to_base64
 
 from backend.apps.users.models import UserModel
 
 
+def _make_users(count: int) -> list[UserModel]:
+    now = datetime.datetime.now(datetime.UTC)
+    users = []
+    for i in range(count):
+        u = UserModel(
+            email=f"user{i}@example.com",
+            password_hash="hashed",
+            first_name=f"First{i}",
+            last_name=f"Last{i}",
+        )
+        u.id = i + 1
+        u.created_at = now - datetime.timedelta(minutes=i)
+        users.append(u)
+    return users
+
+
+def _limit_of(list_call) -> int:
+    limits = [f.limit for f in list_call.args if isinstance(f, LimitOffset)]
+    assert len(limits) == 1
+    return limits[0]
+
+
 class TestUserPagination:
     async def test_users_pagination(
         self,
@@ -10,18 +35,7 @@ class TestUserPagination:
         graphql_client,
         mocker,
     ):
-        # Setup mock data
-        users = []
-        for i in range(5):
-            u = UserModel(
-                email=f"user{i}@example.com",
-                password_hash="hashed",
-                first_name=f"First{i}",
-                last_name=f"Last{i}",
-            )
-            u.id = i + 1
-            users.append(u)
-
+        users = _make_users(5)
         user_service_mock.list = mocker.AsyncMock(return_value=users)
 
         query = """
@@ -53,6 +67,147 @@ class TestUserPagination:
         assert first_id != "1"
         assert to_base64("UserType", "1") == first_id
 
+        # Pagination is pushed down to SQL: one row beyond the page is fetched.
+        assert _limit_of(user_service_mock.list.call_args) == 4
+
+    async def test_users_pagination_after_cursor(
+        self,
+        user_service_mock,
+        graphql_client,
+        mocker,
+    ):
+        users = _make_users(5)
+        user_service_mock.list = mocker.AsyncMock(return_value=users[:3])
+
+        query = """
+        query GetUsers($after: String) {
+            users(first: 2, after: $after) {
+                edges {
+                    cursor
+                    node {
+                        email
+                    }
+                }
+                pageInfo {
+                    hasNextPage
+                    hasPreviousPage
+                    endCursor
+                }
+            }
+        }
+        """
+
+        first_page = await graphql_client.query(query)
+        assert "errors" not in first_page
+        page_info = first_page["data"]["users"]["pageInfo"]
+        assert page_info["hasNextPage"] is True
+        assert page_info["hasPreviousPage"] is False
+
+        user_service_mock.list = mocker.AsyncMock(return_value=users[2:5])
+        second_page = await graphql_client.query(
+            query, variables={"after": page_info["endCursor"]}
+        )
+
+        assert "errors" not in second_page
+        data = second_page["data"]["users"]
+        assert [e["node"]["email"] for e in data["edges"]] == [
+            "user2@example.com",
+            "user3@example.com",
+        ]
+        assert data["pageInfo"]["hasNextPage"] is True
+        assert data["pageInfo"]["hasPreviousPage"] is True
+        # Soft-delete filter plus the keyset predicate derived from the cursor.
+        call = user_service_mock.list.call_args
+        assert len([f for f in call.args if not isinstance(f, LimitOffset)]) == 2
+        assert _limit_of(call) == 3
+
+    async def test_users_pagination_last(
+        self,
+        user_service_mock,
+        graphql_client,
+        mocker,
+    ):
+        users = _make_users(5)
+        # Backward pagination reads oldest first and reverses the page.
+        user_service_mock.list = mocker.AsyncMock(
+            return_value=list(reversed(users))[:3]
+        )
+
+        query = """
+        query GetUsers {
+            users(last: 2) {
+                edges {
+                    node {
+                        email
+                    }
+                }
+                pageInfo {
+                    hasNextPage
+                    hasPreviousPage
+                }
+            }
+        }
+        """
+
+        result = await graphql_client.query(query)
+
+        assert "errors" not in result
+        data = result["data"]["users"]
+        assert [e["node"]["email"] for e in data["edges"]] == [
+            "user3@example.com",
+            "user4@example.com",
+        ]
+        assert data["pageInfo"]["hasPreviousPage"] is True
+        assert data["pageInfo"]["hasNextPage"] is False
+
+    async def test_users_pagination_invalid_cursor(
+        self,
+        user_service_mock,
+        graphql_client,
+        mocker,
+    ):
+        user_service_mock.list = mocker.AsyncMock(return_value=[])
+
+        query = """
+        query GetUsers {
+            users(first: 2, after: "not-a-cursor") {
+                edges {
+                    cursor
+                }
+            }
+        }
+        """
+
+        result = await graphql_client.query(query)
+
+        assert "errors" in result
+        assert result["errors"][0]["message"] == "Invalid cursor."
+        user_service_mock.list.assert_not_called()
+
+    async def test_users_pagination_page_size_too_large(
+        self,
+        user_service_mock,
+        graphql_client,
+        mocker,
+    ):
+        user_service_mock.list = mocker.AsyncMock(return_value=[])
+
+        query = """
+        query GetUsers {
+            users(first: 101) {
+                edges {
+                    cursor
+                }
+            }
+        }
+        """
+
+        result = await graphql_client.query(query)
+
+        assert "errors" in result
+        assert "cannot be higher than 100" in result["errors"][0]["message"]
+        user_service_mock.list.assert_not_called()
+
     async def test_node_query(
         self,
         user_service_mock,
@@ -66,7 +221,7 @@ class TestUserPagination:
         )
         mock_user.id = 1
 
-        # list() is called by resolve_nodes with id__in=[1]
+        # list() is called by resolve_nodes with `UserModel.id.in_([1])`
         user_service_mock.list = mocker.AsyncMock(return_value=[mock_user])
 
         # Calculate expected Global ID
@@ -92,5 +247,5 @@ class TestUserPagination:
 
         # Verify user_service.list was called
         user_service_mock.list.assert_called_once()
-        call_kwargs = user_service_mock.list.call_args.kwargs
-        assert call_kwargs.get("id__in") == [1]
+        (id_filter,) = user_service_mock.list.call_args.args
+        assert id_filter.compare(UserModel.id.in_([1]))
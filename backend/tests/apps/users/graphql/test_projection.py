@@ -0,0 +1,65 @@
+import pytest
+from strawberry.relay.utils import to_base64
+
+from backend.apps.users.models import UserModel
+from backend.graphql.context import GraphQLContext, Services
+from backend.graphql.schema import schema
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+async def viewer(db_session) -> UserModel:
+    user = UserModel(
+        email="projection@example.com",
+        password_hash="hash",
+        first_name="Projected",
+        last_name="User",
+    )
+    db_session.add(user)
+    await db_session.commit()
+    await db_session.refresh(user)
+    return user
+
+
+async def test_node_lookup_selects_only_requested_columns(
+    db_session, viewer, sql_statements
+):
+    db_session.expunge_all()
+    sql_statements.clear()
+    context = GraphQLContext(db_session=db_session, services=Services(db_session))
+
+    result = await schema.execute(
+        "query ($id: ID!) { node(id: $id) { ... on UserType { email } } }",
+        variable_values={"id": to_base64("UserType", viewer.id)},
+        context_value=context,
+    )
+
+    assert result.errors is None
+    assert result.data == {"node": {"email": "projection@example.com"}}
+    (statement,) = sql_statements
+    assert "email" in statement
+    assert "password_hash" not in statement
+    assert "first_name" not in statement
+
+
+async def test_connection_selects_only_requested_columns(
+    db_session, viewer, sql_statements
+):
+    db_session.expunge_all()
+    sql_statements.clear()
+    context = GraphQLContext(
+        db_session=db_session, services=Services(db_session), user=viewer
+    )
+
+    result = await schema.execute(
+        "{ users(first: 10) { edges { node { firstName } } } }",
+        context_value=context,
+    )
+
+    assert result.errors is None
+    assert result.data is not None
+    assert {"node": {"firstName": "Projected"}} in result.data["users"]["edges"]
+    (statement,) = [s for s in sql_statements if "FROM" in s.upper()]
+    assert "password_hash" not in statement
+    assert "email" not in statement
@@ -87,7 +87,8 @@ class TestUserQueries:
         }
 
         user_service_mock.list.assert_called_once()
-        assert user_service_mock.list.call_args.kwargs.get("id__in") == [1]
+        (id_filter,) = user_service_mock.list.call_args.args
+        assert id_filter.compare(UserModel.id.in_([1]))
 
     async def test_get_user_by_global_id_unauthenticated(
         self,
@@ -132,4 +133,43 @@ class TestUserQueries:
         assert "errors" in result
         assert result["errors"][0]["message"] == "User not found"
 
+    async def test_user_lookups_are_batched_and_deduplicated(
+        self,
+        user_service_mock,
+        graphql_client,
+        mocker,
+    ):
+        users = []
+        for i in (1, 2):
+            user = UserModel(
+                email=f"user{i}@example.com",
+                first_name="Test",
+                last_name="User",
+            )
+            user.id = i
+            users.append(user)
+        user_service_mock.list = mocker.AsyncMock(return_value=users)
+
+        query = """
+        query Lookups($a: ID!, $b: ID!) {
+            first: userById(id: $a) { email }
+            again: userById(id: $a) { email }
+            second: userById(id: $b) { email }
+            viaNode: node(id: $b) { id }
+        }
+        """
+        variables = {
+            "a": to_base64("UserType", "1"),
+            "b": to_base64("UserType", "2"),
+        }
+        result = await graphql_client.query(query, variables=variables)
+
+        assert "errors" not in result
+        assert result["data"]["first"]["email"] == "user1@example.com"
+        assert result["data"]["again"]["email"] == "user1@example.com"
+        assert result["data"]["second"]["email"] == "user2@example.com"
+        user_service_mock.list.assert_called_once()
+        (id_filter,) = user_service_mock.list.call_args.args
+        assert sorted(id_filter.right.value) == [1, 2]
+
     # Note: legacy `user(id: ID!)` query was removed in favor of Relay Global IDs.
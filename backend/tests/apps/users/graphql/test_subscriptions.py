@@ -0,0 +1,85 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from litestar import Litestar
+from litestar.datastructures.state import State
+from litestar.testing import RequestFactory
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.apps.users.models import UserModel
+from backend.apps.users.notifications import asyncpg_dsn, user_changes
+from backend.apps.users.services import UserService
+from backend.graphql.context import GraphQLContext, Services
+from backend.graphql.schema import schema
+
+pytestmark = pytest.mark.integration
+
+USER_UPDATED = "subscription { userUpdated { firstName email } }"
+
+
+@pytest.fixture
+async def listening(db_engine):
+    user_changes.configure(asyncpg_dsn(db_engine.url))
+    try:
+        yield user_changes
+    finally:
+        await user_changes.close()
+
+
+def _context(db_sessionmaker, user_id: int | None, mocker) -> GraphQLContext:
+    # Subscriptions never touch the websocket's own session.
+    db_session = mocker.Mock(spec=AsyncSession)
+    alchemy_config = SimpleNamespace(get_session=db_sessionmaker)
+    app = Litestar(state=State({"alchemy_config": alchemy_config}))
+    return GraphQLContext(
+        request=RequestFactory(app=app).get("/graphql"),
+        db_session=db_session,
+        services=Services(db_session),
+        user_id=user_id,
+    )
+
+
+async def test_user_updated_streams_the_viewers_changes(
+    listening, db_session, db_sessionmaker, mocker
+) -> None:
+    user = UserModel(
+        email="subscriber@example.com",
+        password_hash="hash",
+        first_name="Before",
+        last_name="User",
+    )
+    db_session.add(user)
+    await db_session.commit()
+
+    events = await schema.subscribe(
+        USER_UPDATED, context_value=_context(db_sessionmaker, user.id, mocker)
+    )
+    next_event = asyncio.ensure_future(anext(events))
+    # The subscription starts listening right before it subscribes.
+    await asyncio.wait_for(listening.wait_listening(), timeout=5)
+
+    await UserService(db_session).apply_user_updates(
+        db_session=db_session, user=user, first_name="After"
+    )
+    result = await asyncio.wait_for(next_event, timeout=5)
+
+    assert result.errors is None
+    assert result.data == {
+        "userUpdated": {"firstName": "After", "email": "subscriber@example.com"}
+    }
+    await events.aclose()
+    assert listening.subscriber_count == 0
+
+
+async def test_user_updated_requires_a_viewer(
+    listening, db_sessionmaker, mocker
+) -> None:
+    events = await schema.subscribe(
+        USER_UPDATED, context_value=_context(db_sessionmaker, None, mocker)
+    )
+    result = await anext(events)
+
+    assert result.errors is not None
+    assert result.errors[0].message == "User is not authenticated"
+    assert listening.subscriber_count == 0
@@ -288,3 +288,37 @@ async def test_rest_login_inactive_user(
         json={"email": user.email, "password": "InactivePassword123!"},
     )
     assert response.status_code == HTTP_401_UNAUTHORIZED
+
+
+async def test_rest_refresh_rotates_tokens(
+    rest_client: AsyncTestClient[Litestar],
+    user: UserModel,
+) -> None:
+    login_response = await rest_client.post(
+        "/api/auth/login",
+        json={"email": user.email, "password": "SecurePassword123!"},
+    )
+    refresh_token = login_response.json()["refresh_token"]
+
+    refresh_response = await rest_client.post(
+        "/api/auth/refresh", json={"refresh_token": refresh_token}
+    )
+    assert refresh_response.status_code == HTTP_201_CREATED
+    refreshed = refresh_response.json()
+    assert refreshed["refresh_token"] != refresh_token
+    me_response = await rest_client.get(
+        "/api/users/me",
+        headers={"Authorization": f"Bearer {refreshed['token']}"},
+    )
+    assert me_response.status_code == HTTP_200_OK
+    assert me_response.json()["email"] == user.email
+
+    # A spent token is refused, and replaying it revokes its successor too.
+    replay_response = await rest_client.post(
+        "/api/auth/refresh", json={"refresh_token": refresh_token}
+    )
+    assert replay_response.status_code == HTTP_401_UNAUTHORIZED
+    successor_response = await rest_client.post(
+        "/api/auth/refresh", json={"refresh_token": refreshed["refresh_token"]}
+    )
+    assert successor_response.status_code == HTTP_401_UNAUTHORIZED
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from backend.apps.users.models import UserModel
+from backend.apps.users.notifications import (
+    UserChangeHub,
+    UserChangesUnavailableError,
+    asyncpg_dsn,
+    publish_user_changed,
+)
+from backend.apps.users.services import UserService
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+async def hub(db_engine):
+    hub = UserChangeHub()
+    hub.configure(asyncpg_dsn(db_engine.url))
+    try:
+        yield hub
+    finally:
+        await hub.close()
+
+
+async def test_committed_changes_wake_subscribers_of_that_user(hub, db_session) -> None:
+    async with (
+        hub.subscribe(1) as first,
+        hub.subscribe(1) as second,
+        hub.subscribe(2) as other,
+    ):
+        await publish_user_changed(db_session, 1)
+        await publish_user_changed(db_session, 1)
+        await db_session.commit()
+
+        await asyncio.wait_for(first.get(), timeout=5)
+        await asyncio.wait_for(second.get(), timeout=5)
+        # Both notifications coalesced into one wake-up.
+        assert first.empty()
+        assert other.empty()
+
+    assert hub.subscriber_count == 0
+
+
+async def test_rolled_back_changes_are_not_delivered(hub, db_session) -> None:
+    async with hub.subscribe(1) as changes:
+        await publish_user_changed(db_session, 1)
+        await db_session.rollback()
+
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(changes.get(), timeout=0.5)
+
+
+async def test_service_updates_notify_subscribers(hub, db_session) -> None:
+    user = UserModel(
+        email="notify@example.com",
+        password_hash="hash",
+        first_name="Notify",
+        last_name="User",
+    )
+    db_session.add(user)
+    await db_session.commit()
+
+    async with hub.subscribe(user.id) as changes:
+        await UserService(db_session).apply_user_updates(
+            db_session=db_session, user=user, first_name="Renamed"
+        )
+        await asyncio.wait_for(changes.get(), timeout=5)
+
+
+async def test_subscribing_without_a_database_is_an_error() -> None:
+    with pytest.raises(UserChangesUnavailableError):
+        async with UserChangeHub().subscribe(1):
+            pass
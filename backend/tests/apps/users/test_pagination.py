@@ -0,0 +1,65 @@
+import datetime
+
+import pytest
+from sqlalchemy import select, text
+
+from backend.apps.users.models import UserModel
+from backend.apps.users.pagination import UserCursorPaginator
+
+pytestmark = pytest.mark.integration
+
+USERS = 20_000
+PAGE_SIZE = 20
+
+
+@pytest.fixture
+async def users(db_session) -> None:
+    # Pairs of users share a `created_at`, and every tenth is soft-deleted.
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO "user" (
+                email, password_hash, first_name, last_name, is_admin, is_active,
+                created_at, updated_at, deleted_at
+            )
+            SELECT
+                'user' || i || '@example.com', 'hash', 'First', 'Last', false,
+                true, timestamptz '2026-01-01' + (i / 2) * interval '1 second',
+                now(), CASE WHEN i % 10 = 0 THEN now() END
+            FROM generate_series(1, :users) AS i
+            """
+        ),
+        {"users": USERS},
+    )
+    await db_session.execute(text('ANALYZE "user"'))
+
+
+@pytest.mark.parametrize("depth", [0.0, 0.5, 0.99])
+async def test_every_page_is_an_index_range_scan(
+    db_session, explain, users, depth
+) -> None:
+    offset = int(USERS * 0.9 * depth)
+    last_created_at, last_id = (
+        await db_session.execute(
+            select(UserModel.created_at, UserModel.id)
+            .where(UserModel.deleted_at.is_(None))
+            .order_by(UserModel.created_at, UserModel.id)
+            .offset(offset)
+            .limit(1)
+        )
+    ).one()
+    if not offset:
+        last_created_at = datetime.datetime.min.replace(tzinfo=datetime.UTC)
+        last_id = 0
+    paginator = UserCursorPaginator(
+        db_session=db_session, search_string=None, search_ignore_case=False
+    )
+    statement = paginator._statement(
+        last_created_at=last_created_at, last_id=last_id, limit=PAGE_SIZE + 1
+    )
+
+    nodes = await explain(statement)
+
+    assert [node["Node Type"] for node in nodes] == ["Limit", "Index Scan"]
+    assert nodes[1]["Index Name"] == "ix_user_live_created_at_id"
+    assert "Index Cond" in nodes[1]
@@ -0,0 +1,78 @@
+import datetime
+
+import pytest
+from sqlalchemy import update
+
+from backend.apps.users.models import RefreshTokenModel, UserModel
+from backend.apps.users.refresh_tokens import (
+    InvalidRefreshTokenError,
+    issue_refresh_token,
+    rotate_refresh_token,
+)
+from backend.apps.users.services import UserService
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+async def user(db_session) -> UserModel:
+    user = UserModel(
+        email="refresh@example.com",
+        password_hash="hash",
+        first_name="Refresh",
+        last_name="User",
+        is_admin=True,
+    )
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+async def test_rotation_returns_claims_in_one_update(
+    db_session, user, sql_statements
+) -> None:
+    token = await issue_refresh_token(db_session, user.id)
+    sql_statements.clear()
+
+    refreshed, new_token = await rotate_refresh_token(db_session, token)
+
+    assert (refreshed.id, refreshed.email, refreshed.is_admin) == (
+        user.id,
+        "refresh@example.com",
+        True,
+    )
+    assert new_token != token
+    # The claiming UPDATE, then the successor's INSERT.
+    assert [statement.split()[0] for statement in sql_statements] == [
+        "UPDATE",
+        "INSERT",
+    ]
+
+
+async def test_expired_tokens_are_refused(db_session, user) -> None:
+    token = await issue_refresh_token(db_session, user.id)
+    await db_session.execute(
+        update(RefreshTokenModel).values(
+            expires_at=datetime.datetime.now(datetime.UTC)
+            - datetime.timedelta(seconds=1)
+        )
+    )
+    await db_session.commit()
+
+    with pytest.raises(InvalidRefreshTokenError):
+        await rotate_refresh_token(db_session, token)
+
+
+async def test_password_change_and_soft_delete_revoke_tokens(db_session, user) -> None:
+    service = UserService(db_session)
+    token = await issue_refresh_token(db_session, user.id)
+    await service.apply_user_updates(
+        db_session=db_session, user=user, password="NewPassword123!"
+    )
+    with pytest.raises(InvalidRefreshTokenError):
+        await rotate_refresh_token(db_session, token)
+
+    token = await issue_refresh_token(db_session, user.id)
+    await service.soft_delete_user(db_session=db_session, user=user)
+    with pytest.raises(InvalidRefreshTokenError):
+        await rotate_refresh_token(db_session, token)
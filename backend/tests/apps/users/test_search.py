@@ -0,0 +1,110 @@
+import pytest
+from sqlalchemy import select, text
+
+from backend.apps.users.models import UserModel
+from backend.apps.users.pagination import UserCursorPaginator
+from backend.apps.users.search import SEARCHABLE_COLUMNS, user_search_condition
+
+pytestmark = pytest.mark.integration
+
+
+async def _emails(db_session, condition) -> list[str]:
+    result = await db_session.execute(
+        select(UserModel.email).where(condition).order_by(UserModel.email)
+    )
+    return list(result.scalars())
+
+
+@pytest.fixture
+async def people(db_session) -> None:
+    db_session.add_all(
+        UserModel(email=email, password_hash="hash", first_name=first, last_name=last)
+        for email, first, last in [
+            ("a_b@example.com", "Ada", "Lovelace"),
+            ("acb@example.com", "Alan", "Turing"),
+            ("grace@example.com", "Grace", "Hopper"),
+        ]
+    )
+    await db_session.flush()
+
+
+async def test_terms_match_literally(db_session, people) -> None:
+    assert await _emails(db_session, user_search_condition("a_b")) == [
+        "a_b@example.com"
+    ]
+    assert await _emails(db_session, user_search_condition("%")) == []
+
+
+async def test_case_sensitivity_is_optional(db_session, people) -> None:
+    assert await _emails(db_session, user_search_condition("GRACE")) == [
+        "grace@example.com"
+    ]
+    assert (
+        await _emails(db_session, user_search_condition("GRACE", ignore_case=False))
+        == []
+    )
+
+
+async def test_any_searchable_column_matches(db_session, people) -> None:
+    condition = user_search_condition("turing", SEARCHABLE_COLUMNS)
+
+    assert await _emails(db_session, condition) == ["acb@example.com"]
+
+
+@pytest.fixture
+async def many_users(db_session) -> None:
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO "user" (
+                email, password_hash, first_name, last_name, is_admin, is_active,
+                created_at, updated_at
+            )
+            SELECT
+                'user' || i || '@example.com', 'hash', 'First' || i % 100,
+                'Last' || i % 1000, false, true,
+                timestamptz '2026-01-01' + (i / 2) * interval '1 second', now()
+            FROM generate_series(1, 20000) AS i
+            """
+        )
+    )
+    await db_session.execute(text('ANALYZE "user"'))
+
+
+async def test_search_terms_can_use_the_trigram_indexes(
+    db_session, explain, many_users
+) -> None:
+    # On a table this small a sequential scan is cheaper; disabling it still
+    # leaves one in the plan if no index can answer the condition.
+    await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+    email_nodes = await explain(
+        select(UserModel).where(user_search_condition("user1234"))
+    )
+    name_nodes = await explain(
+        select(UserModel).where(user_search_condition("ast123", SEARCHABLE_COLUMNS))
+    )
+
+    assert "Seq Scan" not in {node["Node Type"] for node in email_nodes + name_nodes}
+    assert {node.get("Index Name") for node in email_nodes} >= {"ix_user_email_trgm"}
+    assert {node.get("Index Name") for node in name_nodes} >= {
+        "ix_user_email_trgm",
+        "ix_user_first_name_trgm",
+        "ix_user_last_name_trgm",
+    }
+
+
+async def test_search_pages_are_stable(db_session, many_users) -> None:
+    paginator = UserCursorPaginator(
+        db_session=db_session, search_string="user123", search_ignore_case=True
+    )
+    expected = await _emails(db_session, user_search_condition("user123"))
+
+    pages, cursor = [], None
+    while True:
+        items, cursor = await paginator.get_items(cursor, results_per_page=7)
+        pages.extend(item.email for item in items)
+        if cursor is None:
+            break
+
+    assert len(pages) == len(set(pages))
+    assert sorted(pages) == expected
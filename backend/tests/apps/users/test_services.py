@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+from argon2 import PasswordHasher
+from litestar.security.jwt import Token
+
+from backend.apps.users import services
+from backend.apps.users.auth import create_access_token
+from backend.apps.users.models import UserModel
+from backend.apps.users.services import UserService
+from backend.auth.passwords import passwords
+from backend.auth.revocation import token_revocations
+from backend.config.base import settings
+
+pytestmark = pytest.mark.integration
+
+
+async def test_login_upgrades_outdated_password_hash(
+    db_session, db_sessionmaker
+) -> None:
+    weak_hash = PasswordHasher(time_cost=1, memory_cost=8, parallelism=1).hash(
+        "SecurePassword123!"
+    )
+    user = UserModel(
+        email="rehash@example.com",
+        password_hash=weak_hash,
+        first_name="Rehash",
+        last_name="User",
+    )
+    db_session.add(user)
+    await db_session.commit()
+
+    logged_in, _ = await UserService(db_session).authenticate_for_login(
+        db_session=db_session,
+        email="rehash@example.com",
+        password="SecurePassword123!",
+    )
+    assert logged_in.id == user.id
+    await asyncio.gather(*services._password_upgrades)
+
+    async with db_sessionmaker() as session:
+        stored = await session.get(UserModel, user.id)
+    assert stored is not None
+    assert stored.password_hash != weak_hash
+    assert not passwords.needs_rehash(stored.password_hash)
+    assert await passwords.verify(stored.password_hash, "SecurePassword123!")
+
+
+async def test_login_keeps_current_password_hash(db_session) -> None:
+    current_hash = await passwords.hash("SecurePassword123!")
+    user = UserModel(
+        email="current@example.com",
+        password_hash=current_hash,
+        first_name="Current",
+        last_name="User",
+    )
+    db_session.add(user)
+    await db_session.commit()
+
+    await UserService(db_session).authenticate_for_login(
+        db_session=db_session,
+        email="current@example.com",
+        password="SecurePassword123!",
+    )
+
+    assert not services._password_upgrades
+    assert user.password_hash == current_hash
+
+
+@pytest.mark.parametrize("change", ["password", "soft_delete"])
+async def test_password_changes_and_deletes_revoke_issued_tokens(
+    db_session, change
+) -> None:
+    user = UserModel(
+        email="revoke@example.com",
+        password_hash="hash",
+        first_name="Revoke",
+        last_name="User",
+    )
+    db_session.add(user)
+    await db_session.commit()
+    token = Token.decode(
+        encoded_token=create_access_token(user),
+        secret=settings.jwt_secret,
+        algorithm="HS256",
+    )
+    assert not await token_revocations.is_revoked(token)
+
+    service = UserService(db_session)
+    if change == "password":
+        await service.apply_user_updates(
+            db_session=db_session, user=user, password="NewPassword123!"
+        )
+    else:
+        await service.soft_delete_user(db_session=db_session, user=user)
+
+    assert await token_revocations.is_revoked(token)
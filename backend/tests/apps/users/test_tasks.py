@@ -1,10 +1,14 @@
 import datetime
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.apps.users.models import UserModel
-from backend.apps.users.tasks import _deactivate_inactive_users_async
+from backend.apps.users.models import RefreshTokenModel, UserModel
+from backend.apps.users.tasks import (
+    _deactivate_inactive_users_async,
+    _purge_expired_refresh_tokens_async,
+)
 
 
 @pytest.mark.asyncio
@@ -74,3 +78,43 @@ async def test_deactivate_inactive_users(
     assert user2.is_active is True
     assert user3.is_active is False
     assert user4.is_active is True
+
+
+@pytest.mark.asyncio
+async def test_purge_expired_refresh_tokens(
+    db_session: AsyncSession,
+):
+    now = datetime.datetime.now(datetime.UTC)
+    user = UserModel(
+        email="refresh_purge@example.com",
+        password_hash="hash",
+        first_name="Refresh",
+        last_name="Purge",
+    )
+    db_session.add(user)
+    await db_session.flush()
+
+    def token(token_hash: str, expires_in_days: int, *, spent: bool) -> None:
+        db_session.add(
+            RefreshTokenModel(
+                user_id=user.id,
+                token_hash=token_hash,
+                expires_at=now + datetime.timedelta(days=expires_in_days),
+                revoked_at=now if spent else None,
+            )
+        )
+
+    token("expired", -1, spent=False)
+    token("spent_and_expired", -1, spent=True)
+    # Kept so that replaying it still revokes the user's tokens.
+    token("spent", 1, spent=True)
+    token("live", 1, spent=False)
+    await db_session.commit()
+
+    count = await _purge_expired_refresh_tokens_async(session=db_session)
+
+    assert count == 2
+    remaining = await db_session.scalars(
+        select(RefreshTokenModel.token_hash).order_by(RefreshTokenModel.token_hash)
+    )
+    assert remaining.all() == ["live", "spent"]
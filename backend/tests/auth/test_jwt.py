@@ -1,14 +1,21 @@
+from datetime import timedelta
+
 import pytest
 from advanced_alchemy.extensions.litestar import SQLAlchemyAsyncConfig
 from argon2 import PasswordHasher
+from litestar import Request
+from litestar.security.jwt import Token
 from litestar.status_codes import HTTP_200_OK
-from litestar.testing import AsyncTestClient
+from litestar.testing import AsyncTestClient, RequestFactory
 
 from backend.application import create_app
 from backend.apps import models as app_models
+from backend.apps.users.auth import create_access_token
 from backend.apps.users.models import UserModel
-from backend.auth.jwt import jwt_auth
+from backend.auth.jwt import CLAIMS_ONLY, Principal, jwt_auth, retrieve_user_handler
+from backend.auth.revocation import token_revocations
 from backend.config.alchemy import build_connection_string, session_config
+from backend.config.base import settings
 
 
 @pytest.mark.asyncio
@@ -51,3 +58,54 @@ async def test_jwt_auth_allows_me_endpoint(
 
     assert response.status_code == HTTP_200_OK
     assert response.json()["email"] == "jwt@example.com"
+
+
+def _connection(*, claims_only: bool) -> Request:
+    # The factory's app has no `alchemy_config`, so lookups find nobody.
+    factory = RequestFactory(handler_kwargs={"opt": {CLAIMS_ONLY: claims_only}})
+    return factory.get()
+
+
+def _claims_token(issued_ago: timedelta = timedelta()) -> Token:
+    user = UserModel(email="claims@example.com", is_admin=True)
+    user.id = 7
+    token = Token.decode(
+        encoded_token=create_access_token(user),
+        secret=settings.jwt_secret,
+        algorithm="HS256",
+    )
+    token.iat -= issued_ago
+    return token
+
+
+@pytest.mark.unit
+async def test_claims_only_routes_get_a_principal_without_a_lookup() -> None:
+    principal = await retrieve_user_handler(
+        _claims_token(), _connection(claims_only=True)
+    )
+
+    assert principal == Principal(id=7, email="claims@example.com", is_admin=True)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("claims_only", "issued_ago"),
+    [(False, timedelta()), (True, timedelta(hours=1))],
+    ids=["route-needs-row", "claims-too-old"],
+)
+async def test_user_is_loaded_when_claims_are_not_enough(
+    claims_only, issued_ago
+) -> None:
+    user = await retrieve_user_handler(
+        _claims_token(issued_ago), _connection(claims_only=claims_only)
+    )
+
+    assert user is None
+
+
+@pytest.mark.unit
+async def test_revoked_tokens_are_rejected() -> None:
+    token = _claims_token(timedelta(seconds=5))
+    await token_revocations.revoke(UserModel(id=7))
+
+    assert await retrieve_user_handler(token, _connection(claims_only=True)) is None
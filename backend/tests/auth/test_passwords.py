@@ -0,0 +1,51 @@
+import asyncio
+import threading
+
+import pytest
+from argon2 import PasswordHasher
+
+from backend.auth.passwords import PasswordHashingOverloadedError, PasswordHashingPool
+
+pytestmark = pytest.mark.unit
+
+
+class RecordingHasher(PasswordHasher):
+    """Cheap parameters, noting which thread each hash ran on."""
+
+    def __init__(self) -> None:
+        super().__init__(time_cost=1, memory_cost=8, parallelism=1)
+        self.threads: list[str] = []
+
+    def hash(self, password: str | bytes, *, salt: bytes | None = None) -> str:
+        self.threads.append(threading.current_thread().name)
+        return super().hash(password, salt=salt)
+
+
+@pytest.fixture
+def pool():
+    pool = PasswordHashingPool(RecordingHasher(), workers=1, max_pending=1)
+    yield pool
+    pool.shutdown()
+
+
+async def test_hash_and_verify_run_off_the_event_loop(pool) -> None:
+    password_hash = await pool.hash("secret")
+
+    assert len(pool.hasher.threads) == 1
+    assert pool.hasher.threads[0].startswith("argon2")
+    assert await pool.verify(password_hash, "secret") is True
+    assert await pool.verify(password_hash, "wrong") is False
+    assert await pool.verify("not-a-hash", "secret") is False
+
+
+async def test_calls_beyond_capacity_fail_fast(pool) -> None:
+    results = await asyncio.gather(
+        pool.hash("a"), pool.hash("b"), pool.hash("c"), return_exceptions=True
+    )
+
+    assert isinstance(results[0], str)
+    assert isinstance(results[1], str)
+    assert isinstance(results[2], PasswordHashingOverloadedError)
+    assert results[2].status_code == 503
+    # Capacity is released once the admitted calls finish.
+    assert isinstance(await pool.hash("d"), str)
@@ -0,0 +1,195 @@
+from collections.abc import AsyncIterator
+
+import pytest
+from advanced_alchemy.extensions.litestar import SQLAlchemyAsyncConfig
+from litestar.security.jwt import Token
+from litestar.stores.memory import MemoryStore
+
+from backend.apps import models as app_models
+from backend.apps.users.auth import create_access_token
+from backend.apps.users.models import UserModel
+from backend.auth.revocation import BloomFilter, TokenRevocationList
+from backend.config.alchemy import build_connection_string, session_config
+from backend.config.base import settings
+from backend.metrics import metrics
+from backend.stores.shared import SharedMemoryStore
+
+
+@pytest.fixture(autouse=True)
+def _clear_metrics():
+    metrics.clear()
+
+
+@pytest.fixture
+def store() -> MemoryStore:
+    return MemoryStore()
+
+
+@pytest.fixture
+def revocations(store) -> TokenRevocationList:
+    return TokenRevocationList(store, ttl=3600, capacity=1000, error_rate=0.001)
+
+
+def _token(user_id: int) -> Token:
+    user = UserModel(id=user_id, email=f"user{user_id}@example.com", is_admin=False)
+    return Token.decode(
+        encoded_token=create_access_token(user),
+        secret=settings.jwt_secret,
+        algorithm="HS256",
+    )
+
+
+@pytest.mark.unit
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives() -> None:
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for item in range(1000):
+        bloom.add(item)
+
+    assert all(item in bloom for item in range(1000))
+    false_positives = sum(item in bloom for item in range(1000, 11_000))
+    assert false_positives < 300
+
+
+@pytest.mark.unit
+async def test_unrevoked_users_skip_the_store(revocations, mocker) -> None:
+    get = mocker.spy(MemoryStore, "get")
+
+    assert not await revocations.is_revoked(_token(1))
+    assert get.call_count == 0
+    assert 'token_revocation_lookups_count{result="filtered"} 1' in metrics.render()
+
+
+@pytest.mark.unit
+async def test_tokens_issued_before_revocation_are_revoked(revocations) -> None:
+    old = _token(1)
+    await revocations.revoke(UserModel(id=1))
+    reissued = _token(1)
+
+    assert await revocations.is_revoked(old)
+    assert not await revocations.is_revoked(reissued)
+    assert not await revocations.is_revoked(_token(2))
+    rendered = metrics.render()
+    assert 'token_revocation_lookups_count{result="revoked"} 1' in rendered
+    assert 'token_revocation_lookups_count{result="valid"} 1' in rendered
+
+
+@pytest.mark.unit
+async def test_suspended_lists_check_every_token(revocations, store) -> None:
+    # Revoked elsewhere: in the shared store but not in this filter.
+    await store.set("user:1", "4102444800")
+
+    revocations.suspend()
+    assert await revocations.is_revoked(_token(1))
+
+    revocations.resume([])
+    assert not await revocations.is_revoked(_token(1))
+
+
+@pytest.mark.unit
+async def test_tokens_issued_later_in_the_revoking_second_are_valid(
+    revocations, mocker
+) -> None:
+    # All within one second, which `iat` cannot tell apart.
+    clock = mocker.patch("backend.auth.revocation.time.time")
+    clock.return_value = 1_000_000.2
+    old = _token(1)
+    clock.return_value = 1_000_000.5
+    await revocations.revoke(UserModel(id=1))
+    clock.return_value = 1_000_000.8
+    reissued = _token(1)
+
+    assert await revocations.is_revoked(old)
+    assert not await revocations.is_revoked(reissued)
+
+
+@pytest.mark.unit
+async def test_marks_expire_after_two_generations(store, mocker) -> None:
+    clock = mocker.patch("backend.auth.revocation.time.monotonic")
+    clock.return_value = 0
+    revocations = TokenRevocationList(store, ttl=3600, capacity=10, error_rate=0.01)
+    revocations.mark(1)
+
+    clock.return_value = 3600
+    assert revocations.may_be_revoked(1)
+    clock.return_value = 7200
+    assert not revocations.may_be_revoked(1)
+
+
+@pytest.fixture
+async def fallback(test_db_name) -> AsyncIterator[SQLAlchemyAsyncConfig]:
+    config = SQLAlchemyAsyncConfig(
+        connection_string=build_connection_string(db_name=test_db_name),
+        session_config=session_config,
+        metadata=app_models.metadata,
+        create_all=False,
+    )
+    yield config
+    await config.get_engine().dispose()
+
+
+@pytest.fixture
+async def user(db_session) -> UserModel:
+    user = UserModel(
+        email="revoked@example.com",
+        password_hash="hash",
+        first_name="Revoked",
+        last_name="User",
+    )
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+@pytest.mark.integration
+async def test_other_processes_revocations_fall_back_to_the_database(
+    db_session, fallback, user, revocations
+) -> None:
+    token = _token(user.id)
+    # Revoked by another process, into a store of its own.
+    await revocations.revoke(user)
+    await db_session.commit()
+
+    store = MemoryStore()
+    elsewhere = TokenRevocationList(store, ttl=3600, capacity=1000, error_rate=0.001)
+    elsewhere.configure(store, fallback=fallback)
+    elsewhere.mark(user.id)
+
+    assert await elsewhere.is_revoked(token)
+    # Remembered, so the next lookup skips the database.
+    assert await store.exists(f"user:{user.id}")
+    assert not await elsewhere.is_revoked(_token(user.id))
+
+
+@pytest.mark.integration
+async def test_evicted_revocations_fall_back_to_the_database(
+    db_session, fallback, user, tmp_path
+) -> None:
+    store = SharedMemoryStore(tmp_path / "revocations", buckets=1, bucket_slots=1)
+    revocations = TokenRevocationList(store, ttl=3600, capacity=1000, error_rate=0.001)
+    revocations.configure(store, fallback=fallback)
+    token = _token(user.id)
+    await revocations.revoke(user)
+    await db_session.commit()
+
+    await store.set("user:0", "0")
+    assert not await store.exists(f"user:{user.id}")
+
+    assert await revocations.is_revoked(token)
+    store.close()
+
+
+@pytest.mark.integration
+async def test_unrevoked_users_are_looked_up_once_per_mark(
+    fallback, user, revocations, store, mocker
+) -> None:
+    revocations.configure(store, fallback=fallback)
+    load = mocker.spy(revocations, "_load_watermark")
+    revocations.mark(user.id)
+
+    assert not await revocations.is_revoked(_token(user.id))
+    assert not await revocations.is_revoked(_token(user.id))
+    assert load.call_count == 1
+
+    revocations.mark(user.id)
+    assert not await revocations.is_revoked(_token(user.id))
+    assert load.call_count == 2
@@ -0,0 +1,102 @@
+from datetime import timedelta
+
+import pytest
+from litestar.security.jwt import Token
+
+from backend.auth.jwt import jwt_auth
+from backend.auth.tokens import VerifiedTokenCache, bearer_credentials
+from backend.metrics import metrics
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _clear_metrics():
+    metrics.clear()
+
+
+def _token(identifier: str = "1", expiration: timedelta | None = None) -> str:
+    return jwt_auth.create_token(
+        identifier=identifier,
+        token_expiration=expiration or timedelta(hours=1),
+    )
+
+
+def test_repeated_tokens_skip_decoding(mocker) -> None:
+    cache = VerifiedTokenCache(maxsize=8)
+    decode = mocker.spy(Token, "decode")
+    encoded = _token()
+
+    first = cache.verify(encoded)
+    second = cache.verify(encoded)
+
+    assert first is not None
+    assert first.sub == "1"
+    assert second is first
+    assert decode.call_count == 1
+    rendered = metrics.render()
+    assert 'jwt_token_cache_lookups_count{result="hit"} 1' in rendered
+    assert 'jwt_token_cache_lookups_count{result="miss"} 1' in rendered
+    assert "jwt_token_decode_seconds_count 1" in rendered
+
+
+def test_invalid_tokens_are_rejected_and_not_cached() -> None:
+    cache = VerifiedTokenCache(maxsize=8)
+
+    assert cache.verify("not-a-jwt") is None
+    assert cache.verify(_token() + "tampered") is None
+    assert len(cache) == 0
+
+
+def test_expired_entries_are_dropped(mocker) -> None:
+    cache = VerifiedTokenCache(maxsize=8)
+    encoded = _token()
+    assert cache.verify(encoded) is not None
+
+    clock = mocker.patch("backend.auth.tokens.time.time")
+    clock.return_value = 4_102_444_800  # 2100-01-01, long after expiry
+    mocker.patch.object(Token, "decode", side_effect=ValueError)
+
+    assert cache.verify(encoded) is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entries_are_evicted() -> None:
+    cache = VerifiedTokenCache(maxsize=2)
+    first, second, third = (_token(str(i)) for i in range(3))
+
+    cache.verify(first)
+    cache.verify(second)
+    cache.verify(first)
+    cache.verify(third)
+
+    assert len(cache) == 2
+    metrics.clear()
+    cache.verify(second)
+    assert 'jwt_token_cache_lookups_count{result="miss"} 1' in metrics.render()
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("Bearer abc", "abc"),
+        ("bearer abc", "abc"),
+        ("Basic abc", None),
+        ("Bearer ", None),
+        (None, None),
+    ],
+)
+def test_bearer_credentials(header, expected) -> None:
+    assert bearer_credentials(header) == expected
+
+
+async def test_token_is_verified_once_per_request(test_client, mocker) -> None:
+    verify = mocker.spy(VerifiedTokenCache, "verify")
+    headers = {"Authorization": f"Bearer {_token()}"}
+
+    response = await test_client.post(
+        "/graphql", json={"query": "{ __typename }"}, headers=headers
+    )
+
+    assert response.status_code == 200
+    assert verify.call_count == 1
@@ -1,21 +1,25 @@
-from collections.abc import AsyncIterator
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
 from typing import Any
 
 import pytest
 import pytest_asyncio
 from litestar import Litestar
 from litestar.testing import AsyncTestClient
-from sqlalchemy import text
+from sqlalchemy import Select, event, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
 
 from backend.application import create_app
 from backend.apps.users.models import UserModel
 from backend.apps.users.services import UserService
+from backend.auth.revocation import token_revocations
 from backend.graphql.context import GraphQLContext, Services
 
 
@@ -92,6 +96,13 @@ async def worker_test_database(test_db_name: str) -> AsyncIterator[str]:
         await admin_engine.dispose()
 
 
+@pytest.fixture(autouse=True)
+async def _clear_token_revocations() -> AsyncIterator[None]:
+    # Revocations are process-wide; keep them from leaking into other tests.
+    yield
+    await token_revocations.clear()
+
+
 @pytest.fixture
 async def db_engine(worker_test_database: str) -> AsyncIterator[AsyncEngine]:
     from backend.config.alchemy import build_connection_string
@@ -134,6 +145,50 @@ async def db_session(db_sessionmaker: async_sessionmaker[AsyncSession]):
             await session.rollback()
 
 
+@pytest.fixture
+def sql_statements(db_engine: AsyncEngine) -> Iterator[list[str]]:
+    """Collects every SQL statement sent through `db_engine` during the test."""
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, _parameters, _context, _executemany):
+        statements.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", _record)
+
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: Select) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def _plan_nodes(plan: dict) -> list[dict]:
+    children = plan.get("Plans", [])
+    return [plan, *(node for child in children for node in _plan_nodes(child))]
+
+
+@pytest.fixture
+def explain(db_session) -> Callable[[Select], Awaitable[list[dict]]]:
+    """Plans a statement in `db_session`; returns its nodes, depth first."""
+
+    async def _explain(statement: Select) -> list[dict]:
+        raw = (await db_session.execute(_Explain(statement))).scalar_one()
+        plan = json.loads(raw) if isinstance(raw, str) else raw
+        return _plan_nodes(plan[0]["Plan"])
+
+    return _explain
+
+
 @pytest.fixture
 def db_session_mock(mocker) -> AsyncSession:
     session = mocker.Mock(spec=AsyncSession)
@@ -0,0 +1,73 @@
+import pytest
+from litestar.status_codes import (
+    HTTP_200_OK,
+    HTTP_400_BAD_REQUEST,
+    HTTP_429_TOO_MANY_REQUESTS,
+)
+
+from backend.graphql.batching import _is_read_only, parser_cache
+
+pytestmark = pytest.mark.unit
+
+TYPENAME = {"query": "{ __typename }"}
+ME = {"query": "query Me { me { email } }", "operationName": "Me"}
+
+
+async def test_batch_returns_one_result_per_operation(test_client):
+    response = await test_client.post("/graphql", json=[ME, TYPENAME])
+
+    assert response.status_code == HTTP_200_OK
+    assert response.json() == [
+        {"data": {"me": {"email": "test@example.com"}}},
+        {"data": {"__typename": "Query"}},
+    ]
+
+
+async def test_batch_counts_each_operation_against_rate_limit(test_client):
+    for _ in range(2):
+        response = await test_client.post("/graphql", json=[TYPENAME] * 5)
+        assert response.status_code == HTTP_200_OK
+
+    response = await test_client.post("/graphql", json=TYPENAME)
+    assert response.status_code == HTTP_429_TOO_MANY_REQUESTS
+
+
+async def test_batch_documents_are_parsed_once(test_client):
+    before = parser_cache.cached_parse_document.cache_info()
+
+    response = await test_client.post(
+        "/graphql", json=[{"query": "query Once { __typename }"}]
+    )
+
+    after = parser_cache.cached_parse_document.cache_info()
+    assert response.status_code == HTTP_200_OK
+    # Classifying the batch parses it; Strawberry then hits the cache.
+    assert after.misses - before.misses == 1
+    assert after.hits - before.hits == 1
+
+
+async def test_batch_over_maximum_size_is_rejected(test_client):
+    response = await test_client.post("/graphql", json=[TYPENAME] * 11)
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.parametrize(
+    ("operations", "expected"),
+    [
+        ([TYPENAME, ME], True),
+        ([ME, {"query": "mutation { softDeleteCurrentUser }"}], False),
+        (
+            [
+                {
+                    "query": "query A { __typename } mutation B { login }",
+                    "operationName": "B",
+                }
+            ],
+            False,
+        ),
+    ],
+    ids=["queries", "with-mutation", "named-mutation"],
+)
+def test_batch_read_only_detection(operations, expected):
+    assert _is_read_only(operations) is expected
@@ -0,0 +1,205 @@
+import asyncio
+import time
+from collections.abc import Awaitable
+
+import msgspec
+import pytest
+from graphql import get_introspection_query, parse
+from litestar import Litestar
+from litestar.datastructures.state import State
+from litestar.testing import RequestFactory
+from strawberry.relay.utils import to_base64
+from strawberry.types import ExecutionResult
+
+from backend.apps.users.events import notify_user_changed
+from backend.apps.users.models import UserModel
+from backend.apps.users.notifications import (
+    UserChangeHub,
+    asyncpg_dsn,
+    publish_user_changed,
+)
+from backend.graphql.cache import (
+    RESPONSE_CACHE_STORE,
+    CacheInvalidations,
+    CachePolicy,
+    CacheScope,
+    _CacheEntry,
+    _introspection_results,
+    _operation_key,
+    cache_policy,
+    response_cache_invalidation,
+)
+from backend.graphql.context import GraphQLContext, Services
+from backend.graphql.schema import schema
+
+pytestmark = pytest.mark.unit
+
+USER_BY_ID = """
+query GetUserById($id: ID!) {
+    userById(id: $id) {
+        id
+        email
+    }
+}
+"""
+
+
+def _policy(query: str) -> CachePolicy | None:
+    return cache_policy(schema._schema, parse(query))
+
+
+def test_cache_policy_combines_field_hints():
+    assert _policy("{ me { email } }") == CachePolicy(60, CacheScope.PRIVATE)
+    assert _policy(
+        "{ me { email } users(first: 1) { edges { node { id } } } }"
+    ) == CachePolicy(10, CacheScope.PRIVATE)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        '{ node(id: "VXNlclR5cGU6MQ==") { id } }',
+        "mutation { softDeleteCurrentUser }",
+    ],
+    ids=["unhinted-root-field", "mutation"],
+)
+def test_cache_policy_uncacheable(query):
+    assert _policy(query) is None
+
+
+def test_invalidations_past_capacity_invalidate_everything(mocker):
+    mocker.patch("backend.graphql.cache.time.time", return_value=100.0)
+    invalidations = CacheInvalidations(max_age=60, capacity=2)
+
+    invalidations.invalidate("UserType:1")
+    assert invalidations.is_stale(100.0, ["UserType:1"])
+    assert not invalidations.is_stale(100.0, ["UserType:2"])
+
+    invalidations.invalidate("UserType:2")
+    invalidations.invalidate("UserType:3")
+    assert invalidations.is_stale(100.0, ["UserType:4"])
+    assert not invalidations.is_stale(100.5, ["UserType:1"])
+
+
+def test_suspended_invalidations_serve_no_entries(mocker):
+    clock = mocker.patch("backend.graphql.cache.time.time", return_value=100.0)
+    invalidations = CacheInvalidations(max_age=60, capacity=2)
+
+    invalidations.suspend()
+    assert invalidations.is_stale(200.0, [])
+
+    clock.return_value = 150.0
+    invalidations.resume()
+    assert invalidations.is_stale(150.0, [])
+    assert not invalidations.is_stale(150.5, [])
+
+
+async def test_introspection_is_precomputed(test_client):
+    query = get_introspection_query(descriptions=True)
+    precomputed = _introspection_results[_operation_key(query, None, None)]
+
+    response = await test_client.post("/graphql", json={"query": query})
+
+    assert response.json() == {"data": precomputed}
+
+
+async def test_user_lookup_is_served_from_cache_until_user_changes(
+    user_service_mock, graphql_client, mocker
+):
+    user = UserModel(
+        email="cached@example.com",
+        password_hash="hashed",
+        first_name="Cached",
+        last_name="User",
+    )
+    user.id = 2
+    user_service_mock.list = mocker.AsyncMock(return_value=[user])
+    variables = {"id": to_base64("UserType", "2")}
+
+    first = await graphql_client.query(USER_BY_ID, variables=variables)
+    second = await graphql_client.query(USER_BY_ID, variables=variables)
+
+    assert first == second
+    assert first["data"]["userById"]["email"] == "cached@example.com"
+    user_service_mock.list.assert_called_once()
+
+    await notify_user_changed(2)
+    await graphql_client.query(USER_BY_ID, variables=variables)
+
+    assert user_service_mock.list.call_count == 2
+
+
+async def test_concurrent_operations_tag_their_own_entries(
+    db_session_mock, user_service_mock, mocker
+):
+    async def list_users(id_filter, **_kwargs):
+        (user_id,) = id_filter.right.value
+        # The first operation resolves its user last.
+        await asyncio.sleep(0.01 if user_id == 1 else 0)
+        user = UserModel(
+            email=f"user{user_id}@example.com",
+            password_hash="hashed",
+            first_name="Concurrent",
+            last_name="User",
+        )
+        user.id = user_id
+        return [user]
+
+    user_service_mock.list = mocker.AsyncMock(side_effect=list_users)
+    app = Litestar()
+
+    def execute(user_id: int) -> Awaitable[ExecutionResult]:
+        services = Services(db_session_mock)
+        services.users = user_service_mock
+        context = GraphQLContext(
+            db_session=db_session_mock,
+            services=services,
+            # Each user looks themselves up.
+            user=UserModel(id=user_id),
+            request=RequestFactory(app=app).post("/graphql"),
+        )
+        variables = {"id": to_base64("UserType", user_id)}
+        return schema.execute(
+            USER_BY_ID, variable_values=variables, context_value=context
+        )
+
+    results = await asyncio.gather(execute(1), execute(2))
+
+    assert [result.errors for result in results] == [None, None]
+    store = app.stores.get(RESPONSE_CACHE_STORE)
+    for user_id in (1, 2):
+        variables = {"id": to_base64("UserType", user_id)}
+        key = _operation_key(USER_BY_ID, "GetUserById", variables)
+        raw = await store.get(f"response:user:{user_id}:{key}")
+        assert raw is not None
+        entry = msgspec.json.decode(raw, type=_CacheEntry)
+        assert entry.tags == [f"UserType:{user_id}"]
+
+
+@pytest.mark.integration
+async def test_other_processes_changes_invalidate_responses(
+    db_engine, db_session, mocker
+):
+    hub = UserChangeHub()
+    hub.configure(asyncpg_dsn(db_engine.url))
+    invalidations = CacheInvalidations(max_age=60, capacity=10)
+    invalidated = asyncio.Event()
+    invalidate = mocker.patch.object(
+        invalidations, "invalidate", side_effect=lambda _: invalidated.set()
+    )
+    mocker.patch("backend.graphql.cache.user_changes", hub)
+    mocker.patch("backend.graphql.cache.response_cache_invalidations", invalidations)
+    app = Litestar(state=State({"alchemy_config": object()}))
+
+    try:
+        async with response_cache_invalidation(app):
+            # Changes may be missed until the listener is up.
+            assert invalidations.is_stale(time.time(), [])
+            await asyncio.wait_for(hub.wait_listening(), timeout=5)
+            await publish_user_changed(db_session, 7)
+            await db_session.commit()
+            await asyncio.wait_for(invalidated.wait(), timeout=5)
+    finally:
+        await hub.close()
+
+    invalidate.assert_called_once_with("UserType:7")
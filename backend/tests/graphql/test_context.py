@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+from strawberry.relay.utils import to_base64
+
+from backend.apps.users.models import UserModel
+from backend.graphql.context import GraphQLContext, Services
+from backend.graphql.schema import schema
+
+pytestmark = pytest.mark.integration
+
+
+async def test_loader_loads_users_by_id_in_one_select(
+    db_session, sql_statements
+) -> None:
+    users = [
+        UserModel(
+            email=f"batch{i}@example.com",
+            password_hash="hash",
+            first_name="Batch",
+            last_name=str(i),
+        )
+        for i in range(2)
+    ]
+    db_session.add_all(users)
+    await db_session.commit()
+    db_session.expunge_all()
+    missing_id = max(user.id for user in users) + 1
+    loaders = Services(db_session).loaders
+    sql_statements.clear()
+
+    loaded = await loaders.load_users(
+        [users[1].id, missing_id, users[0].id], columns=["email"]
+    )
+
+    assert [user.email if user else None for user in loaded] == [
+        "batch1@example.com",
+        None,
+        "batch0@example.com",
+    ]
+    assert len(sql_statements) == 1
+
+
+async def test_user_loads_share_one_round_trip(db_session, sql_statements) -> None:
+    viewer, other = (
+        UserModel(
+            email=f"loader{i}@example.com",
+            password_hash="hash",
+            first_name="Loader",
+            last_name=str(i),
+        )
+        for i in range(2)
+    )
+    db_session.add_all([viewer, other])
+    await db_session.commit()
+
+    services = Services(db_session)
+    services.loaders.prime_user(viewer)
+    context = GraphQLContext(db_session=db_session, services=services, user=viewer)
+
+    query = """
+    query Lookups($viewer: ID!, $other: ID!) {
+        self: userById(id: $viewer) { email }
+        a: userById(id: $other) { email }
+        b: userById(id: $other) { email }
+        c: node(id: $other) { id }
+    }
+    """
+    sql_statements.clear()
+    result = await schema.execute(
+        query,
+        variable_values={
+            "viewer": to_base64("UserType", viewer.id),
+            "other": to_base64("UserType", other.id),
+        },
+        context_value=context,
+    )
+
+    assert result.errors is None
+    assert result.data is not None
+    assert result.data["self"]["email"] == "loader0@example.com"
+    assert result.data["a"]["email"] == "loader1@example.com"
+    # The primed viewer is served from the loader; the rest is one batched SELECT.
+    assert len(sql_statements) == 1
+
+
+async def test_user_is_loaded_lazily_and_once(db_session, sql_statements) -> None:
+    user = UserModel(
+        email="lazy@example.com",
+        password_hash="hash",
+        first_name="Lazy",
+        last_name="User",
+    )
+    db_session.add(user)
+    await db_session.commit()
+
+    context = GraphQLContext(
+        db_session=db_session, services=Services(db_session), user_id=user.id
+    )
+    sql_statements.clear()
+
+    result = await schema.execute("{ __typename }", context_value=context)
+    assert result.errors is None
+    assert sql_statements == []
+
+    loaded = await asyncio.gather(context.get_user(), context.get_user())
+    assert await context.get_user() is loaded[0] is loaded[1]
+    assert loaded[0] is not None
+    assert loaded[0].email == "lazy@example.com"
+    assert len(sql_statements) == 1
+
+
+async def test_authenticated_operations_load_the_viewer(db_session) -> None:
+    user = UserModel(
+        email="viewer@example.com",
+        password_hash="hash",
+        first_name="Viewer",
+        last_name="User",
+    )
+    db_session.add(user)
+    await db_session.commit()
+
+    async def execute(query: str) -> dict:
+        context = GraphQLContext(
+            db_session=db_session, services=Services(db_session), user_id=user.id
+        )
+        result = await schema.execute(query, context_value=context)
+        assert result.errors is None
+        assert result.data is not None
+        return result.data
+
+    me = await execute("{ me { email } }")
+    updated = await execute(
+        'mutation { updateCurrentUser(userInput: {firstName: "Renamed"}) '
+        "{ firstName } }"
+    )
+    deleted = await execute("mutation { softDeleteCurrentUser }")
+
+    assert me == {"me": {"email": "viewer@example.com"}}
+    assert updated == {"updateCurrentUser": {"firstName": "Renamed"}}
+    assert deleted == {"softDeleteCurrentUser": True}
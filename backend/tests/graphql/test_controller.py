@@ -0,0 +1,10 @@
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+async def test_response_is_compact_msgspec_json(test_client):
+    response = await test_client.post("/graphql", json={"query": "{ __typename }"})
+
+    assert response.headers["content-type"].startswith("application/json")
+    assert response.content == b'{"data":{"__typename":"Query"}}'
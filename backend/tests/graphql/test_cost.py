@@ -0,0 +1,87 @@
+import pytest
+from graphql import parse
+from litestar.status_codes import HTTP_200_OK, HTTP_429_TOO_MANY_REQUESTS
+
+from backend.graphql.cost import operation_cost
+from backend.graphql.schema import schema
+
+pytestmark = pytest.mark.unit
+
+USERS_PAGE = "users(first: 100) { edges { node { id email } } }"
+
+
+def _cost(query: str, **kwargs) -> int:
+    return operation_cost(schema=schema._schema, document=parse(query), **kwargs)
+
+
+def test_scalar_fields_are_free():
+    assert _cost("{ me { id email firstName } }") == 1
+
+
+def test_connection_cost_is_multiplied_by_page_size():
+    assert _cost(f"{{ {USERS_PAGE} }}") == 1 + 100 * 2
+    assert (
+        _cost(
+            "query ($n: Int) { users(last: $n) { edges { node { id } } } }",
+            variables={"n": 10},
+        )
+        == 1 + 10 * 2
+    )
+
+
+def test_aliases_and_fragments_are_counted():
+    query = """
+    query { a: users(first: 10) { ...Page } b: users(first: 10) { ...Page } }
+    fragment Page on UserTypeConnection { edges { node { id } } }
+    """
+
+    assert _cost(query) == 2 * (1 + 10 * 2)
+
+
+def test_page_sizes_are_clamped():
+    assert _cost("{ users(first: -1999) { edges { node { id } } } }") == 1
+    assert (
+        _cost("{ users(last: 500) { edges { node { id } } } }", max_page_size=100)
+        == 1 + 100 * 2
+    )
+
+
+def test_field_weights_override_defaults():
+    assert _cost("{ me { email } }", field_weights={"UserType.email": 3}) == 4
+
+
+@pytest.mark.asyncio
+async def test_query_over_cost_budget_is_rejected(graphql_client):
+    query = "query { " + " ".join(f"u{i}: {USERS_PAGE}" for i in range(5)) + " }"
+
+    response = await graphql_client.query(query)
+
+    assert response["data"] is None
+    assert response["errors"][0]["extensions"]["code"] == "QUERY_TOO_COMPLEX"
+
+
+@pytest.mark.asyncio
+async def test_negative_page_sizes_do_not_offset_cost(graphql_client):
+    pages = " ".join(f"u{i}: {USERS_PAGE}" for i in range(5))
+    query = (
+        f"query {{ {pages} z: users(first: -1999) {{ edges {{ node {{ id }} }} }} }}"
+    )
+
+    response = await graphql_client.query(query)
+
+    assert response["errors"][0]["extensions"]["code"] == "QUERY_TOO_COMPLEX"
+
+
+@pytest.mark.asyncio
+async def test_query_cost_is_charged_against_rate_limit(test_client):
+    # 201 points cost five requests: the HTTP request itself plus four more.
+    for _ in range(2):
+        response = await test_client.post(
+            "/graphql", json={"query": f"query {{ {USERS_PAGE} }}"}
+        )
+        assert response.status_code == HTTP_200_OK
+
+    response = await test_client.post(
+        "/graphql", json={"query": "{ __schema { queryType { name } } }"}
+    )
+    assert response.status_code == HTTP_429_TOO_MANY_REQUESTS
@@ -0,0 +1,110 @@
+from types import SimpleNamespace
+
+import pytest
+from litestar import Litestar
+from litestar.datastructures.state import State
+from litestar.testing import RequestFactory
+from strawberry.relay.utils import to_base64
+
+from backend.apps.users.models import UserModel
+from backend.config.base import settings
+from backend.graphql.context import GraphQLContext, Services
+from backend.graphql.schema import schema
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture(autouse=True)
+def _concurrent_root_fields(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "graphql_concurrent_root_fields", True)
+
+
+@pytest.fixture
+async def users(db_session) -> list[UserModel]:
+    users = [
+        UserModel(
+            email=f"isolated{i}@example.com",
+            password_hash="hash",
+            first_name="Isolated",
+            last_name=str(i),
+        )
+        for i in range(2)
+    ]
+    db_session.add_all(users)
+    await db_session.commit()
+    return users
+
+
+@pytest.fixture
+def checked_out(db_sessionmaker):
+    """Sessions handed out by a stand-in `alchemy_config.get_session`."""
+    sessions = []
+
+    def get_session():
+        session = db_sessionmaker()
+        sessions.append(session)
+        return session
+
+    return sessions, get_session
+
+
+def _context(db_session, viewer: UserModel, get_session) -> GraphQLContext:
+    alchemy_config = SimpleNamespace(get_session=get_session)
+    app = Litestar(state=State({"alchemy_config": alchemy_config}))
+    return GraphQLContext(
+        request=RequestFactory(app=app).post("/graphql"),
+        db_session=db_session,
+        services=Services(db_session),
+        user=viewer,
+    )
+
+
+async def test_query_root_fields_get_their_own_sessions(
+    db_session, users, checked_out, sql_statements
+) -> None:
+    sessions, get_session = checked_out
+    query = """
+    query Lookups($a: ID!, $b: ID!) {
+        a: userById(id: $a) { email }
+        b: userById(id: $b) { email }
+        __typename
+    }
+    """
+    sql_statements.clear()
+    result = await schema.execute(
+        query,
+        variable_values={
+            "a": to_base64("UserType", users[0].id),
+            "b": to_base64("UserType", users[1].id),
+        },
+        context_value=_context(db_session, users[0], get_session),
+    )
+
+    assert result.errors is None
+    assert result.data == {
+        "a": {"email": "isolated0@example.com"},
+        "b": {"email": "isolated1@example.com"},
+        "__typename": "Query",
+    }
+    assert len(sessions) == 2
+    assert db_session not in sessions
+    # Loaders are per session, so each root field issues its own SELECT.
+    assert len(sql_statements) == 2
+
+
+async def test_mutation_root_fields_keep_the_request_session(
+    db_session, users, checked_out
+) -> None:
+    sessions, get_session = checked_out
+    mutation = """
+    mutation {
+        updateCurrentUser(userInput: {firstName: "Serial"}) { firstName }
+    }
+    """
+    result = await schema.execute(
+        mutation, context_value=_context(db_session, users[0], get_session)
+    )
+
+    assert result.errors is None
+    assert result.data == {"updateCurrentUser": {"firstName": "Serial"}}
+    assert sessions == []
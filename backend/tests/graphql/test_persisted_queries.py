@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+from backend.config.base import settings
+from backend.graphql.persisted_queries import load_manifest, query_hash
+
+pytestmark = pytest.mark.unit
+
+QUERY = "{ __typename }"
+
+
+def _persisted(sha256_hash: str, query: str | None = None) -> dict[str, object]:
+    payload: dict[str, object] = {
+        "extensions": {"persistedQuery": {"version": 1, "sha256Hash": sha256_hash}}
+    }
+    if query is not None:
+        payload["query"] = query
+    return payload
+
+
+@pytest.fixture
+def manifest(tmp_path, monkeypatch):
+    path = tmp_path / "persisted-documents.json"
+    path.write_text(json.dumps({query_hash(QUERY): QUERY}))
+    monkeypatch.setattr(settings, "graphql_persisted_queries_manifest", path)
+    yield path
+    load_manifest.cache_clear()
+
+
+async def test_unknown_hash_is_reported(test_client) -> None:
+    response = await test_client.post("/graphql", json=_persisted("0" * 64))
+
+    assert response.status_code == 200
+    error = response.json()["errors"][0]
+    assert error["message"] == "PersistedQueryNotFound"
+    assert error["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+
+async def test_registered_query_resolves_by_hash(test_client) -> None:
+    sha256_hash = query_hash(QUERY)
+
+    register = await test_client.post("/graphql", json=_persisted(sha256_hash, QUERY))
+    assert register.json() == {"data": {"__typename": "Query"}}
+
+    response = await test_client.post("/graphql", json=_persisted(sha256_hash))
+    assert response.json() == {"data": {"__typename": "Query"}}
+
+
+async def test_hash_mismatch_is_rejected(test_client) -> None:
+    response = await test_client.post("/graphql", json=_persisted("0" * 64, QUERY))
+
+    error = response.json()["errors"][0]
+    assert error["extensions"]["code"] == "PERSISTED_QUERY_HASH_MISMATCH"
+
+
+async def test_manifest_query_resolves_without_registration(
+    test_client, manifest
+) -> None:
+    response = await test_client.post("/graphql", json=_persisted(query_hash(QUERY)))
+
+    assert response.json() == {"data": {"__typename": "Query"}}
+
+
+async def test_allowlist_rejects_unlisted_documents(
+    test_client, manifest, monkeypatch
+) -> None:
+    monkeypatch.setattr(settings, "graphql_persisted_queries_only", True)
+
+    listed = await test_client.post("/graphql", json={"query": QUERY})
+    assert listed.json() == {"data": {"__typename": "Query"}}
+
+    unlisted = await test_client.post(
+        "/graphql", json={"query": "{ __schema { queryType { name } } }"}
+    )
+    error = unlisted.json()["errors"][0]
+    assert error["extensions"]["code"] == "PERSISTED_QUERY_NOT_ALLOWED"
+
+
+@pytest.fixture
+def one_registration(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "graphql_persisted_queries_max_entries", 1)
+
+
+async def test_registrations_are_bounded(one_registration, test_client) -> None:
+    other = "{ __schema { queryType { name } } }"
+    for query in (QUERY, other):
+        await test_client.post("/graphql", json=_persisted(query_hash(query), query))
+
+    evicted = await test_client.post("/graphql", json=_persisted(query_hash(QUERY)))
+    kept = await test_client.post("/graphql", json=_persisted(query_hash(other)))
+
+    error = evicted.json()["errors"][0]
+    assert error["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+    assert kept.json() == {"data": {"__schema": {"queryType": {"name": "Query"}}}}
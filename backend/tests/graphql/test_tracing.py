@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+from litestar.status_codes import HTTP_401_UNAUTHORIZED
+from litestar.testing import RequestFactory
+from strawberry.relay.utils import to_base64
+
+from backend.apps.users.models import UserModel
+from backend.config.base import settings
+from backend.graphql.context import GraphQLContext, Services
+from backend.graphql.schema import schema
+from backend.metrics import metrics
+
+ME = {"query": "{ me { email } }"}
+
+
+@pytest.fixture(autouse=True)
+def _clear_metrics():
+    metrics.clear()
+
+
+@pytest.mark.unit
+async def test_trace_is_returned_with_debug_header(test_client):
+    response = await test_client.post(
+        "/graphql", json=ME, headers={"X-GraphQL-Trace": "1"}
+    )
+
+    tracing = response.json()["extensions"]["tracing"]
+    assert {"parse", "validate", "execute"} <= tracing["phasesMs"].keys()
+    assert tracing["resolvers"]["Query.me"]["count"] == 1
+    assert "UserType.email" not in tracing["resolvers"]
+    assert tracing["sql"]["statements"] == 0
+
+
+@pytest.mark.unit
+async def test_trace_goes_to_metrics_without_header(test_client, monkeypatch):
+    monkeypatch.setattr(settings, "metrics_token", "scrape")
+    response = await test_client.post("/graphql", json=ME)
+
+    assert "extensions" not in response.json()
+    metrics_response = await test_client.get(
+        "/metrics", headers={"Authorization": "Bearer scrape"}
+    )
+    assert 'graphql_resolver_seconds_count{field="Query.me"} 1' in (
+        metrics_response.text
+    )
+    assert 'graphql_phase_seconds_count{phase="execute"} 1' in metrics_response.text
+
+
+@pytest.mark.unit
+async def test_concurrent_operations_keep_their_own_traces(db_session_mock):
+    def execute(query: str, headers: dict[str, str]):
+        context = GraphQLContext(
+            db_session=db_session_mock,
+            services=Services(db_session_mock),
+            user=UserModel(id=1, email="traced@example.com"),
+            request=RequestFactory().post("/graphql", headers=headers),
+        )
+        return schema.execute(query, context_value=context)
+
+    traced, untraced = await asyncio.gather(
+        execute(ME["query"], {"X-GraphQL-Trace": "1"}),
+        execute("{ me { firstName } }", {}),
+    )
+
+    assert untraced.extensions == {}
+    assert traced.extensions is not None
+    assert traced.extensions["tracing"]["resolvers"]["Query.me"]["count"] == 1
+
+
+@pytest.mark.integration
+async def test_sql_statements_are_counted(db_session):
+    user = UserModel(
+        email="traced@example.com",
+        password_hash="hash",
+        first_name="Traced",
+        last_name="User",
+    )
+    db_session.add(user)
+    await db_session.commit()
+    context = GraphQLContext(db_session=db_session, services=Services(db_session))
+
+    result = await schema.execute(
+        "query ($id: ID!) { node(id: $id) { id } }",
+        variable_values={"id": to_base64("UserType", user.id)},
+        context_value=context,
+    )
+
+    assert result.errors is None
+    assert "graphql_sql_statements_sum 1.0" in metrics.render()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("token", "authorization"),
+    [(None, "Bearer "), ("scrape", None), ("scrape", "Bearer other")],
+    ids=["unset", "missing", "wrong"],
+)
+async def test_metrics_require_the_scrape_token(
+    test_client, monkeypatch, token, authorization
+):
+    monkeypatch.setattr(settings, "metrics_token", token)
+    headers = {"Authorization": authorization} if authorization else {}
+
+    response = await test_client.get("/metrics", headers=headers)
+
+    assert response.status_code == HTTP_401_UNAUTHORIZED
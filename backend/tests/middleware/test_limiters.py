@@ -0,0 +1,112 @@
+import uuid
+from collections.abc import AsyncIterator
+
+import pytest
+from litestar.stores.memory import MemoryStore
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from backend.config.base import settings
+from backend.middleware.limiters import (
+    BatchingRateLimiter,
+    RateLimiter,
+    RedisRateLimiter,
+    StoreRateLimiter,
+)
+from backend.stores.shared import SharedMemoryStore
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(
+    params=[
+        "store",
+        "shared",
+        # The Redis the app already runs for Celery, under a unique key prefix.
+        pytest.param("redis", marks=pytest.mark.integration),
+    ]
+)
+async def limiter(request, tmp_path) -> AsyncIterator[RateLimiter]:
+    if request.param == "store":
+        yield StoreRateLimiter(MemoryStore())
+        return
+    if request.param == "shared":
+        store = SharedMemoryStore(tmp_path / "rate_limit", buckets=4)
+        yield StoreRateLimiter(store)
+        store.close()
+        return
+    redis = Redis.from_url(settings.celery_broker_url)
+    try:
+        await redis.ping()
+    except RedisConnectionError:
+        await redis.aclose()
+        pytest.skip("Redis is not reachable")
+    prefix = f"test:{uuid.uuid4().hex}:"
+    limiter = RedisRateLimiter(redis, prefix=prefix)
+    try:
+        yield limiter
+    finally:
+        keys = [key async for key in redis.scan_iter(match=f"{prefix}*")]
+        if keys:
+            await redis.delete(*keys)
+        await limiter.close()
+
+
+async def test_bursts_up_to_the_limit_are_allowed(limiter) -> None:
+    decisions = [await limiter.acquire("caller", limit=5) for _ in range(6)]
+
+    assert [d.allowed for d in decisions] == [True] * 5 + [False]
+    assert [d.remaining for d in decisions[:5]] == [4, 3, 2, 1, 0]
+    # One unit comes back every period / limit seconds.
+    assert 0 < decisions[-1].retry_after <= 12
+    assert decisions[-1].reset_after == pytest.approx(60, abs=1)
+
+
+async def test_units_are_taken_together(limiter) -> None:
+    assert (await limiter.acquire("caller", limit=5, units=4)).allowed
+    assert not (await limiter.acquire("caller", limit=5, units=2)).allowed
+    assert (await limiter.acquire("caller", limit=5, units=1)).allowed
+    assert (await limiter.acquire("other", limit=5, units=5)).allowed
+
+
+async def test_forced_units_are_charged_over_the_limit(limiter) -> None:
+    assert (await limiter.acquire("caller", limit=2, units=3, force=True)).allowed
+    assert not (await limiter.acquire("caller", limit=2)).allowed
+
+
+class _CountingLimiter(StoreRateLimiter):
+    def __init__(self) -> None:
+        super().__init__(MemoryStore())
+        self.calls: list[tuple[str, int, bool]] = []
+
+    async def acquire(self, key, limit, units=1, *, force=False):
+        self.calls.append((key, units, force))
+        return await super().acquire(key, limit, units, force=force)
+
+
+async def test_batching_admits_hot_keys_locally_and_charges_them_later() -> None:
+    upstream = _CountingLimiter()
+    limiter = BatchingRateLimiter(upstream, interval=3600, share=0.5)
+
+    decisions = [await limiter.acquire("caller", limit=10) for _ in range(5)]
+
+    # The first request leaves 9 units, of which this process may admit 4.
+    assert all(d.allowed for d in decisions)
+    assert upstream.calls == [("caller", 1, False)]
+
+    await limiter.flush()
+    assert upstream.calls[-1] == ("caller", 4, True)
+    assert not (await upstream.acquire("caller", limit=10, units=6)).allowed
+    await limiter.close()
+
+
+async def test_batching_forgets_idle_keys() -> None:
+    upstream = _CountingLimiter()
+    limiter = BatchingRateLimiter(upstream, interval=3600, share=0.5)
+    await limiter.acquire("caller", limit=10)
+
+    await limiter.flush()
+    await limiter.acquire("caller", limit=10)
+
+    assert upstream.calls == [("caller", 1, False), ("caller", 1, False)]
+    await limiter.close()
@@ -1,7 +1,16 @@
 import pytest
+from litestar import Litestar, get
+from litestar.middleware import DefineMiddleware
 from litestar.status_codes import HTTP_200_OK, HTTP_429_TOO_MANY_REQUESTS
+from litestar.testing import AsyncTestClient
 
 from backend.auth.jwt import jwt_auth
+from backend.middleware.rate_limit import (
+    PrefixMatcher,
+    RateLimitMiddleware,
+    RateLimitPolicy,
+    RouteLimit,
+)
 
 pytestmark = pytest.mark.unit
 INTROSPECTION_QUERY = {"query": "{ __schema { queryType { name } } }"}
@@ -46,3 +55,66 @@ async def test_rate_limit_authenticated(test_client):
             headers=headers,
         )
         assert response.status_code == HTTP_200_OK
+
+
+@get(["/ping", "/api/auth/login", "/api/reports/daily"], sync_to_thread=False)
+def _ping() -> str:
+    return "pong"
+
+
+def _app(**routes: RouteLimit) -> Litestar:
+    policy = RateLimitPolicy(
+        anonymous_limit=5,
+        authenticated_limit=50,
+        routes={f"/api/{name}": route for name, route in routes.items()},
+    )
+    return Litestar(
+        route_handlers=[_ping],
+        middleware=[DefineMiddleware(RateLimitMiddleware, policy=policy)],
+    )
+
+
+def test_prefix_matcher_prefers_the_longest_prefix():
+    matcher = PrefixMatcher(["/api", "/api/auth", "/health"])
+
+    assert matcher.match("/api/auth/login") == "/api/auth"
+    assert matcher.match("/api/users") == "/api"
+    assert matcher.match("/healthz") == "/health"
+    assert matcher.match("/graphql") is None
+    assert PrefixMatcher([]).match("/api") is None
+
+
+@pytest.mark.asyncio
+async def test_responses_report_the_remaining_budget():
+    async with AsyncTestClient(app=_app()) as client:
+        response = await client.get("/ping")
+
+    assert response.headers["ratelimit-limit"] == "5"
+    assert response.headers["ratelimit-remaining"] == "4"
+
+
+@pytest.mark.asyncio
+async def test_route_weights_consume_several_requests():
+    async with AsyncTestClient(app=_app(reports=RouteLimit(weight=2))) as client:
+        for _ in range(2):
+            response = await client.get("/api/reports/daily")
+            assert response.status_code == HTTP_200_OK
+
+        response = await client.get("/api/reports/daily")
+        assert response.status_code == HTTP_429_TOO_MANY_REQUESTS
+        response = await client.get("/ping")
+        assert response.status_code == HTTP_200_OK
+
+
+@pytest.mark.asyncio
+async def test_route_limits_use_a_separate_counter():
+    async with AsyncTestClient(app=_app(auth=RouteLimit(limit=2))) as client:
+        for _ in range(2):
+            response = await client.get("/api/auth/login")
+            assert response.status_code == HTTP_200_OK
+
+        response = await client.get("/api/auth/login")
+        assert response.status_code == HTTP_429_TOO_MANY_REQUESTS
+        for _ in range(5):
+            response = await client.get("/ping")
+            assert response.status_code == HTTP_200_OK
@@ -0,0 +1,109 @@
+import resource
+
+import pytest
+from litestar.stores.registry import StoreRegistry
+
+from backend.stores.bounded import BoundedMemoryStore
+
+pytestmark = pytest.mark.unit
+
+
+async def test_values_round_trip() -> None:
+    store = BoundedMemoryStore(max_entries=4)
+
+    await store.set("a", "1")
+    await store.set("b", b"2", expires_in=60)
+
+    assert await store.get("a") == b"1"
+    assert await store.get("b") == b"2"
+    assert await store.exists("a")
+    assert await store.expires_in("a") is None
+    expires_in = await store.expires_in("b")
+    assert expires_in is not None
+    assert 58 <= expires_in <= 60
+    await store.delete("a")
+    assert await store.get("a") is None
+    await store.delete_all()
+    assert len(store) == 0
+
+
+def test_an_empty_store_stays_registered() -> None:
+    store = BoundedMemoryStore(max_entries=4)
+
+    assert StoreRegistry({"bounded": store}).get("bounded") is store
+
+
+async def test_full_store_evicts_unreferenced_entries_first() -> None:
+    store = BoundedMemoryStore(max_entries=3)
+    for key in "abc":
+        await store.set(key, key)
+
+    # One pass clears every reference bit; `b` is then read again.
+    await store.set("d", "d")
+    await store.get("b")
+    await store.set("e", "e")
+
+    assert len(store) == 3
+    assert store.evictions == 2
+    assert await store.get("b") == b"b"
+    assert await store.get("c") is None
+
+
+async def test_expired_entries_are_swept_and_reused(mocker) -> None:
+    clock = mocker.patch("backend.stores.bounded.time.monotonic")
+    clock.return_value = 0.0
+    store = BoundedMemoryStore(max_entries=4, sweep_step=4)
+    for key in "abc":
+        await store.set(key, key, expires_in=10)
+
+    clock.return_value = 20.0
+    await store.set("d", "d")
+
+    assert len(store) == 1
+    assert store.evictions == 0
+    assert await store.get("a") is None
+
+
+async def test_renewing_extends_expiry(mocker) -> None:
+    clock = mocker.patch("backend.stores.bounded.time.monotonic")
+    clock.return_value = 0.0
+    store = BoundedMemoryStore(max_entries=2)
+    await store.set("a", "a", expires_in=10)
+
+    clock.return_value = 5.0
+    assert await store.get("a", renew_for=30) == b"a"
+    clock.return_value = 30.0
+    assert await store.get("a") == b"a"
+
+
+async def test_memory_usage_tracks_contents() -> None:
+    store = BoundedMemoryStore(max_entries=100)
+    empty = store.memory_usage
+
+    for i in range(100):
+        await store.set(f"ip:{i:05d}", "x" * 100)
+    full = store.memory_usage
+    for i in range(100, 10_000):
+        await store.set(f"ip:{i:05d}", "x" * 100)
+
+    assert full > empty + 100 * 100
+    # Only the key index's spare capacity may still grow.
+    assert store.memory_usage < full * 1.5
+
+
+@pytest.mark.slow
+async def test_a_million_identifiers_keep_rss_flat() -> None:
+    store = BoundedMemoryStore(max_entries=10_000)
+
+    async def fill(start: int, stop: int) -> None:
+        for i in range(start, stop):
+            await store.set(f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}", b"1")
+
+    # Warm up until the table is full and has been recycled a few times.
+    await fill(0, 50_000)
+    warm_rss_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    await fill(50_000, 1_050_000)
+    grown_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - warm_rss_kib
+
+    assert len(store) == 10_000
+    assert grown_kib < 8 * 1024
@@ -0,0 +1,130 @@
+import asyncio
+import multiprocessing
+
+import pytest
+
+from backend.stores.shared import SharedMemoryStore
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "store"
+
+
+async def test_values_round_trip(path) -> None:
+    store = SharedMemoryStore(path, buckets=4)
+
+    await store.set("a", "1")
+    await store.set("b", b"2", expires_in=60)
+
+    assert await store.get("a") == b"1"
+    assert await store.get("b") == b"2"
+    assert await store.exists("a")
+    assert await store.expires_in("a") is None
+    expires_in = await store.expires_in("b")
+    assert expires_in is not None
+    assert 58 <= expires_in <= 60
+    await store.delete("a")
+    assert await store.get("a") is None
+    await store.delete_all()
+    assert not await store.exists("b")
+    store.close()
+
+
+async def test_stores_on_one_file_share_entries(path) -> None:
+    writer = SharedMemoryStore(path, buckets=4)
+    reader = SharedMemoryStore(path, buckets=4)
+
+    await writer.set("a", "1")
+
+    assert await reader.get("a") == b"1"
+    writer.close()
+    reader.close()
+
+
+async def test_opening_with_another_layout_resets_the_file(path) -> None:
+    store = SharedMemoryStore(path, buckets=4)
+    await store.set("a", "1")
+    store.close()
+
+    store = SharedMemoryStore(path, buckets=8)
+
+    assert await store.get("a") is None
+    store.close()
+
+
+async def test_full_bucket_evicts_least_recently_used_entry(path, mocker) -> None:
+    clock = mocker.patch("backend.stores.shared.time.time")
+    store = SharedMemoryStore(path, buckets=1, bucket_slots=2)
+    clock.return_value = 1.0
+    await store.set("a", "a")
+    clock.return_value = 2.0
+    await store.set("b", "b")
+    clock.return_value = 3.0
+    await store.get("a")
+
+    clock.return_value = 4.0
+    await store.set("c", "c")
+
+    assert await store.get("a") == b"a"
+    assert await store.get("b") is None
+    assert await store.get("c") == b"c"
+    store.close()
+
+
+async def test_expired_entries_are_gone_and_renewable(path, mocker) -> None:
+    clock = mocker.patch("backend.stores.shared.time.time")
+    clock.return_value = 100.0
+    store = SharedMemoryStore(path, buckets=1)
+    await store.set("a", "a", expires_in=10)
+    await store.set("b", "b", expires_in=10)
+
+    clock.return_value = 105.0
+    assert await store.get("a", renew_for=30) == b"a"
+    clock.return_value = 120.0
+
+    assert await store.get("a") == b"a"
+    assert await store.get("b") is None
+    store.close()
+
+
+async def test_oversized_values_are_not_stored(path) -> None:
+    store = SharedMemoryStore(path, buckets=1, max_value_size=4)
+    await store.set("a", "1")
+
+    await store.set("a", "too long")
+
+    assert await store.get("a") is None
+    assert store.rejected == 1
+    store.close()
+
+
+def _increment(raw: bytes | None) -> tuple[None, bytes, None]:
+    return None, str(int(raw or 0) + 1).encode(), None
+
+
+def _count(path, times: int) -> None:
+    async def run() -> None:
+        store = SharedMemoryStore(path, buckets=4)
+        for _ in range(times):
+            await store.update("counter", _increment)
+        store.close()
+
+    asyncio.run(run())
+
+
+async def test_updates_are_atomic_across_processes(path) -> None:
+    SharedMemoryStore(path, buckets=4).close()
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_count, args=(path, 500)) for _ in range(4)]
+
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    store = SharedMemoryStore(path, buckets=4)
+    assert await store.get("counter") == b"2000"
+    store.close()